@@ -2,11 +2,18 @@
 AI Interview Assistant Backend Package
 """
 
-from .main import app
-from .interview_manager import InterviewManager
-from .resume_parser import extract_resume_data
-from .face_analyzer import analyze_face
-from .interview_evaluator import evaluate_response
+import importlib
+
+# Public names and the submodules that define them. They are resolved on
+# first access so that importing the package (or any one submodule) does
+# not pull in the app, OpenCV, MediaPipe, librosa and the Groq client.
+_LAZY_EXPORTS = {
+    'app': '.main',
+    'InterviewManager': '.interview_manager',
+    'extract_resume_data': '.resume_parser',
+    'analyze_face': '.face_analyzer',
+    'evaluate_response': '.interview_evaluator'
+}
 
 __all__ = [
     'app',
@@ -14,4 +21,13 @@ __all__ = [
     'extract_resume_data',
     'analyze_face',
     'evaluate_response'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,111 @@
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AnalyzerPoolTimeout(RuntimeError):
+    """
+    Raised when no pooled analyzer becomes free within the checkout timeout.
+    """
+
+
+class AnalyzerPool(Generic[T]):
+    """
+    Fixed-size pool of preloaded analyzers shared by all sessions.
+
+    Analyzers hold heavyweight models (e.g. a MediaPipe FaceMesh) that are
+    not safe to use from two threads at once. The pool caps how many exist,
+    builds them up front in ``warmup`` (or lazily on first checkout), and
+    hands each one to a single borrower at a time.
+    """
+
+    def __init__(self, factory: Callable[[], T], size: int, checkout_timeout: Optional[float] = None):
+        self.factory = factory
+        self.size = max(1, size)
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: "queue.Queue[T]" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+
+    def warmup(self):
+        """
+        Build every analyzer now so sessions never pay model construction.
+        """
+        started = time.perf_counter()
+        while True:
+            analyzer = self._create()
+            if analyzer is None:
+                break
+            self._idle.put(analyzer)
+        logger.info(
+            f"Warmed {self._created} {getattr(self.factory, '__name__', 'analyzer')} "
+            f"instances in {time.perf_counter() - started:.2f}s"
+        )
+
+    def checkout(self, timeout: Optional[float] = None) -> T:
+        """
+        Borrow an analyzer, blocking until one is free.
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        analyzer = self._create()
+        if analyzer is not None:
+            return analyzer
+
+        started = time.perf_counter()
+        try:
+            analyzer = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise AnalyzerPoolTimeout(f"No analyzer free after {timeout}s")
+        self.wait_seconds += time.perf_counter() - started
+        return analyzer
+
+    def checkin(self, analyzer: T):
+        self._idle.put(analyzer)
+
+    @contextmanager
+    def borrow(self, timeout: Optional[float] = None) -> Iterator[T]:
+        analyzer = self.checkout(timeout)
+        self.checkouts += 1
+        try:
+            yield analyzer
+        finally:
+            self.checkin(analyzer)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "created": self._created,
+            "idle": self._idle.qsize(),
+            "checkouts": self.checkouts,
+            "wait_seconds": round(self.wait_seconds, 3)
+        }
+
+    def _create(self) -> Optional[T]:
+        """
+        Build a new analyzer if the pool is below its size, else None.
+        """
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+        try:
+            return self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
@@ -0,0 +1,150 @@
+import logging
+import subprocess
+import threading
+from typing import Optional, Union
+
+import numpy as np
+
+from .config import (
+    FFMPEG_BINARY,
+    AUDIO_DECODE_SAMPLE_RATE,
+    AUDIO_DECODE_BLOCK_BYTES,
+    AUDIO_DECODE_INITIAL_SECONDS,
+    AUDIO_DECODE_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+# ffmpeg writes f32le: little-endian float32 samples
+SAMPLE_DTYPE = np.dtype("<f4")
+# Only the end of ffmpeg's diagnostics is kept for error messages
+STDERR_TAIL_BYTES = 64 * 1024
+
+
+class AudioDecodeError(RuntimeError):
+    """
+    Raised when ffmpeg cannot decode the audio track of a clip.
+    """
+
+
+def _ffmpeg_command(binary: str, source: str, sample_rate: int):
+    return [
+        binary, "-nostdin", "-hide_banner", "-loglevel", "error",
+        "-i", source,
+        "-vn", "-ac", "1", "-ar", str(sample_rate),
+        "-f", "f32le", "pipe:1"
+    ]
+
+
+def _write_stdin(stdin, data: bytes, block_bytes: int):
+    # Fed from its own thread so ffmpeg never blocks on a full stdout pipe
+    # while we are still writing its input
+    view = memoryview(data)
+    try:
+        for start in range(0, len(view), block_bytes):
+            stdin.write(view[start:start + block_bytes])
+    except (BrokenPipeError, ValueError):
+        # ffmpeg exited early; its exit status reports why
+        pass
+    finally:
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+
+def _drain_stderr(stderr, tail: bytearray):
+    # Read on its own thread so a chatty ffmpeg never blocks on a full
+    # stderr pipe while we are still reading stdout
+    while True:
+        chunk = stderr.read1(STDERR_TAIL_BYTES)
+        if not chunk:
+            break
+        tail.extend(chunk)
+        del tail[:-STDERR_TAIL_BYTES]
+
+
+def decode_audio(
+    source: Union[bytes, str],
+    sample_rate: int = AUDIO_DECODE_SAMPLE_RATE,
+    binary: str = FFMPEG_BINARY,
+    block_bytes: int = AUDIO_DECODE_BLOCK_BYTES,
+    initial_seconds: float = AUDIO_DECODE_INITIAL_SECONDS,
+    timeout: Optional[float] = AUDIO_DECODE_TIMEOUT
+) -> np.ndarray:
+    """
+    Decode the audio track of a media file (path) or in-memory clip (bytes)
+    into mono float32 samples at ``sample_rate``.
+
+    ffmpeg decodes, downmixes and resamples in one pass and streams raw
+    float32 PCM over a pipe, read in blocks straight into a preallocated
+    numpy buffer that only grows (by doubling) for unusually long clips.
+    No intermediate WAV, Python sample array or second resample is made.
+    """
+    from_memory = isinstance(source, (bytes, bytearray, memoryview))
+    command = _ffmpeg_command(binary, "pipe:0" if from_memory else source, sample_rate)
+    if from_memory:
+        command.remove("-nostdin")
+
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE if from_memory else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+    except FileNotFoundError:
+        raise AudioDecodeError(f"ffmpeg not found: {binary}")
+
+    writer = None
+    if from_memory:
+        writer = threading.Thread(target=_write_stdin, args=(process.stdin, source, block_bytes), daemon=True)
+        writer.start()
+    stderr = bytearray()
+    reader = threading.Thread(target=_drain_stderr, args=(process.stderr, stderr), daemon=True)
+    reader.start()
+    timed_out = threading.Event()
+    timer = None
+    if timeout:
+        def kill():
+            timed_out.set()
+            process.kill()
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+
+    buffer = np.empty(max(1, int(sample_rate * initial_seconds)), dtype=SAMPLE_DTYPE)
+    filled = 0
+    try:
+        while True:
+            if filled == buffer.nbytes:
+                grown = np.empty(buffer.size * 2, dtype=SAMPLE_DTYPE)
+                grown[:buffer.size] = buffer
+                buffer = grown
+            view = memoryview(buffer).cast("B")
+            read = process.stdout.readinto(view[filled:filled + block_bytes])
+            view.release()
+            if not read:
+                break
+            filled += read
+        returncode = process.wait()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        if writer is not None:
+            writer.join()
+        reader.join()
+        process.stdout.close()
+        process.stderr.close()
+
+    if timed_out.is_set():
+        raise AudioDecodeError(f"ffmpeg did not finish decoding within {timeout} s")
+    if returncode != 0:
+        message = bytes(stderr).decode(errors="replace").strip() or f"exit status {returncode}"
+        raise AudioDecodeError(f"ffmpeg failed to decode audio: {message}")
+
+    # Shrink in place rather than copy out the decoded samples
+    buffer.resize(filled // SAMPLE_DTYPE.itemsize, refcheck=False)
+    return buffer
@@ -0,0 +1,208 @@
+import asyncio
+import logging
+import multiprocessing as mp
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .config import AUDIO_WORKER_PROCESSES, AUDIO_JOB_DEADLINE_SECONDS, AUDIO_JOB_GRACE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Per-process analyzer, built by the pool initializer
+_analyzer = None
+
+
+def _warm_worker():
+    """
+    Audio worker initializer: import librosa and run one small analysis so
+    its numba kernels are compiled before the first real job arrives.
+    """
+    global _analyzer
+    from .voice_analyzer import VoiceAnalyzer
+
+    _analyzer = VoiceAnalyzer()
+    try:
+        t = np.arange(_analyzer.sample_rate) / _analyzer.sample_rate
+        _analyzer.analyze_samples((0.2 * np.sin(2 * np.pi * 150 * t)).astype(np.float32))
+    except Exception as e:
+        logger.warning(f"Audio worker warmup failed: {str(e)}")
+
+
+def _analyze_job(video_data: bytes, tier: str, deadline: float) -> Tuple[Dict[str, Any], float]:
+    """
+    Run one voice analysis in a worker. Returns the metrics and the seconds
+    of audio analyzed.
+    """
+    global _analyzer
+    if _analyzer is None:
+        from .voice_analyzer import VoiceAnalyzer
+        _analyzer = VoiceAnalyzer()
+    return _analyzer.analyze_clip(video_data, tier, deadline)
+
+
+class AudioWorkerPool:
+    """
+    Process pool for voice analysis.
+
+    librosa holds the GIL for most of an analysis, so running it on threads
+    still stalls the event loop and every live session on this server;
+    worker processes keep it off entirely. Workers import librosa and
+    compile its kernels when they start.
+
+    Every job gets a deadline. Workers check it between analysis stages and
+    return what they have so far, marked ``partial``; jobs still queued
+    when it passes are skipped, and if a worker has not answered
+    ``grace_seconds`` after it the caller stops waiting and gets None.
+    """
+
+    def __init__(
+        self,
+        processes: int = AUDIO_WORKER_PROCESSES,
+        deadline_seconds: float = AUDIO_JOB_DEADLINE_SECONDS,
+        grace_seconds: float = AUDIO_JOB_GRACE_SECONDS
+    ):
+        self.processes = max(1, processes)
+        self.deadline_seconds = deadline_seconds
+        self.grace_seconds = grace_seconds
+
+        self._ctx = mp.get_context("spawn")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._busy_seconds = 0.0
+        self._last_change = time.monotonic()
+        self._started_at = self._last_change
+
+        self.completed = 0
+        self.partial = 0
+        self.timed_out = 0
+        self.failed = 0
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self):
+        if self.started:
+            return
+        self._executor = self._new_executor()
+        with self._lock:
+            self._started_at = self._last_change = time.monotonic()
+            self._busy_seconds = 0.0
+        logger.info(f"Started audio worker pool with {self.processes} processes")
+
+    def stop(self):
+        if not self.started:
+            return
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    async def analyze(
+        self,
+        video_data: bytes,
+        tier: str = "full",
+        deadline_seconds: Optional[float] = None
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Analyze a clip's voice in a worker process. Returns the metrics and
+        seconds of audio analyzed, or None if the job failed or overran its
+        deadline by more than the grace period.
+
+        Without a started pool the job runs on the default thread executor,
+        still off the event loop, with the same deadline.
+        """
+        deadline_seconds = self.deadline_seconds if deadline_seconds is None else deadline_seconds
+        deadline = time.time() + deadline_seconds
+        loop = asyncio.get_running_loop()
+
+        executor = self._executor
+        try:
+            if executor is not None:
+                future: Future = executor.submit(_analyze_job, video_data, tier, deadline)
+                waiter = asyncio.wrap_future(future)
+            else:
+                future = waiter = loop.run_in_executor(None, _analyze_job, video_data, tier, deadline)
+            self._track(future)
+            # Cancelling the waiter on timeout also drops a job that never started
+            metrics, seconds = await asyncio.wait_for(waiter, deadline_seconds + self.grace_seconds)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            logger.warning(f"Voice analysis missed its {deadline_seconds:.0f}s deadline")
+            return None
+        except BrokenProcessPool as e:
+            self.failed += 1
+            logger.error(f"Audio worker pool broke, restarting: {str(e)}")
+            self._restart(executor)
+            return None
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Error in audio worker: {str(e)}")
+            return None
+
+        self.completed += 1
+        if metrics.get("partial"):
+            self.partial += 1
+        return metrics, seconds
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._accumulate(time.monotonic())
+            in_flight = self._in_flight
+            elapsed = self._last_change - self._started_at
+            busy_seconds = self._busy_seconds
+        busy = min(in_flight, self.processes)
+        return {
+            "processes": self.processes if self.started else 0,
+            "in_flight": in_flight,
+            "queue_depth": in_flight - busy,
+            "busy_workers": busy,
+            "utilization": round(busy_seconds / (elapsed * self.processes), 3) if elapsed > 0 else 0.0,
+            "completed": self.completed,
+            "partial": self.partial,
+            "timed_out": self.timed_out,
+            "failed": self.failed
+        }
+
+    def _track(self, future):
+        # Jobs count as in flight until the worker really finishes them, even
+        # after their caller has given up waiting
+        with self._lock:
+            self._accumulate(time.monotonic())
+            self._in_flight += 1
+        future.add_done_callback(self._finished)
+
+    def _finished(self, future):
+        with self._lock:
+            self._accumulate(time.monotonic())
+            self._in_flight -= 1
+
+    def _accumulate(self, now: float):
+        # Integrate busy workers over time for the utilization figure
+        self._busy_seconds += min(self._in_flight, self.processes) * (now - self._last_change)
+        self._last_change = now
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=self._ctx,
+            initializer=_warm_worker
+        )
+
+    def _restart(self, broken: ProcessPoolExecutor):
+        # Every job on a broken pool fails with BrokenProcessPool; only the
+        # first caller replaces it, and never a pool already replaced
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = self._new_executor()
+        broken.shutdown(wait=False)
+        logger.info(f"Restarted audio worker pool with {self.processes} processes")
+
+
+# Started at application startup
+audio_worker_pool = AudioWorkerPool()
@@ -2,23 +2,25 @@ import logging
 from typing import Dict, Any
 from datetime import datetime
 
+from .face_analyzer import analyze_face
+
 logger = logging.getLogger(__name__)
 
 def analyze_body(video_path: str) -> Dict[str, Any]:
     """
-    Mock implementation of body analysis.
-    In a production environment, this would be replaced with actual body analysis logic.
+    Analyze upper-body posture in a recorded video.
+
+    Posture comes from the same single MediaPipe Holistic pass that produces
+    the face metrics; callers that also need face metrics should call
+    ``analyze_face(video, with_body=True)`` once and read its ``body`` entry.
     """
     try:
-        return {
-            "pose_detection_rate": 98.5,
-            "good_posture_rate": 88.7,
-            "average_posture_score": 92.5,
-            "total_frames_analyzed": 300,
+        body = analyze_face(video_path, with_body=True)["body"]
+        body.update({
             "timestamp": datetime.now().isoformat(),
-            "video_path": video_path,
-            "analysis_method": "mock"
-        }
+            "video_path": video_path
+        })
+        return body
     except Exception as e:
         logger.error(f"Error in body analysis: {str(e)}")
         raise
@@ -1 +1,120 @@
+import os
+
 QORQ_API_KEY = "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"
+
+# Live video analysis
+LIVE_ANALYSIS_WORKERS = int(os.getenv("LIVE_ANALYSIS_WORKERS", min(8, os.cpu_count() or 4)))
+LIVE_OUTBOUND_QUEUE_SIZE = int(os.getenv("LIVE_OUTBOUND_QUEUE_SIZE", 32))
+LIVE_SEND_TIMEOUT = float(os.getenv("LIVE_SEND_TIMEOUT", 5))
+LIVE_FRAME_WIDTH = int(os.getenv("LIVE_FRAME_WIDTH", 320))
+LIVE_FRAME_HEIGHT = int(os.getenv("LIVE_FRAME_HEIGHT", 240))
+LIVE_JPEG_QUALITY = float(os.getenv("LIVE_JPEG_QUALITY", 0.6))
+INFERENCE_MAX_BATCH = int(os.getenv("INFERENCE_MAX_BATCH", 16))
+INFERENCE_MAX_WAIT_MS = float(os.getenv("INFERENCE_MAX_WAIT_MS", 4))
+
+# Adaptive frame-rate pacing of live video clients
+PACING_MAX_FPS = float(os.getenv("PACING_MAX_FPS", 15))
+PACING_MIN_FPS = float(os.getenv("PACING_MIN_FPS", 2))
+PACING_TARGET_UTILIZATION = float(os.getenv("PACING_TARGET_UTILIZATION", 0.75))
+PACING_INTERVAL_SECONDS = float(os.getenv("PACING_INTERVAL_SECONDS", 2.0))
+
+# Detect-then-track face localisation on live frames
+FACE_TRACKING_ENABLED = os.getenv("FACE_TRACKING_ENABLED", "true").lower() == "true"
+FACE_REDETECT_INTERVAL = int(os.getenv("FACE_REDETECT_INTERVAL", 15))
+FACE_TRACK_MIN_CONFIDENCE = float(os.getenv("FACE_TRACK_MIN_CONFIDENCE", 0.6))
+FACE_TRACK_PADDING = float(os.getenv("FACE_TRACK_PADDING", 0.5))
+
+# Process-based vision workers ("thread" keeps analysis in this process)
+VISION_WORKER_MODE = os.getenv("VISION_WORKER_MODE", "thread").lower()
+VISION_WORKER_PROCESSES = int(os.getenv("VISION_WORKER_PROCESSES", os.cpu_count() or 4))
+VISION_RING_SLOTS = int(os.getenv("VISION_RING_SLOTS", 4))
+VISION_SLOT_BYTES = int(os.getenv("VISION_SLOT_BYTES", 640 * 480))
+VISION_RESULT_TIMEOUT = float(os.getenv("VISION_RESULT_TIMEOUT", 2))
+VISION_LIVENESS_INTERVAL = float(os.getenv("VISION_LIVENESS_INTERVAL", 1))
+
+# Rolling live metrics per session
+LIVE_METRICS_WINDOW = int(os.getenv("LIVE_METRICS_WINDOW", 300))
+LIVE_METRICS_EWMA_ALPHA = float(os.getenv("LIVE_METRICS_EWMA_ALPHA", 0.1))
+
+# Coalesced live metrics pushes
+METRICS_PUSH_HZ = float(os.getenv("METRICS_PUSH_HZ", 4))
+METRICS_PUSH_THRESHOLD = float(os.getenv("METRICS_PUSH_THRESHOLD", 0.02))
+
+# Recorded clip analysis (0 stride samples by CLIP_SAMPLE_INTERVAL seconds)
+CLIP_SAMPLE_STRIDE = int(os.getenv("CLIP_SAMPLE_STRIDE", 0))
+CLIP_SAMPLE_INTERVAL = float(os.getenv("CLIP_SAMPLE_INTERVAL", 0.2))
+CLIP_LANDMARK_CHUNK = int(os.getenv("CLIP_LANDMARK_CHUNK", 256))
+
+# Pooled FaceMesh analyzers shared by all sessions
+FACE_ANALYZER_POOL_SIZE = int(os.getenv("FACE_ANALYZER_POOL_SIZE", 4))
+FACE_ANALYZER_CHECKOUT_TIMEOUT = float(os.getenv("FACE_ANALYZER_CHECKOUT_TIMEOUT", 30))
+
+# Motion-gated frame skipping: static frames reuse the last analysis result
+MOTION_GATE_ENABLED = os.getenv("MOTION_GATE_ENABLED", "true").lower() == "true"
+MOTION_THRESHOLD = float(os.getenv("MOTION_THRESHOLD", 2.0))
+MOTION_THUMBNAIL_WIDTH = int(os.getenv("MOTION_THUMBNAIL_WIDTH", 32))
+MOTION_MAX_CARRY = int(os.getenv("MOTION_MAX_CARRY", 30))
+
+# Pluggable face detector backends: "auto" benchmarks them at startup
+FACE_DETECTOR = os.getenv("FACE_DETECTOR", "auto")
+FACE_DETECTOR_TIER = int(os.getenv("FACE_DETECTOR_TIER", 1))
+FACE_DETECTOR_CONFIDENCE = float(os.getenv("FACE_DETECTOR_CONFIDENCE", 0.5))
+FACE_MODELS_DIR = os.getenv("FACE_MODELS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "models"))
+# Face images (a file or directory) the auto benchmark times detectors on
+FACE_BENCHMARK_IMAGES = os.getenv("FACE_BENCHMARK_IMAGES", os.path.join(FACE_MODELS_DIR, "benchmark"))
+
+# Load-adaptive analysis quality tiers
+QUALITY_TIERS_ENABLED = os.getenv("QUALITY_TIERS_ENABLED", "true").lower() == "true"
+QUALITY_RECOVER_RATIO = float(os.getenv("QUALITY_RECOVER_RATIO", 0.5))
+QUALITY_MIN_DWELL_SECONDS = float(os.getenv("QUALITY_MIN_DWELL_SECONDS", 10))
+QUALITY_LATENCY_WINDOW = int(os.getenv("QUALITY_LATENCY_WINDOW", 50))
+QUALITY_VISION_MAX_P95_MS = float(os.getenv("QUALITY_VISION_MAX_P95_MS", 40))
+QUALITY_LIVE_MAX_P95_MS = float(os.getenv("QUALITY_LIVE_MAX_P95_MS", 50))
+QUALITY_AUDIO_MAX_P95_MS = float(os.getenv("QUALITY_AUDIO_MAX_P95_MS", 250))
+QUALITY_SAMPLED_STRIDE = int(os.getenv("QUALITY_SAMPLED_STRIDE", 3))
+
+# Import-time budget for the app; heavy libraries load lazily or at warmup
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", 1000))
+PRELOAD_ON_STARTUP = os.getenv("PRELOAD_ON_STARTUP", "true").lower() == "true"
+
+# Streaming voice analysis of live audio chunks
+AUDIO_SAMPLE_RATE = int(os.getenv("AUDIO_SAMPLE_RATE", 16000))
+AUDIO_FRAME_MS = float(os.getenv("AUDIO_FRAME_MS", 32))
+AUDIO_WINDOW_SECONDS = float(os.getenv("AUDIO_WINDOW_SECONDS", 10))
+AUDIO_SILENCE_RMS = float(os.getenv("AUDIO_SILENCE_RMS", 0.01))
+AUDIO_ONSET_RATIO = float(os.getenv("AUDIO_ONSET_RATIO", 1.5))
+
+# Pitch estimator of the voice analyzers: piptrack, yin or autocorrelation
+PITCH_ESTIMATOR = os.getenv("PITCH_ESTIMATOR", "piptrack").lower()
+
+# Decoding uploaded answer audio through an ffmpeg pipe
+FFMPEG_BINARY = os.getenv("FFMPEG_BINARY", "ffmpeg")
+AUDIO_DECODE_SAMPLE_RATE = int(os.getenv("AUDIO_DECODE_SAMPLE_RATE", 16000))
+AUDIO_DECODE_BLOCK_BYTES = int(os.getenv("AUDIO_DECODE_BLOCK_BYTES", 65536))
+AUDIO_DECODE_INITIAL_SECONDS = float(os.getenv("AUDIO_DECODE_INITIAL_SECONDS", 120))
+AUDIO_DECODE_TIMEOUT = float(os.getenv("AUDIO_DECODE_TIMEOUT", 60))
+
+# Voice activity detection ahead of voice feature extraction
+VAD_ENABLED = os.getenv("VAD_ENABLED", "true").lower() == "true"
+VAD_FRAME_MS = float(os.getenv("VAD_FRAME_MS", 30))
+VAD_ENERGY_RATIO = float(os.getenv("VAD_ENERGY_RATIO", 3.0))
+VAD_MIN_RMS = float(os.getenv("VAD_MIN_RMS", 0.005))
+VAD_MAX_ZCR = float(os.getenv("VAD_MAX_ZCR", 0.35))
+VAD_MIN_SPEECH_MS = float(os.getenv("VAD_MIN_SPEECH_MS", 100))
+VAD_MIN_PAUSE_MS = float(os.getenv("VAD_MIN_PAUSE_MS", 300))
+VAD_PADDING_MS = float(os.getenv("VAD_PADDING_MS", 50))
+
+# Voice analysis worker processes (0 runs it on the default thread executor)
+AUDIO_WORKER_PROCESSES = int(os.getenv("AUDIO_WORKER_PROCESSES", max(1, (os.cpu_count() or 2) // 2)))
+AUDIO_JOB_DEADLINE_SECONDS = float(os.getenv("AUDIO_JOB_DEADLINE_SECONDS", 30))
+AUDIO_JOB_GRACE_SECONDS = float(os.getenv("AUDIO_JOB_GRACE_SECONDS", 5))
+
+# Async Groq client shared by all sessions
+GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", 8))
+GROQ_TIMEOUT_SECONDS = float(os.getenv("GROQ_TIMEOUT_SECONDS", 30))
+GROQ_CONNECT_TIMEOUT_SECONDS = float(os.getenv("GROQ_CONNECT_TIMEOUT_SECONDS", 5))
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", 2))
+GROQ_MAX_CONNECTIONS = int(os.getenv("GROQ_MAX_CONNECTIONS", 16))
+GROQ_KEEPALIVE_CONNECTIONS = int(os.getenv("GROQ_KEEPALIVE_CONNECTIONS", 8))
+GROQ_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("GROQ_KEEPALIVE_EXPIRY_SECONDS", 30))
@@ -1,30 +1,74 @@
 import logging
-import cv2
 import numpy as np
 import io
-import mediapipe as mp
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
+import asyncio
 import tempfile
+import time
 import os
+from .config import (
+    CLIP_SAMPLE_STRIDE,
+    CLIP_SAMPLE_INTERVAL,
+    CLIP_LANDMARK_CHUNK,
+    FACE_ANALYZER_POOL_SIZE,
+    FACE_ANALYZER_CHECKOUT_TIMEOUT,
+    QUALITY_SAMPLED_STRIDE
+)
+from .analyzer_pool import AnalyzerPool
+from .landmark_geometry import NUM_LANDMARKS, landmarks_to_array, score_landmarks
+from .posture_geometry import (
+    NUM_POSE_LANDMARKS,
+    GOOD_POSTURE_THRESHOLD,
+    pose_landmarks_to_array,
+    posture_scores
+)
+from .lazy_imports import lazy_import
+from .motion_gate import MotionGate
+from .face_detectors import HaarFaceDetector
+from .face_tracking import FaceTracker, analyze_gray_frame
+from .quality_tiers import VISION_TIERS, vision_governor
+
+cv2 = lazy_import("cv2")
+mp = lazy_import("mediapipe")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class FaceAnalyzer:
+    """
+    Face and posture analysis of images and recorded clips.
+
+    An analyzer holds at most one MediaPipe model at a time: FaceMesh with
+    or without iris refinement, or Holistic (face mesh and pose in one pass)
+    for clips analyzed with posture. Asking for a different one closes the
+    current model first, so a pool of N analyzers never holds more than N
+    models. The Haar cascade used by the cheapest tiers is tiny and kept.
+    """
+
     def __init__(self):
-        # Initialize MediaPipe Face Mesh
-        self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        # The full-precision FaceMesh, which images and clips start with
+        self._model: Any = None
+        self._model_key: Optional[Tuple[str, bool]] = None
+        self._haar_detector: Optional[HaarFaceDetector] = None
+        self._model_for("mesh_refined", with_body=False)
         
     async def analyze(self, video_data: bytes) -> Dict[str, float]:
         """
-        Analyze face metrics from video data.
+        Analyze face metrics from video data off the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze_bytes, video_data)
+    
+    def analyze_bytes(
+        self,
+        video_data: bytes,
+        tier: str = VISION_TIERS[0],
+        with_body: bool = False
+    ) -> Dict[str, float]:
+        """
+        Analyze face metrics from a single image or a whole video clip.
+        Posture (``with_body``) is only analyzed for clips.
         """
         try:
             # Convert video data to numpy array
@@ -32,26 +76,27 @@ class FaceAnalyzer:
             frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
             
             if frame is None:
-                logger.error("Failed to decode video frame")
-                return self._get_default_metrics()
+                # Not a single image; analyze it as a video clip
+                return self.analyze_clip(video_data, tier=tier, with_body=with_body)
             
             # Convert BGR to RGB
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             
             # Process the frame
-            results = self.face_mesh.process(frame_rgb)
+            results = self._model_for("mesh_refined", with_body=False).process(frame_rgb)
             
             if not results.multi_face_landmarks:
                 logger.warning("No face detected in frame")
                 return self._get_default_metrics()
             
-            # Get face landmarks
-            face_landmarks = results.multi_face_landmarks[0]
+            # Get face landmarks as a (1, 468, 3) stack
+            landmarks = landmarks_to_array(results.multi_face_landmarks[0])[np.newaxis]
             
             # Calculate metrics
-            eye_contact_rate = self._calculate_eye_contact(face_landmarks)
+            scores = score_landmarks(landmarks)
+            eye_contact_rate = float(scores["eye_contact"][0])
             face_detection_rate = 1.0  # Face was detected
-            head_position_score = self._calculate_head_position(face_landmarks)
+            head_position_score = float(scores["head_position"][0])
             
             return {
                 "eye_contact_rate": eye_contact_rate,
@@ -63,80 +108,292 @@ class FaceAnalyzer:
             logger.error(f"Error analyzing face: {str(e)}")
             return self._get_default_metrics()
     
-    def _calculate_eye_contact(self, face_landmarks) -> float:
+    def analyze_clip(
+        self,
+        video: Union[bytes, str],
+        stride: int = CLIP_SAMPLE_STRIDE,
+        interval: float = CLIP_SAMPLE_INTERVAL,
+        tier: str = VISION_TIERS[0],
+        with_body: bool = False
+    ) -> Dict[str, Any]:
         """
-        Calculate eye contact rate based on face landmarks.
+        Analyze face metrics over a whole video clip.
+
+        The clip is decoded as a stream and sampled every ``stride`` frames,
+        or every ``interval`` seconds when no stride is given. Skipped frames
+        are only grabbed, never retrieved, and at most one decoded frame is
+        held in memory at a time. Sampled frames that barely differ from the
+        last analyzed one skip FaceMesh and carry its landmarks forward.
+        Landmarks are buffered into a fixed (chunk, 468, 3) array and scored
+        with vectorized geometry per chunk.
+
+        ``tier`` trades precision for speed under load: ``mesh_refined`` and
+        ``mesh`` run FaceMesh with and without iris refinement, ``haar``
+        scores Haar face boxes like the live path, and ``haar_sampled`` does
+        so on fewer frames. The Haar tiers cannot measure eye contact and
+        report ``eye_contact_rate`` as None.
+
+        With ``with_body`` the FaceMesh tiers run MediaPipe Holistic
+        instead, so face landmarks and upper-body pose come from the same
+        decoded frame, RGB conversion and model pass; posture metrics are
+        returned under ``body``. The Haar tiers skip posture.
         """
+        temp_path = None
+        capture = None
         try:
-            # Get eye landmarks
-            left_eye = face_landmarks.landmark[33:46]  # Left eye landmarks
-            right_eye = face_landmarks.landmark[246:259]  # Right eye landmarks
-            
-            # Calculate eye openness
-            left_eye_openness = self._calculate_eye_openness(left_eye)
-            right_eye_openness = self._calculate_eye_openness(right_eye)
-            
-            # Average eye openness
-            eye_openness = (left_eye_openness + right_eye_openness) / 2
-            
-            # Normalize to 0-1 range
-            return min(max(eye_openness, 0.0), 1.0)
-            
+            if isinstance(video, (bytes, bytearray)):
+                # OpenCV can only demux containers from a file, so spool to disk
+                with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as temp_file:
+                    temp_file.write(video)
+                    temp_path = temp_file.name
+                path = temp_path
+            else:
+                path = video
+
+            capture = cv2.VideoCapture(path)
+            if not capture.isOpened():
+                logger.error("Failed to open video clip")
+                return self._get_default_clip_metrics(with_body)
+
+            fps = capture.get(cv2.CAP_PROP_FPS)
+            # Browser recordings often report 0 or 1000 fps; assume 30
+            if not fps or fps <= 0 or fps > 240:
+                fps = 30.0
+            if stride <= 0:
+                stride = max(1, int(round(fps * interval)))
+            if tier == "haar_sampled":
+                stride *= QUALITY_SAMPLED_STRIDE
+            face_mesh = self._model_for(tier, with_body)
+            holistic = face_mesh if with_body else None
+            tracker = FaceTracker()
+
+            started = time.perf_counter()
+            total_frames = 0
+            frame_count = 0
+            detected_frames = 0
+            landmark_chunk = np.empty((CLIP_LANDMARK_CHUNK, NUM_LANDMARKS, 3), dtype=np.float32)
+            chunk_size = 0
+            totals: Dict[str, float] = {}
+            gate = MotionGate()
+            last_landmarks: Optional[np.ndarray] = None
+            last_face: Optional[Dict[str, Any]] = None
+            pose_chunk = np.empty((CLIP_LANDMARK_CHUNK, NUM_POSE_LANDMARKS, 4), dtype=np.float32)
+            pose_size = 0
+            body_totals: Dict[str, float] = {}
+            last_pose: Optional[np.ndarray] = None
+
+            while True:
+                if total_frames % stride:
+                    if not capture.grab():
+                        break
+                    total_frames += 1
+                    continue
+
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                total_frames += 1
+                frame_count += 1
+
+                if face_mesh is None:
+                    if gate.changed(frame):
+                        last_face = analyze_gray_frame(
+                            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
+                            tracker,
+                            self._get_haar_detector()
+                        )
+                    if not last_face["face_detected"]:
+                        continue
+                    detected_frames += 1
+                    totals["head_position"] = totals.get("head_position", 0.0) + last_face["head_position_score"]
+                    continue
+
+                if gate.changed(frame):
+                    results = face_mesh.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                    if holistic is not None:
+                        face_landmarks = results.face_landmarks
+                        last_pose = (
+                            pose_landmarks_to_array(results.pose_landmarks)
+                            if results.pose_landmarks else None
+                        )
+                    else:
+                        face_landmarks = (
+                            results.multi_face_landmarks[0]
+                            if results.multi_face_landmarks else None
+                        )
+                    last_landmarks = landmarks_to_array(face_landmarks) if face_landmarks else None
+
+                if last_pose is not None:
+                    pose_chunk[pose_size] = last_pose
+                    pose_size += 1
+                    if pose_size == CLIP_LANDMARK_CHUNK:
+                        self._accumulate_posture(body_totals, pose_chunk)
+                        pose_size = 0
+
+                if last_landmarks is None:
+                    continue
+
+                landmark_chunk[chunk_size] = last_landmarks
+                chunk_size += 1
+                detected_frames += 1
+                if chunk_size == CLIP_LANDMARK_CHUNK:
+                    self._accumulate_scores(totals, landmark_chunk)
+                    chunk_size = 0
+
+            if chunk_size:
+                self._accumulate_scores(totals, landmark_chunk[:chunk_size])
+            if pose_size:
+                self._accumulate_posture(body_totals, pose_chunk[:pose_size])
+
+            elapsed = time.perf_counter() - started
+            if frame_count == 0:
+                logger.warning("No frames decoded from video clip")
+                return self._get_default_clip_metrics(with_body)
+
+            face_detection_rate = detected_frames / frame_count
+            means = {
+                name: total / detected_frames if detected_frames else 0.0
+                for name, total in totals.items()
+            }
+            # Haar boxes say nothing about gaze, so those tiers leave eye
+            # contact unmeasured rather than equate it with face presence
+            eye_contact_rate = means.get("eye_contact", 0.0) if face_mesh is not None else None
+            head_position_score = means.get("head_position", 0.0)
+
+            metrics = {
+                "eye_contact_rate": eye_contact_rate,
+                "face_detection_rate": face_detection_rate,
+                "head_position_score": head_position_score,
+                # Detection-weighted mean of eye contact and head position;
+                # unmeasured eye contact adds nothing, so a lower tier never
+                # scores higher
+                "confidence_score": face_detection_rate * ((eye_contact_rate or 0.0) + head_position_score) / 2,
+                "head_yaw": means.get("head_yaw", 0.0),
+                "head_pitch": means.get("head_pitch", 0.0),
+                "frame_count": frame_count,
+                "detected_frames": detected_frames,
+                "total_frames": total_frames,
+                "sample_stride": stride,
+                "quality_tier": tier,
+                "carried_forward_frames": gate.skipped,
+                "skip_ratio": gate.skip_ratio,
+                "duration_seconds": total_frames / fps,
+                "processing_fps": total_frames / elapsed if elapsed > 0 else 0.0,
+                "analyzed_fps": frame_count / elapsed if elapsed > 0 else 0.0
+            }
+            if with_body:
+                metrics["body"] = (
+                    self._body_metrics(body_totals, frame_count)
+                    if holistic is not None else self._get_default_body_metrics()
+                )
+            return metrics
+
         except Exception as e:
-            logger.error(f"Error calculating eye contact: {str(e)}")
-            return 0.5
+            logger.error(f"Error analyzing video clip: {str(e)}")
+            metrics = self._get_default_clip_metrics(with_body)
+            metrics["error"] = str(e)
+            return metrics
+        finally:
+            if capture is not None:
+                capture.release()
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
     
-    def _calculate_eye_openness(self, eye_landmarks) -> float:
+    def _model_for(self, tier: str, with_body: bool):
         """
-        Calculate eye openness based on eye landmarks.
+        FaceMesh (or, ``with_body``, Holistic) model for a quality tier, or
+        None for the Haar tiers. Replaces the model held for another tier.
         """
-        try:
-            # Get vertical distance between upper and lower eyelids
-            upper_lid = eye_landmarks[1].y
-            lower_lid = eye_landmarks[4].y
-            
-            # Calculate eye height
-            eye_height = abs(upper_lid - lower_lid)
-            
-            # Get horizontal distance between eye corners
-            left_corner = eye_landmarks[0].x
-            right_corner = eye_landmarks[3].x
-            
-            # Calculate eye width
-            eye_width = abs(right_corner - left_corner)
-            
-            # Calculate aspect ratio
-            aspect_ratio = eye_height / eye_width if eye_width > 0 else 0
-            
-            # Normalize to 0-1 range (typical range is 0.2-0.4)
-            return min(max((aspect_ratio - 0.2) / 0.2, 0.0), 1.0)
-            
-        except Exception as e:
-            logger.error(f"Error calculating eye openness: {str(e)}")
-            return 0.5
+        if tier not in ("mesh_refined", "mesh"):
+            return None
+        key = (tier, with_body)
+        if self._model_key != key:
+            self.close()
+            if with_body:
+                self._model = mp.solutions.holistic.Holistic(
+                    refine_face_landmarks=tier == "mesh_refined",
+                    min_detection_confidence=0.5,
+                    min_tracking_confidence=0.5
+                )
+            else:
+                self._model = mp.solutions.face_mesh.FaceMesh(
+                    max_num_faces=1,
+                    refine_landmarks=tier == "mesh_refined",
+                    min_detection_confidence=0.5,
+                    min_tracking_confidence=0.5
+                )
+            self._model_key = key
+        return self._model
     
-    def _calculate_head_position(self, face_landmarks) -> float:
+    def close(self):
         """
-        Calculate head position score based on face landmarks.
+        Release the MediaPipe model this analyzer holds.
         """
-        try:
-            # Get nose tip and face center
-            nose_tip = face_landmarks.landmark[4]
-            face_center = face_landmarks.landmark[1]  # Using nose bridge as reference
-            
-            # Calculate deviation from center
-            x_deviation = abs(nose_tip.x - 0.5)  # 0.5 is center
-            y_deviation = abs(nose_tip.y - 0.5)
-            
-            # Calculate total deviation
-            total_deviation = (x_deviation + y_deviation) / 2
-            
-            # Convert to score (1.0 is perfect, 0.0 is completely off-center)
-            return 1.0 - total_deviation
-            
-        except Exception as e:
-            logger.error(f"Error calculating head position: {str(e)}")
-            return 0.5
+        if self._model is not None:
+            self._model.close()
+        self._model = None
+        self._model_key = None
+    
+    def _get_haar_detector(self) -> HaarFaceDetector:
+        if self._haar_detector is None:
+            self._haar_detector = HaarFaceDetector()
+        return self._haar_detector
+    
+    def _accumulate_scores(self, totals: Dict[str, float], landmarks: np.ndarray):
+        """
+        Add the summed per-frame scores of a landmark stack to ``totals``.
+        """
+        for name, values in score_landmarks(landmarks).items():
+            totals[name] = totals.get(name, 0.0) + float(values.sum())
+    
+    def _accumulate_posture(self, totals: Dict[str, float], landmarks: np.ndarray):
+        """
+        Add the summed posture scores of a pose landmark stack to ``totals``,
+        counting only frames where both shoulders are visible.
+        """
+        scores = posture_scores(landmarks)
+        valid = scores.pop("valid")
+        totals["frames"] = totals.get("frames", 0.0) + float(valid.sum())
+        good = scores["posture_score"][valid] >= GOOD_POSTURE_THRESHOLD
+        totals["good"] = totals.get("good", 0.0) + float(good.sum())
+        for name, values in scores.items():
+            totals[name] = totals.get(name, 0.0) + float(values[valid].sum())
+    
+    def _body_metrics(self, totals: Dict[str, float], frame_count: int) -> Dict[str, Any]:
+        pose_frames = totals.get("frames", 0.0)
+        if not pose_frames:
+            # No usable pose anywhere in the clip; keep neutral scores
+            metrics = self._get_default_body_metrics()
+            metrics["total_frames_analyzed"] = frame_count
+            metrics["analysis_method"] = "holistic"
+            return metrics
+        pose_detection_rate = pose_frames / frame_count
+        average_posture_score = totals["posture_score"] / pose_frames
+        return {
+            "pose_detection_rate": pose_detection_rate,
+            "good_posture_rate": totals["good"] / pose_frames,
+            "average_posture_score": average_posture_score,
+            # Detection-weighted posture score, the body input of the final score
+            "posture_score": pose_detection_rate * average_posture_score,
+            "shoulder_level": totals["shoulder_level"] / pose_frames,
+            "head_centered": totals["head_centered"] / pose_frames,
+            "upright": totals["upright"] / pose_frames,
+            "total_frames_analyzed": frame_count,
+            "analysis_method": "holistic"
+        }
+    
+    def _get_default_body_metrics(self) -> Dict[str, Any]:
+        """
+        Return neutral body metrics when posture could not be analyzed.
+        """
+        return {
+            "pose_detection_rate": 0.0,
+            "good_posture_rate": 0.0,
+            "average_posture_score": 0.5,
+            "posture_score": 0.5,
+            "total_frames_analyzed": 0,
+            "analysis_method": "unavailable"
+        }
     
     def _get_default_metrics(self) -> Dict[str, float]:
         """
@@ -147,12 +404,55 @@ class FaceAnalyzer:
             "face_detection_rate": 0.0,
             "head_position_score": 0.5
         }
+    
+    def _get_default_clip_metrics(self, with_body: bool = False) -> Dict[str, Any]:
+        """
+        Return default clip metrics when clip analysis fails.
+        """
+        metrics = self._get_default_metrics()
+        metrics.update({
+            "confidence_score": 0.0,
+            "frame_count": 0,
+            "detected_frames": 0,
+            "total_frames": 0,
+            "carried_forward_frames": 0,
+            "skip_ratio": 0.0,
+            "processing_fps": 0.0
+        })
+        if with_body:
+            metrics["body"] = self._get_default_body_metrics()
+        return metrics
 
-# Create global instance
-face_analyzer = FaceAnalyzer()
+# Shared, size-capped pool of FaceAnalyzers, one MediaPipe model each;
+# warmed at application startup
+face_analyzer_pool: AnalyzerPool[FaceAnalyzer] = AnalyzerPool(
+    FaceAnalyzer,
+    size=FACE_ANALYZER_POOL_SIZE,
+    checkout_timeout=FACE_ANALYZER_CHECKOUT_TIMEOUT
+)
 
-def analyze_face(video_data: bytes) -> Dict[str, float]:
+def analyze_face(video_data: Union[bytes, str], with_body: bool = False) -> Dict[str, Any]:
     """
-    Analyze face metrics from video data.
+    Analyze face (and, with ``with_body``, posture) metrics from a recorded
+    video clip, at the quality tier the current load allows.
     """
-    return face_analyzer.analyze(video_data) 
\ No newline at end of file
+    with vision_governor.job() as job:
+        with face_analyzer_pool.borrow() as face_analyzer:
+            metrics = face_analyzer.analyze_clip(video_data, tier=job.tier, with_body=with_body)
+        job.units = max(1, metrics.get("frame_count", 0))
+        return metrics
+
+async def analyze_face_async(video_data: bytes, with_body: bool = False) -> Dict[str, float]:
+    """
+    Analyze face (and, with ``with_body``, posture) metrics from an image or
+    clip with a pooled analyzer, off the event loop.
+    """
+    def run() -> Dict[str, float]:
+        with vision_governor.job() as job:
+            with face_analyzer_pool.borrow() as face_analyzer:
+                metrics = face_analyzer.analyze_bytes(video_data, tier=job.tier, with_body=with_body)
+            job.units = max(1, metrics.get("frame_count", 1))
+            return metrics
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, run) 
\ No newline at end of file
@@ -0,0 +1,433 @@
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from .config import (
+    FACE_DETECTOR,
+    FACE_DETECTOR_TIER,
+    FACE_DETECTOR_CONFIDENCE,
+    FACE_MODELS_DIR,
+    FACE_BENCHMARK_IMAGES,
+    LIVE_FRAME_WIDTH,
+    LIVE_FRAME_HEIGHT
+)
+from .lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
+mp = lazy_import("mediapipe")
+
+logger = logging.getLogger(__name__)
+
+Box = Tuple[int, int, int, int]
+Size = Tuple[int, int]
+
+# Accuracy tiers backends are ranked by; a backend meets every tier up to
+# its own
+TIER_BASIC = 1      # Frontal faces in good light
+TIER_ROBUST = 2     # Handles pose, partial occlusion and poor light
+TIER_LANDMARKS = 3  # Robust, with a full landmark mesh behind each box
+
+# OpenCV DNN face detector (ResNet-10 SSD) files expected in FACE_MODELS_DIR
+DNN_CONFIG_FILE = "deploy.prototxt"
+DNN_WEIGHTS_FILE = "res10_300x300_ssd_iter_140000.caffemodel"
+
+BENCHMARK_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class DetectorUnavailable(RuntimeError):
+    """
+    Raised when a detector backend cannot be built on this host, e.g.
+    because its model files are missing.
+    """
+
+
+class FaceDetector(ABC):
+    """
+    Interface shared by all face detector backends.
+
+    ``detect`` accepts a grayscale or BGR frame and returns face boxes as
+    ``(x, y, w, h)`` in frame pixels. Detector instances wrap native models
+    that are not thread-safe; use ``get_face_detector`` for a per-thread one.
+    """
+
+    name = "base"
+    accuracy_tier = 0
+
+    @abstractmethod
+    def detect(
+        self,
+        image: np.ndarray,
+        min_size: Optional[Size] = None,
+        max_size: Optional[Size] = None
+    ) -> List[Box]:
+        """
+        Face boxes in ``image``, optionally limited to a size range.
+        """
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _filter_sizes(boxes: List[Box], min_size: Optional[Size], max_size: Optional[Size]) -> List[Box]:
+        if min_size is not None:
+            boxes = [b for b in boxes if b[2] >= min_size[0] and b[3] >= min_size[1]]
+        if max_size is not None:
+            boxes = [b for b in boxes if b[2] <= max_size[0] and b[3] <= max_size[1]]
+        return boxes
+
+    @staticmethod
+    def _to_rgb(image: np.ndarray) -> np.ndarray:
+        if image.ndim == 2:
+            return cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    @staticmethod
+    def _clip_box(x: float, y: float, w: float, h: float, width: int, height: int) -> Box:
+        x0 = int(max(0, x))
+        y0 = int(max(0, y))
+        x1 = int(min(width, x + w))
+        y1 = int(min(height, y + h))
+        return x0, y0, max(0, x1 - x0), max(0, y1 - y0)
+
+
+class HaarFaceDetector(FaceDetector):
+    """
+    OpenCV Haar cascade; the cheapest backend, frontal faces only.
+    """
+
+    name = "haar"
+    accuracy_tier = TIER_BASIC
+
+    def __init__(self):
+        self.cascade = cv2.CascadeClassifier(
+            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+        )
+        if self.cascade.empty():
+            raise DetectorUnavailable("Haar face cascade could not be loaded")
+
+    def detect(self, image, min_size=None, max_size=None):
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        faces = self.cascade.detectMultiScale(
+            gray,
+            1.1,
+            4,
+            minSize=min_size or (0, 0),
+            maxSize=max_size or (0, 0)
+        )
+        return [tuple(int(v) for v in face) for face in faces]
+
+
+class MediaPipeFaceDetector(FaceDetector):
+    """
+    MediaPipe BlazeFace short-range detector.
+    """
+
+    name = "mediapipe"
+    accuracy_tier = TIER_ROBUST
+
+    def __init__(self, min_confidence: float = FACE_DETECTOR_CONFIDENCE):
+        self.model = mp.solutions.face_detection.FaceDetection(
+            model_selection=0,
+            min_detection_confidence=min_confidence
+        )
+
+    def detect(self, image, min_size=None, max_size=None):
+        height, width = image.shape[:2]
+        results = self.model.process(self._to_rgb(image))
+        boxes = []
+        for detection in results.detections or []:
+            box = detection.location_data.relative_bounding_box
+            boxes.append(self._clip_box(
+                box.xmin * width,
+                box.ymin * height,
+                box.width * width,
+                box.height * height,
+                width,
+                height
+            ))
+        return self._filter_sizes(boxes, min_size, max_size)
+
+    def close(self):
+        self.model.close()
+
+
+class FaceMeshDetector(FaceDetector):
+    """
+    MediaPipe FaceMesh; boxes are the extent of the landmark mesh.
+    """
+
+    name = "facemesh"
+    accuracy_tier = TIER_LANDMARKS
+
+    def __init__(self, min_confidence: float = FACE_DETECTOR_CONFIDENCE):
+        # Detectors are shared across sessions and fed crops of any size, so
+        # landmarks from the previous call must never seed the next one
+        self.model = mp.solutions.face_mesh.FaceMesh(
+            static_image_mode=True,
+            max_num_faces=1,
+            refine_landmarks=False,
+            min_detection_confidence=min_confidence,
+            min_tracking_confidence=min_confidence
+        )
+
+    def detect(self, image, min_size=None, max_size=None):
+        height, width = image.shape[:2]
+        results = self.model.process(self._to_rgb(image))
+        boxes = []
+        for face_landmarks in results.multi_face_landmarks or []:
+            xs = [p.x for p in face_landmarks.landmark]
+            ys = [p.y for p in face_landmarks.landmark]
+            x0, y0 = min(xs) * width, min(ys) * height
+            boxes.append(self._clip_box(x0, y0, max(xs) * width - x0, max(ys) * height - y0, width, height))
+        return self._filter_sizes(boxes, min_size, max_size)
+
+    def close(self):
+        self.model.close()
+
+
+class DnnFaceDetector(FaceDetector):
+    """
+    OpenCV DNN ResNet-10 SSD face detector, loaded from FACE_MODELS_DIR.
+    """
+
+    name = "dnn"
+    accuracy_tier = TIER_ROBUST
+    input_size = (300, 300)
+
+    def __init__(self, models_dir: Optional[str] = None, min_confidence: float = FACE_DETECTOR_CONFIDENCE):
+        models_dir = models_dir or FACE_MODELS_DIR
+        config_path = os.path.join(models_dir, DNN_CONFIG_FILE)
+        weights_path = os.path.join(models_dir, DNN_WEIGHTS_FILE)
+        if not (os.path.exists(config_path) and os.path.exists(weights_path)):
+            raise DetectorUnavailable(
+                f"DNN face model not found; expected {DNN_CONFIG_FILE} and {DNN_WEIGHTS_FILE} in {models_dir}"
+            )
+        self.net = cv2.dnn.readNetFromCaffe(config_path, weights_path)
+        self.min_confidence = min_confidence
+
+    def detect(self, image, min_size=None, max_size=None):
+        height, width = image.shape[:2]
+        bgr = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR) if image.ndim == 2 else image
+        blob = cv2.dnn.blobFromImage(
+            cv2.resize(bgr, self.input_size),
+            1.0,
+            self.input_size,
+            (104.0, 177.0, 123.0)
+        )
+        self.net.setInput(blob)
+        detections = self.net.forward()[0, 0]
+
+        boxes = []
+        for confidence, x0, y0, x1, y1 in detections[:, 2:7]:
+            if confidence < self.min_confidence:
+                continue
+            boxes.append(self._clip_box(
+                x0 * width,
+                y0 * height,
+                (x1 - x0) * width,
+                (y1 - y0) * height,
+                width,
+                height
+            ))
+        return self._filter_sizes([b for b in boxes if b[2] and b[3]], min_size, max_size)
+
+
+DETECTOR_BACKENDS: Dict[str, Type[FaceDetector]] = {
+    HaarFaceDetector.name: HaarFaceDetector,
+    MediaPipeFaceDetector.name: MediaPipeFaceDetector,
+    FaceMeshDetector.name: FaceMeshDetector,
+    DnnFaceDetector.name: DnnFaceDetector
+}
+
+# Backend used by get_face_detector; "auto" starts on Haar until the
+# startup benchmark has picked one
+_default_backend = FACE_DETECTOR if FACE_DETECTOR in DETECTOR_BACKENDS else HaarFaceDetector.name
+
+# Detector models are not safe to share between analysis threads, so each
+# thread (or worker process) builds its own on first use
+_thread_local = threading.local()
+
+
+def create_detector(name: str) -> FaceDetector:
+    if name not in DETECTOR_BACKENDS:
+        raise ValueError(f"Unknown face detector {name!r}; choose from {', '.join(DETECTOR_BACKENDS)}")
+    return DETECTOR_BACKENDS[name]()
+
+
+def default_backend() -> str:
+    return _default_backend
+
+
+def set_default_backend(name: str):
+    global _default_backend
+    if name not in DETECTOR_BACKENDS:
+        raise ValueError(f"Unknown face detector {name!r}")
+    _default_backend = name
+
+
+def get_face_detector(name: Optional[str] = None) -> FaceDetector:
+    """
+    Return this thread's detector for ``name`` (default: the configured or
+    benchmarked backend). A backend that cannot be built on this host, e.g.
+    ``dnn`` without its model files, falls back to Haar.
+    """
+    name = name or _default_backend
+    detectors = getattr(_thread_local, "detectors", None)
+    if detectors is None:
+        detectors = _thread_local.detectors = {}
+    if name not in detectors:
+        try:
+            detectors[name] = create_detector(name)
+        except DetectorUnavailable as e:
+            if name == HaarFaceDetector.name:
+                raise
+            logger.warning(f"Face detector {name} unavailable, using haar: {str(e)}")
+            detectors[name] = get_face_detector(HaarFaceDetector.name)
+    return detectors[name]
+
+
+def load_benchmark_frames(paths: Iterable[str]) -> List[np.ndarray]:
+    """
+    Read face images (files, or directories of them) as grayscale frames at
+    the live resolution. Unreadable files are skipped.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith(BENCHMARK_IMAGE_EXTENSIONS)
+            )
+        elif os.path.exists(path):
+            files.append(path)
+
+    frames = []
+    for path in files:
+        image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            logger.warning(f"Skipping unreadable benchmark image {path}")
+            continue
+        frames.append(cv2.resize(image, (LIVE_FRAME_WIDTH, LIVE_FRAME_HEIGHT), interpolation=cv2.INTER_AREA))
+    return frames
+
+
+def _benchmark_frames(count: int = 8) -> List[np.ndarray]:
+    """
+    Synthetic live-resolution frames: a face-sized bright oval over noise.
+    Only a fallback; detectors that find no face skip their later stages,
+    so timings on these understate the landmark backends.
+    """
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(count):
+        frame = rng.integers(0, 80, (LIVE_FRAME_HEIGHT, LIVE_FRAME_WIDTH), dtype=np.uint8)
+        center = (LIVE_FRAME_WIDTH // 2 + i, LIVE_FRAME_HEIGHT // 2)
+        axes = (LIVE_FRAME_WIDTH // 6, LIVE_FRAME_HEIGHT // 4)
+        cv2.ellipse(frame, center, axes, 0, 0, 360, 180, -1)
+        frames.append(frame)
+    return frames
+
+
+def benchmark_detectors(
+    names: Iterable[str] = DETECTOR_BACKENDS,
+    frames: Optional[Sequence[np.ndarray]] = None,
+    repeats: int = 5
+) -> Dict[str, Optional[float]]:
+    """
+    Measure each backend's mean per-frame detection latency in milliseconds
+    on this host, by default on the face images at FACE_BENCHMARK_IMAGES.
+    Backends that cannot be built map to None.
+    """
+    if frames is None:
+        frames = load_benchmark_frames([FACE_BENCHMARK_IMAGES])
+        if not frames:
+            logger.warning(
+                f"No face images at {FACE_BENCHMARK_IMAGES}; benchmarking face detectors on synthetic frames"
+            )
+            frames = _benchmark_frames()
+    frames = list(frames)
+    latencies: Dict[str, Optional[float]] = {}
+    for name in names:
+        try:
+            detector = create_detector(name)
+        except Exception as e:
+            logger.warning(f"Face detector {name} unavailable: {str(e)}")
+            latencies[name] = None
+            continue
+        try:
+            # First calls pay for graph setup and allocations
+            for frame in frames[:2]:
+                detector.detect(frame)
+            started = time.perf_counter()
+            for _ in range(repeats):
+                for frame in frames:
+                    detector.detect(frame)
+            latencies[name] = (time.perf_counter() - started) * 1000 / (repeats * len(frames))
+        except Exception as e:
+            logger.error(f"Error benchmarking face detector {name}: {str(e)}")
+            latencies[name] = None
+        finally:
+            detector.close()
+    return latencies
+
+
+def select_detector(latencies: Dict[str, Optional[float]], tier: int = FACE_DETECTOR_TIER) -> Optional[str]:
+    """
+    Pick the fastest measured backend whose accuracy tier is at least ``tier``.
+    """
+    candidates = [
+        (latency, name) for name, latency in latencies.items()
+        if latency is not None and DETECTOR_BACKENDS[name].accuracy_tier >= tier
+    ]
+    return min(candidates)[1] if candidates else None
+
+
+def choose_default_backend(tier: int = FACE_DETECTOR_TIER) -> str:
+    """
+    Benchmark every backend and make the fastest one meeting ``tier`` the
+    default. Falls back to Haar if none qualifies.
+    """
+    latencies = benchmark_detectors()
+    name = select_detector(latencies, tier)
+    if name is None:
+        logger.warning(f"No face detector meets accuracy tier {tier}; using haar")
+        name = HaarFaceDetector.name
+    set_default_backend(name)
+    logger.info(
+        f"Selected face detector {name} (tier {tier}): "
+        + ", ".join(
+            f"{backend} {latency:.1f} ms" if latency is not None else f"{backend} unavailable"
+            for backend, latency in latencies.items()
+        )
+    )
+    return name
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the face detector backends on this host.")
+    parser.add_argument("--tier", type=int, default=FACE_DETECTOR_TIER, help="minimum accuracy tier (1-3)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("frames", nargs="*", help="face images or directories to benchmark on (default: FACE_BENCHMARK_IMAGES)")
+    args = parser.parse_args(argv)
+
+    frames = (load_benchmark_frames(args.frames) if args.frames else None) or None
+
+    latencies = benchmark_detectors(frames=frames, repeats=args.repeats)
+    for name, latency in sorted(latencies.items(), key=lambda item: item[1] if item[1] is not None else float("inf")):
+        tier = DETECTOR_BACKENDS[name].accuracy_tier
+        print(f"{name:<10} tier {tier}  " + (f"{latency:8.2f} ms/frame" if latency is not None else "unavailable"))
+
+    selected = select_detector(latencies, args.tier)
+    print(f"Selected for tier {args.tier}: {selected or 'none'}")
+    return 0 if selected else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .config import (
+    FACE_TRACKING_ENABLED,
+    FACE_REDETECT_INTERVAL,
+    FACE_TRACK_MIN_CONFIDENCE,
+    FACE_TRACK_PADDING
+)
+from .face_detectors import FaceDetector, get_face_detector
+from .lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+Box = Tuple[int, int, int, int]
+
+# Templates are matched at this width to keep tracking cost independent of
+# how large the face is in the frame
+TEMPLATE_WIDTH = 32
+
+def analyze_gray_frame(
+    gray: np.ndarray,
+    tracker: "FaceTracker",
+    detector: Optional[FaceDetector] = None
+) -> Dict[str, Any]:
+    """
+    Build live face metrics for one grayscale frame, using this thread's
+    default detector unless another is given.
+    """
+    face_box, tracking_mode = tracker.update(gray, detector or get_face_detector())
+
+    return {
+        "face_detected": face_box is not None,
+        "eye_contact": True if face_box is not None else False,
+        "confidence_score": 0.8 if face_box is not None else 0.2,
+        "head_position_score": _head_position_score(face_box, gray.shape),
+        "tracking_mode": tracking_mode
+    }
+
+
+def _head_position_score(face_box: Optional[Box], shape: Tuple[int, ...]) -> float:
+    """
+    Score how centred the face is, matching FaceAnalyzer's head position
+    scale (1.0 is centred, 0.0 completely off-centre).
+    """
+    if face_box is None:
+        return 0.0
+    height, width = shape[:2]
+    x, y, w, h = face_box
+    x_deviation = abs((x + w / 2) / width - 0.5)
+    y_deviation = abs((y + h / 2) / height - 0.5)
+    return 1.0 - (x_deviation + y_deviation) / 2
+
+
+class FaceTracker:
+    """
+    Detect-then-track face localisation for one live session.
+
+    A full-frame detection runs every ``redetect_interval`` frames. In
+    between, the face is followed by normalised template matching inside a
+    padded window around the last box. When the match is weak, a detection
+    restricted to that window (with minimum and maximum sizes derived from
+    the last box) is tried before falling back to a full-frame detection.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = FACE_TRACKING_ENABLED,
+        redetect_interval: int = FACE_REDETECT_INTERVAL,
+        min_confidence: float = FACE_TRACK_MIN_CONFIDENCE,
+        padding: float = FACE_TRACK_PADDING,
+        scale_tolerance: float = 0.3
+    ):
+        self.enabled = enabled
+        self.redetect_interval = max(1, redetect_interval)
+        self.min_confidence = min_confidence
+        self.padding = padding
+        self.scale_tolerance = scale_tolerance
+
+        self.box: Optional[Box] = None
+        self.confidence = 0.0
+        self._template: Optional[np.ndarray] = None
+        self._template_scale = 1.0
+        self._frames_since_detect = 0
+
+    def reset(self):
+        self.box = None
+        self.confidence = 0.0
+        self._template = None
+        self._frames_since_detect = 0
+
+    def update(self, gray: np.ndarray, detector: FaceDetector) -> Tuple[Optional[Box], str]:
+        """
+        Locate the face in a grayscale frame.
+
+        Returns the face box (or None) and the mode used: ``detect``,
+        ``tracked`` or ``window``.
+        """
+        self._frames_since_detect += 1
+        if (
+            not self.enabled
+            or self.box is None
+            or self._template is None
+            or self._frames_since_detect >= self.redetect_interval
+        ):
+            return self._detect(gray, detector), "detect"
+
+        window = self._search_window(gray.shape)
+
+        box, score = self._track(gray, window)
+        if score >= self.min_confidence:
+            self.box = box
+            self.confidence = score
+            return box, "tracked"
+
+        box = self._detect_in_window(gray, window, detector)
+        if box is not None:
+            return box, "window"
+
+        return self._detect(gray, detector), "detect"
+
+    def _detect(self, gray: np.ndarray, detector: FaceDetector) -> Optional[Box]:
+        self._frames_since_detect = 0
+        faces = detector.detect(gray)
+        if len(faces) == 0:
+            self.reset()
+            return None
+
+        # Interviews have one candidate; keep the largest face
+        box = max(faces, key=lambda f: f[2] * f[3])
+        self._set_detection(gray, box)
+        return box
+
+    def _detect_in_window(
+        self,
+        gray: np.ndarray,
+        window: Box,
+        detector: FaceDetector
+    ) -> Optional[Box]:
+        wx, wy, ww, wh = window
+        _, _, w, h = self.box
+        min_size = (int(w * (1 - self.scale_tolerance)), int(h * (1 - self.scale_tolerance)))
+        max_size = (int(w * (1 + self.scale_tolerance)), int(h * (1 + self.scale_tolerance)))
+
+        faces = detector.detect(
+            gray[wy:wy + wh, wx:wx + ww],
+            min_size=min_size,
+            max_size=max_size
+        )
+        if len(faces) == 0:
+            return None
+
+        x, y, fw, fh = max(faces, key=lambda f: f[2] * f[3])
+        box = (int(x) + wx, int(y) + wy, int(fw), int(fh))
+        self._frames_since_detect = 0
+        self._set_detection(gray, box)
+        return box
+
+    def _track(self, gray: np.ndarray, window: Box) -> Tuple[Optional[Box], float]:
+        wx, wy, ww, wh = window
+        scale = self._template_scale
+        roi = cv2.resize(
+            gray[wy:wy + wh, wx:wx + ww],
+            (max(1, int(ww * scale)), max(1, int(wh * scale))),
+            interpolation=cv2.INTER_AREA
+        )
+        th, tw = self._template.shape
+        if roi.shape[0] < th or roi.shape[1] < tw:
+            return None, 0.0
+
+        scores = cv2.matchTemplate(roi, self._template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (mx, my) = cv2.minMaxLoc(scores)
+
+        _, _, w, h = self.box
+        box = (wx + int(mx / scale), wy + int(my / scale), w, h)
+        return box, float(score)
+
+    def _search_window(self, shape: Tuple[int, ...]) -> Box:
+        height, width = shape[:2]
+        x, y, w, h = self.box
+        pad_x = int(w * self.padding)
+        pad_y = int(h * self.padding)
+        x0 = max(0, x - pad_x)
+        y0 = max(0, y - pad_y)
+        x1 = min(width, x + w + pad_x)
+        y1 = min(height, y + h + pad_y)
+        return x0, y0, x1 - x0, y1 - y0
+
+    def _set_detection(self, gray: np.ndarray, box: Box):
+        x, y, w, h = box
+        self.box = box
+        self.confidence = 1.0
+        self._template_scale = TEMPLATE_WIDTH / max(w, 1)
+        self._template = cv2.resize(
+            gray[y:y + h, x:x + w],
+            (TEMPLATE_WIDTH, max(1, int(h * self._template_scale))),
+            interpolation=cv2.INTER_AREA
+        )
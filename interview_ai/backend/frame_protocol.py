@@ -0,0 +1,204 @@
+import logging
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Dict
+
+import numpy as np
+
+from .config import LIVE_FRAME_WIDTH, LIVE_FRAME_HEIGHT, LIVE_JPEG_QUALITY, AUDIO_SAMPLE_RATE
+from .lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+
+class MessageType(IntEnum):
+    """
+    Binary message types carried on the interview websocket.
+    """
+    FRAME = 1
+    AUDIO = 2
+
+
+# Little-endian: message type (uint8), sequence number (uint32),
+# capture timestamp in milliseconds since the epoch (float64).
+HEADER = struct.Struct("<BId")
+HEADER_SIZE = HEADER.size
+
+# Live analysis (face tracking, motion gate, shared-memory frame rings) is
+# grayscale only, so that is the one colour mode offered to clients
+LIVE_COLOR_MODE = "gray"
+
+# Audio chunks are mono signed 16-bit little-endian PCM
+AUDIO_ENCODING = "pcm_s16le"
+# Sample rates the streaming voice analyzer accepts from clients
+MIN_AUDIO_SAMPLE_RATE = 8000
+MAX_AUDIO_SAMPLE_RATE = 96000
+
+
+class FrameProtocolError(ValueError):
+    """
+    Raised when a binary websocket message cannot be parsed.
+    """
+
+
+@dataclass
+class BinaryMessage:
+    """
+    A parsed binary websocket message.
+
+    ``payload`` is a read-only numpy view over the original message buffer,
+    so no bytes are copied between the socket and ``cv2.imdecode``.
+    """
+    message_type: MessageType
+    sequence: int
+    capture_ts: float
+    payload: np.ndarray
+
+
+def parse_binary_message(data: bytes) -> BinaryMessage:
+    """
+    Parse a binary websocket message into its header and payload view.
+    """
+    if len(data) < HEADER_SIZE:
+        raise FrameProtocolError(
+            f"Binary message too short: {len(data)} bytes, header needs {HEADER_SIZE}"
+        )
+
+    raw_type, sequence, capture_ts = HEADER.unpack_from(data, 0)
+    try:
+        message_type = MessageType(raw_type)
+    except ValueError:
+        raise FrameProtocolError(f"Unknown binary message type: {raw_type}")
+
+    payload = np.frombuffer(data, dtype=np.uint8, offset=HEADER_SIZE)
+    return BinaryMessage(
+        message_type=message_type,
+        sequence=sequence,
+        capture_ts=capture_ts,
+        payload=payload
+    )
+
+
+def pack_binary_message(
+    message_type: MessageType,
+    sequence: int,
+    capture_ts: float,
+    payload: bytes
+) -> bytes:
+    """
+    Build a binary websocket message. Mainly useful for tests and clients.
+    """
+    return HEADER.pack(int(message_type), sequence & 0xFFFFFFFF, capture_ts) + bytes(payload)
+
+
+def frame_payload_from_json(data: Dict[str, Any]) -> np.ndarray:
+    """
+    Convert a legacy JSON ``frame`` message into a uint8 buffer.
+    """
+    return np.asarray(data["frame"], dtype=np.uint8)
+
+
+@dataclass
+class FrameFormat:
+    """
+    Frame format negotiated with a live video client.
+
+    The server advertises what its analyzers want (``capabilities``) when the
+    socket connects and the client answers with the format it will send.
+    Asking for small grayscale frames at the source is cheaper than any
+    server-side resize or colour conversion. The colour mode is always
+    ``LIVE_COLOR_MODE``; frames sent in colour are decoded to grayscale.
+    """
+    width: int = LIVE_FRAME_WIDTH
+    height: int = LIVE_FRAME_HEIGHT
+    jpeg_quality: float = LIVE_JPEG_QUALITY
+    color: str = LIVE_COLOR_MODE
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "width": self.width,
+            "height": self.height,
+            "jpeg_quality": self.jpeg_quality,
+            "color": self.color
+        }
+
+    def update(self, data: Dict[str, Any]):
+        """
+        Apply the format a client reports it will send, ignoring values the
+        server cannot use (including any colour mode but grayscale).
+        """
+        try:
+            width = int(data.get("width", self.width))
+            height = int(data.get("height", self.height))
+            jpeg_quality = float(data.get("jpeg_quality", self.jpeg_quality))
+        except (TypeError, ValueError):
+            raise FrameProtocolError(f"Invalid frame format: {data}")
+
+        if width > 0 and height > 0:
+            self.width, self.height = width, height
+        if 0.0 < jpeg_quality <= 1.0:
+            self.jpeg_quality = jpeg_quality
+
+
+@dataclass
+class AudioFormat:
+    """
+    Audio chunk format negotiated with a live client.
+
+    Browsers do not always honour the requested capture rate, so the client
+    answers with the sample rate it actually records at.
+    """
+    sample_rate: int = AUDIO_SAMPLE_RATE
+    encoding: str = AUDIO_ENCODING
+    channels: int = 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sample_rate": self.sample_rate,
+            "encoding": self.encoding,
+            "channels": self.channels
+        }
+
+    def update(self, data: Dict[str, Any]):
+        """
+        Apply the sample rate a client reports it will send.
+        """
+        try:
+            sample_rate = int(data.get("sample_rate", self.sample_rate))
+        except (TypeError, ValueError):
+            raise FrameProtocolError(f"Invalid audio format: {data}")
+
+        if not MIN_AUDIO_SAMPLE_RATE <= sample_rate <= MAX_AUDIO_SAMPLE_RATE:
+            raise FrameProtocolError(f"Unsupported audio sample rate: {sample_rate}")
+        self.sample_rate = sample_rate
+
+
+def decode_audio(payload: np.ndarray) -> np.ndarray:
+    """
+    Convert a PCM audio payload into float32 samples in [-1, 1].
+    """
+    if payload.size % 2:
+        raise FrameProtocolError(f"Audio payload of {payload.size} bytes is not 16-bit PCM")
+    return payload.view("<i2").astype(np.float32) / 32768.0
+
+
+def decode_frame(payload: np.ndarray, color: str = "gray") -> np.ndarray:
+    """
+    Decode a JPEG payload straight into the colour mode analysis needs.
+
+    Grayscale decoding only reconstructs the luma plane, so no separate
+    colour conversion pass is needed for Haar detection.
+    """
+    if color == "gray":
+        image = cv2.imdecode(payload, cv2.IMREAD_GRAYSCALE)
+    else:
+        image = cv2.imdecode(payload, cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Failed to decode video frame")
+
+    if color == "rgb":
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return image
@@ -0,0 +1,130 @@
+import argparse
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import IMPORT_BUDGET_MS
+
+logger = logging.getLogger(__name__)
+
+# Third-party libraries that are expensive to import and are only needed
+# once analysis runs; these must stay lazy
+HEAVY_MODULES = (
+    "cv2",
+    "mediapipe",
+    "librosa",
+    "pydub",
+    "soundfile",
+    "speech_recognition",
+    "groq",
+    "pdfplumber",
+    "docx"
+)
+
+# Modules imported during the startup warmup phase
+WARMUP_MODULES = ("cv2", "mediapipe", "librosa")
+
+# Entry point whose cold import time is held to the budget
+APP_MODULE = "backend.main"
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_MEASURE_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+try:
+    __import__(sys.argv[1])
+except ImportError as e:
+    print(json.dumps({"error": str(e)}))
+    sys.exit(0)
+elapsed = time.perf_counter() - started
+heavy = [name for name in sys.argv[2:] if name in sys.modules]
+print(json.dumps({"seconds": elapsed, "loaded": heavy}))
+"""
+
+
+def measure_import(module: str, watch: Iterable[str] = HEAVY_MODULES) -> Dict[str, Any]:
+    """
+    Cold-import ``module`` in a fresh interpreter.
+
+    Returns the import time in seconds and which of the ``watch`` modules it
+    pulled in, or an ``error`` if the module could not be imported.
+    """
+    try:
+        output = subprocess.run(
+            [sys.executable, "-c", _MEASURE_SCRIPT, module, *watch],
+            cwd=_PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=True
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+    except Exception as e:
+        logger.error(f"Error measuring import of {module}: {str(e)}")
+        return {"error": str(e)}
+
+
+def budget_report(
+    modules: Iterable[str] = HEAVY_MODULES,
+    budget_ms: float = IMPORT_BUDGET_MS,
+    app_module: str = APP_MODULE
+) -> Dict[str, Any]:
+    """
+    Measure the cold import time of the app and of each heavy library.
+
+    The app is within budget when it imports in under ``budget_ms`` and
+    loads none of the heavy libraries eagerly.
+    """
+    app = measure_import(app_module, modules)
+    libraries = {}
+    for module in modules:
+        result = measure_import(module, ())
+        libraries[module] = (
+            None if "error" in result else round(result["seconds"] * 1000, 1)
+        )
+
+    app_ms = None if "error" in app else round(app["seconds"] * 1000, 1)
+    eager = app.get("loaded", [])
+    return {
+        "budget_ms": budget_ms,
+        "app_module": app_module,
+        "app_ms": app_ms,
+        "app_error": app.get("error"),
+        "eager_modules": eager,
+        "modules_ms": libraries,
+        "within_budget": app_ms is not None and app_ms <= budget_ms and not eager
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"{report['app_module']}: "
+        + (f"{report['app_ms']:.1f} ms" if report["app_ms"] is not None else f"failed ({report['app_error']})")
+        + f" (budget {report['budget_ms']:.0f} ms)"
+    ]
+    if report["eager_modules"]:
+        lines.append(f"  imported eagerly: {', '.join(report['eager_modules'])}")
+    lines.append("Deferred libraries (cold import):")
+    for module, ms in sorted(report["modules_ms"].items(), key=lambda item: -(item[1] or 0)):
+        lines.append(f"  {module:<20} " + (f"{ms:8.1f} ms" if ms is not None else "not installed"))
+    lines.append("OK" if report["within_budget"] else "OVER BUDGET")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report backend import times against the import budget.")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = budget_report(budget_ms=args.budget_ms)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0 if report["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config import LIVE_ANALYSIS_WORKERS, INFERENCE_MAX_BATCH, INFERENCE_MAX_WAIT_MS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Job:
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    future: asyncio.Future
+
+
+class InferenceScheduler:
+    """
+    Cross-session micro-batching scheduler for live frame analysis.
+
+    Jobs submitted by every session are collected into small batches, waiting
+    at most ``max_wait_ms`` after the first job for others to arrive. Each
+    batch is handed to one of a fixed set of warm worker threads in a single
+    queue hand-off, which runs it back to back. Compared to one executor hop
+    per frame this cuts queue traffic and thread wake-ups when many
+    interviews run on one node. Each job's future is resolved as soon as that
+    job finishes, so a frame never waits for the rest of its batch.
+    """
+
+    def __init__(
+        self,
+        workers: int = LIVE_ANALYSIS_WORKERS,
+        max_batch: int = INFERENCE_MAX_BATCH,
+        max_wait_ms: float = INFERENCE_MAX_WAIT_MS
+    ):
+        self.workers = max(1, workers)
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Optional[asyncio.Queue] = None
+        self._batches: "queue.Queue[Optional[List[_Job]]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._collector: Optional[asyncio.Task] = None
+        self._warmup: Optional[Callable[[], Any]] = None
+        self._busy = 0
+        self._busy_lock = threading.Lock()
+
+        self.jobs_completed = 0
+        self.batches_completed = 0
+
+    @property
+    def started(self) -> bool:
+        return self._collector is not None
+
+    def start(self, warmup: Optional[Callable[[], Any]] = None):
+        """
+        Start the collector and worker threads on the running event loop.
+
+        ``warmup`` runs once on each worker thread before it takes work, so
+        per-thread models are loaded ahead of the first frame.
+        """
+        if self.started:
+            return
+        self._warmup = warmup
+        self._loop = asyncio.get_running_loop()
+        self._pending = asyncio.Queue()
+        self._threads = [
+            threading.Thread(
+                target=self._worker,
+                name=f"inference-worker-{index}",
+                daemon=True
+            )
+            for index in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        self._collector = asyncio.create_task(self._collect())
+        logger.info(
+            f"Inference scheduler started with {self.workers} workers, "
+            f"batches of up to {self.max_batch} within {self.max_wait * 1000:.1f} ms"
+        )
+
+    async def stop(self):
+        if not self.started:
+            return
+        self._collector.cancel()
+        await asyncio.gather(self._collector, return_exceptions=True)
+        self._collector = None
+        # Jobs not yet batched will never run
+        while not self._pending.empty():
+            self._pending.get_nowait().future.cancel()
+        for _ in self._threads:
+            self._batches.put(None)
+        self._threads = []
+
+    async def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Schedule ``fn(*args)`` on a worker and wait for its result.
+        """
+        if not self.started:
+            self.start()
+        future = self._loop.create_future()
+        self._pending.put_nowait(_Job(fn, args, future))
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "busy_workers": self._busy,
+            "pending_jobs": self._pending.qsize() if self._pending is not None else 0,
+            "queued_batches": self._batches.qsize(),
+            "jobs_completed": self.jobs_completed,
+            "batches_completed": self.batches_completed,
+            "mean_batch_size": (
+                self.jobs_completed / self.batches_completed if self.batches_completed else 0.0
+            )
+        }
+
+    async def _collect(self):
+        while True:
+            batch = [await self._pending.get()]
+            # Give other sessions a few milliseconds to join this batch
+            if self._pending.qsize() < self.max_batch - 1 and self.max_wait > 0:
+                try:
+                    await asyncio.sleep(self.max_wait)
+                except asyncio.CancelledError:
+                    # Stopping: the job in hand will never run
+                    batch[0].future.cancel()
+                    raise
+            while len(batch) < self.max_batch and not self._pending.empty():
+                batch.append(self._pending.get_nowait())
+            self._batches.put(batch)
+
+    def _worker(self):
+        if self._warmup is not None:
+            try:
+                self._warmup()
+            except Exception as e:
+                logger.error(f"Inference worker warmup failed: {str(e)}")
+
+        while True:
+            batch = self._batches.get()
+            if batch is None:
+                return
+
+            with self._busy_lock:
+                self._busy += 1
+            for job in batch:
+                try:
+                    result, error = job.fn(*job.args), None
+                except Exception as e:
+                    result, error = None, e
+                self._loop.call_soon_threadsafe(self._resolve, job.future, result, error)
+            with self._busy_lock:
+                self._busy -= 1
+                self.batches_completed += 1
+
+    def _resolve(self, future: asyncio.Future, result: Any, error: Optional[Exception]):
+        self.jobs_completed += 1
+        if future.done():
+            # The session went away while its frame was being analysed
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+# Shared by every live session on this worker
+inference_scheduler = InferenceScheduler()
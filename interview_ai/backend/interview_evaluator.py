@@ -1,9 +1,23 @@
+import asyncio
 import logging
 import os
-from typing import Dict, Any, List
-from groq import Groq
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 from datetime import datetime
+from .lazy_imports import lazy_import
+from .config import (
+    GROQ_MODEL,
+    GROQ_MAX_CONCURRENCY,
+    GROQ_TIMEOUT_SECONDS,
+    GROQ_CONNECT_TIMEOUT_SECONDS,
+    GROQ_MAX_RETRIES,
+    GROQ_MAX_CONNECTIONS,
+    GROQ_KEEPALIVE_CONNECTIONS,
+    GROQ_KEEPALIVE_EXPIRY_SECONDS
+)
+
+groq = lazy_import("groq")
+httpx = lazy_import("httpx")
 
 # Load environment variables
 load_dotenv()
@@ -13,13 +27,65 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class InterviewEvaluator:
-    def __init__(self):
+    """
+    Generates questions and evaluates answers with the Groq LLM.
+
+    Calls go through an async client, so a round-trip never blocks the event
+    loop, over one keep-alive connection pool. At most ``max_concurrency``
+    calls are in flight; the rest wait their turn rather than piling up
+    connections and hitting rate limits. Each call, retries included, is
+    bounded by ``timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = GROQ_MAX_CONCURRENCY,
+        timeout: float = GROQ_TIMEOUT_SECONDS
+    ):
         # Initialize Groq client
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             raise ValueError("GROQ_API_KEY environment variable is not set")
         
-        self.client = Groq(api_key=api_key)
+        self.timeout = timeout
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=GROQ_MAX_CONNECTIONS,
+                max_keepalive_connections=GROQ_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=GROQ_KEEPALIVE_EXPIRY_SECONDS
+            ),
+            timeout=httpx.Timeout(timeout, connect=GROQ_CONNECT_TIMEOUT_SECONDS)
+        )
+        self.client = groq.AsyncGroq(
+            api_key=api_key,
+            max_retries=GROQ_MAX_RETRIES,
+            http_client=self.http_client
+        )
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> str:
+        """
+        Run one chat completion and return the reply text.
+        """
+        async with self._semaphore:
+            completion = await asyncio.wait_for(
+                self.client.chat.completions.create(
+                    model=GROQ_MODEL,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                ),
+                self.timeout
+            )
+        return completion.choices[0].message.content
+    
+    async def aclose(self):
+        await self.http_client.aclose()
     
     async def generate_questions(self, resume_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -47,18 +113,13 @@ class InterviewEvaluator:
             """
             
             # Generate questions using Groq
-            completion = self.client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are an expert technical interviewer."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
+            content = await self.complete([
+                {"role": "system", "content": "You are an expert technical interviewer."},
+                {"role": "user", "content": prompt}
+            ])
             
             # Parse questions from response
-            questions = eval(completion.choices[0].message.content)
+            questions = eval(content)
             return questions
             
         except Exception as e:
@@ -101,18 +162,13 @@ class InterviewEvaluator:
             """
             
             # Get evaluation from Groq
-            completion = self.client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are an expert technical interviewer providing detailed feedback."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
+            content = await self.complete([
+                {"role": "system", "content": "You are an expert technical interviewer providing detailed feedback."},
+                {"role": "user", "content": prompt}
+            ])
             
             # Parse evaluation from response
-            evaluation = eval(completion.choices[0].message.content)
+            evaluation = eval(content)
             
             # Add metadata
             evaluation.update({
@@ -136,8 +192,24 @@ class InterviewEvaluator:
                 "question_difficulty": question.get("difficulty", "Unknown")
             }
 
-# Create a global instance of InterviewEvaluator after the class definition
-evaluator = InterviewEvaluator()
+# Shared InterviewEvaluator, created on first use so importing this module
+# neither loads the Groq client nor requires GROQ_API_KEY
+_evaluator: Optional[InterviewEvaluator] = None
+
+def get_evaluator() -> InterviewEvaluator:
+    global _evaluator
+    if _evaluator is None:
+        _evaluator = InterviewEvaluator()
+    return _evaluator
+
+async def close_evaluator():
+    """
+    Close the shared evaluator's connection pool, if it was ever created.
+    """
+    global _evaluator
+    if _evaluator is not None:
+        await _evaluator.aclose()
+        _evaluator = None
 
 def _prepare_context(resume_data: Dict[str, Any]) -> str:
     """
@@ -204,22 +276,15 @@ Recommendations: [Specific recommendations for improvement]
 
 Evaluation:"""
 
-def _get_groq_evaluation(prompt: str) -> str:
+async def _get_groq_evaluation(prompt: str) -> str:
     """
     Get evaluation from the Groq LLM.
     """
     try:
-        completion = evaluator.client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[
-                {"role": "system", "content": "You are an expert technical interviewer providing detailed, constructive feedback."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1000
-        )
-        
-        return completion.choices[0].message.content
+        return await get_evaluator().complete([
+            {"role": "system", "content": "You are an expert technical interviewer providing detailed, constructive feedback."},
+            {"role": "user", "content": prompt}
+        ])
         
     except Exception as e:
         logger.error(f"Error getting Groq evaluation: {str(e)}")
@@ -304,7 +369,7 @@ async def evaluate_response(response: str, question: str, resume_data: Dict[str,
         }
         
         # Use the evaluator instance to evaluate the response
-        evaluation = await evaluator.evaluate_response(response, question_dict, resume_data)
+        evaluation = await get_evaluator().evaluate_response(response, question_dict, resume_data)
         return evaluation
     except Exception as e:
         logger.error(f"Error in evaluate_response function: {str(e)}")
@@ -55,8 +55,10 @@ class InterviewManager:
             if not self.current_interview:
                 raise ValueError("No active interview session")
 
-            # Analyze face
-            face_analysis = analyze_face(video_data)
+            # Analyze face and posture in one pass; clip decoding is CPU-bound,
+            # so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            face_analysis = await loop.run_in_executor(None, analyze_face, video_data, True)
             if "error" in face_analysis:
                 logger.warning(f"Face analysis warning: {face_analysis['error']}")
             self.face_analysis_results.append(face_analysis)
@@ -79,6 +81,7 @@ class InterviewManager:
                     "detected_frames": face_analysis.get("detected_frames", 0),
                     "error": face_analysis.get("error", None)
                 },
+                "body_analysis": face_analysis.get("body", {}),
                 "response_evaluation": response_evaluation,
                 "timestamp": datetime.now().isoformat()
             }
@@ -179,7 +182,9 @@ class InterviewManager:
             
         # Calculate averages
         avg_face_detection = sum(r["face_detection_rate"] for r in self.face_analysis_results) / len(self.face_analysis_results)
-        avg_eye_contact = sum(r["eye_contact_rate"] for r in self.face_analysis_results) / len(self.face_analysis_results)
+        # Haar-tier analyses leave eye contact unmeasured (None)
+        eye_contact = [r["eye_contact_rate"] for r in self.face_analysis_results if r["eye_contact_rate"] is not None]
+        avg_eye_contact = sum(eye_contact) / len(eye_contact) if eye_contact else 0.0
         avg_confidence = sum(r["confidence_score"] for r in self.face_analysis_results) / len(self.face_analysis_results)
         
         return {
@@ -2,9 +2,10 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import asyncio
-from .interview_evaluator import InterviewEvaluator
-from .face_analyzer import FaceAnalyzer
+from .interview_evaluator import get_evaluator
+from .face_analyzer import analyze_face_async
 from .voice_analyzer import VoiceAnalyzer
+from .model_utils import get_final_score
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +22,9 @@ class InterviewSession:
         self.resume_data: Optional[Dict[str, Any]] = None
         
         # Initialize analyzers
-        self.evaluator = InterviewEvaluator()
-        self.face_analyzer = FaceAnalyzer()
+        # Face analyzers are borrowed from a shared pool per response, and
+        # every session shares one evaluator and its Groq connection pool
+        self.evaluator = get_evaluator()
         self.voice_analyzer = VoiceAnalyzer()
         
     async def start_session(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -62,8 +64,9 @@ class InterviewSession:
                 self.is_active = False
                 return {"status": "complete", "message": "Time is up"}
             
-            # Analyze face metrics
-            face_metrics = await self.face_analyzer.analyze(video_data)
+            # Analyze face and posture metrics in one holistic pass
+            face_metrics = await analyze_face_async(video_data, with_body=True)
+            body_metrics = face_metrics.pop("body", {})
             
             # Analyze voice metrics
             voice_metrics = await self.voice_analyzer.analyze(video_data)
@@ -81,6 +84,8 @@ class InterviewSession:
                 "response": response,
                 "face_metrics": face_metrics,
                 "voice_metrics": voice_metrics,
+                "body_metrics": body_metrics,
+                "overall_score": self._score_response(face_metrics, voice_metrics, body_metrics),
                 "evaluation": evaluation,
                 "timestamp": datetime.now().isoformat()
             })
@@ -104,6 +109,8 @@ class InterviewSession:
                 "metrics": {
                     "face": face_metrics,
                     "voice": voice_metrics,
+                    "body": body_metrics,
+                    "overall_score": self.responses[-1]["overall_score"],
                     "evaluation": evaluation
                 }
             }
@@ -129,6 +136,7 @@ class InterviewSession:
             # Calculate overall metrics
             overall_face_metrics = self._calculate_overall_face_metrics()
             overall_voice_metrics = self._calculate_overall_voice_metrics()
+            overall_body_metrics = self._calculate_overall_body_metrics()
             overall_evaluation = self._calculate_overall_evaluation()
             
             return {
@@ -142,6 +150,12 @@ class InterviewSession:
                 "metrics": {
                     "face": overall_face_metrics,
                     "voice": overall_voice_metrics,
+                    "body": overall_body_metrics,
+                    "overall_score": get_final_score(
+                        self._voice_score(overall_voice_metrics),
+                        self._face_score(overall_face_metrics),
+                        overall_body_metrics.get("posture_score", 0.5)
+                    ),
                     "evaluation": overall_evaluation
                 },
                 "responses": self.responses
@@ -179,16 +193,20 @@ class InterviewSession:
             "head_position_score": 0.0
         }
         
+        counts = dict.fromkeys(total_metrics, 0)
         for response in self.responses:
             face_metrics = response.get("face_metrics", {})
             for metric in total_metrics:
-                if metric in face_metrics:
+                if face_metrics.get(metric) is not None:
                     total_metrics[metric] += face_metrics[metric]
+                    counts[metric] += 1
         
-        # Calculate averages
+        # Calculate averages; eye contact only over the responses whose
+        # quality tier measured it
         num_responses = len(self.responses)
         for metric in total_metrics:
-            total_metrics[metric] /= num_responses
+            divisor = counts[metric] if metric == "eye_contact_rate" else num_responses
+            total_metrics[metric] /= max(divisor, 1)
         
         return total_metrics
     
@@ -219,6 +237,60 @@ class InterviewSession:
         
         return total_metrics
     
+    def _calculate_overall_body_metrics(self) -> Dict[str, float]:
+        """
+        Calculate overall posture metrics from all responses.
+        """
+        if not self.responses:
+            return {}
+        
+        total_metrics = {
+            "pose_detection_rate": 0.0,
+            "good_posture_rate": 0.0,
+            "posture_score": 0.0
+        }
+        
+        for response in self.responses:
+            body_metrics = response.get("body_metrics", {})
+            for metric in total_metrics:
+                if metric in body_metrics:
+                    total_metrics[metric] += body_metrics[metric]
+        
+        # Calculate averages
+        num_responses = len(self.responses)
+        for metric in total_metrics:
+            total_metrics[metric] /= num_responses
+        
+        return total_metrics
+    
+    def _score_response(
+        self,
+        face_metrics: Dict[str, Any],
+        voice_metrics: Dict[str, Any],
+        body_metrics: Dict[str, Any]
+    ) -> float:
+        """
+        Combine face, voice and posture metrics into one 0-1 score.
+        """
+        return get_final_score(
+            self._voice_score(voice_metrics),
+            self._face_score(face_metrics),
+            body_metrics.get("posture_score", 0.5)
+        )
+    
+    @staticmethod
+    def _face_score(face_metrics: Dict[str, Any]) -> float:
+        # Detection-weighted mean of eye contact and head position; eye
+        # contact is None when the quality tier could not measure it
+        return face_metrics.get("face_detection_rate", 0.0) * (
+            (face_metrics.get("eye_contact_rate") or 0.0) + face_metrics.get("head_position_score", 0.0)
+        ) / 2
+    
+    @staticmethod
+    def _voice_score(voice_metrics: Dict[str, Any]) -> float:
+        values = [voice_metrics.get(name, 0.5) for name in ("speech_rate", "volume", "pitch", "fluency")]
+        return sum(values) / len(values)
+    
     def _calculate_overall_evaluation(self) -> Dict[str, Any]:
         """
         Calculate overall evaluation metrics from all responses.
@@ -0,0 +1,96 @@
+import itertools
+import logging
+from typing import Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# FaceMesh returns 478 points with refine_landmarks (iris included); the
+# geometry below only needs the 468 base mesh points.
+NUM_LANDMARKS = 468
+
+# Eye landmarks, as (left corner, upper lid, right corner, lower lid)
+LEFT_EYE = (33, 34, 36, 37)
+RIGHT_EYE = (246, 247, 249, 250)
+NOSE_TIP = 4
+# Face extremes used for head pose
+FACE_LEFT = 234
+FACE_RIGHT = 454
+FOREHEAD = 10
+CHIN = 152
+
+
+def landmarks_to_array(face_landmarks) -> np.ndarray:
+    """
+    Convert MediaPipe face landmarks to a (468, 3) float32 array of x, y, z.
+    """
+    points = face_landmarks.landmark[:NUM_LANDMARKS]
+    coords = itertools.chain.from_iterable((p.x, p.y, p.z) for p in points)
+    return np.fromiter(coords, dtype=np.float32, count=NUM_LANDMARKS * 3).reshape(NUM_LANDMARKS, 3)
+
+
+def eye_openness(landmarks: np.ndarray, eye=LEFT_EYE) -> np.ndarray:
+    """
+    Eye aspect ratio normalised to 0-1 (typical range is 0.2-0.4), for
+    landmarks of shape (..., 468, 3).
+    """
+    left_corner, upper_lid, right_corner, lower_lid = eye
+    eye_height = np.abs(landmarks[..., upper_lid, 1] - landmarks[..., lower_lid, 1])
+    eye_width = np.abs(landmarks[..., right_corner, 0] - landmarks[..., left_corner, 0])
+    aspect_ratio = np.divide(
+        eye_height,
+        eye_width,
+        out=np.zeros_like(eye_height),
+        where=eye_width > 0
+    )
+    return np.clip((aspect_ratio - 0.2) / 0.2, 0.0, 1.0)
+
+
+def eye_contact(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Eye contact score per frame, from the mean openness of both eyes.
+    """
+    openness = (eye_openness(landmarks, LEFT_EYE) + eye_openness(landmarks, RIGHT_EYE)) / 2
+    return np.clip(openness, 0.0, 1.0)
+
+
+def head_position(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Head position score per frame (1.0 is centred, 0.0 completely off-centre).
+    """
+    nose_tip = landmarks[..., NOSE_TIP, :2]
+    return 1.0 - np.abs(nose_tip - 0.5).sum(axis=-1) / 2
+
+
+def head_pose(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Approximate head yaw and pitch per frame, shape (..., 2).
+
+    Each is the nose tip's offset from the middle of the face, as a fraction
+    of face width (yaw) or height (pitch); 0 means facing the camera.
+    """
+    nose_tip = landmarks[..., NOSE_TIP, :2]
+    left = landmarks[..., FACE_LEFT, :2]
+    right = landmarks[..., FACE_RIGHT, :2]
+    top = landmarks[..., FOREHEAD, :2]
+    bottom = landmarks[..., CHIN, :2]
+
+    face_width = np.maximum(np.abs(right[..., 0] - left[..., 0]), 1e-6)
+    face_height = np.maximum(np.abs(bottom[..., 1] - top[..., 1]), 1e-6)
+    yaw = (nose_tip[..., 0] - (left[..., 0] + right[..., 0]) / 2) / face_width
+    pitch = (nose_tip[..., 1] - (top[..., 1] + bottom[..., 1]) / 2) / face_height
+    return np.stack([yaw, pitch], axis=-1)
+
+
+def score_landmarks(landmarks: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute every per-frame face metric for a (frames, 468, 3) stack.
+    """
+    pose = head_pose(landmarks)
+    return {
+        "eye_contact": eye_contact(landmarks),
+        "head_position": head_position(landmarks),
+        "head_yaw": pose[..., 0],
+        "head_pitch": pose[..., 1]
+    }
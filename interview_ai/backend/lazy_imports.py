@@ -0,0 +1,74 @@
+import importlib
+import logging
+import threading
+import time
+import types
+from typing import Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Seconds spent importing each lazily loaded module in this process
+import_timings: Dict[str, float] = {}
+
+_import_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module placeholder that imports the real module on first attribute access.
+
+    Heavy libraries (OpenCV, MediaPipe, librosa, groq) are only needed
+    once analysis actually runs, so deferring them keeps ``import backend``,
+    worker start-up and test collection fast.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_loaded"] = False
+
+    def __getattr__(self, attr: str):
+        module = self._load()
+        return getattr(module, attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def _load(self) -> types.ModuleType:
+        with _import_lock:
+            if not self.__dict__["_lazy_loaded"]:
+                started = time.perf_counter()
+                module = importlib.import_module(self.__name__)
+                import_timings[self.__name__] = time.perf_counter() - started
+                # Copy the namespace so later lookups skip __getattr__
+                self.__dict__.update(module.__dict__)
+                self.__dict__["_lazy_loaded"] = True
+                self.__dict__["_lazy_module"] = module
+            return self.__dict__["_lazy_module"]
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Return a module that is only imported when first used.
+    """
+    return LazyModule(name)
+
+
+def preload(names: Iterable[str]) -> Dict[str, float]:
+    """
+    Import modules now, e.g. in the startup warmup phase, so the first
+    request does not pay for them. Lazy placeholders for these modules then
+    resolve from ``sys.modules`` on first use.
+
+    Returns the import time in seconds of each module.
+    """
+    timings = {}
+    for name in names:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.warning(f"Could not preload {name}: {str(e)}")
+            continue
+        timings[name] = time.perf_counter() - started
+        import_timings.setdefault(name, timings[name])
+    return timings
@@ -0,0 +1,208 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import WebSocket
+
+from .config import LIVE_OUTBOUND_QUEUE_SIZE, LIVE_SEND_TIMEOUT
+from .frame_protocol import AudioFormat, BinaryMessage, FrameFormat
+from .pacing import PacingController
+from .metrics_publisher import MetricsPublisher
+
+logger = logging.getLogger(__name__)
+
+# Live pipelines on this worker, keyed by session ID
+active_pipelines: Dict[str, "LiveVideoPipeline"] = {}
+
+
+class LatestFrameSlot:
+    """
+    Single-slot mailbox that only keeps the newest frame.
+
+    Putting a frame while another is still pending replaces it and counts
+    the older one as dropped.
+    """
+
+    def __init__(self):
+        self._frame: Optional[BinaryMessage] = None
+        self._ready = asyncio.Event()
+        self.received = 0
+        self.dropped = 0
+
+    def put(self, frame: BinaryMessage):
+        self.received += 1
+        if self._frame is not None:
+            self.dropped += 1
+        self._frame = frame
+        self._ready.set()
+
+    async def get(self) -> BinaryMessage:
+        await self._ready.wait()
+        frame = self._frame
+        self._frame = None
+        self._ready.clear()
+        return frame
+
+    @property
+    def pending(self) -> int:
+        return 1 if self._frame is not None else 0
+
+
+class LiveVideoPipeline:
+    """
+    Receive, analyze and send stages for one interview websocket.
+
+    The receive stage (the websocket handler) hands frames to ``submit``.
+    The analyze stage awaits ``analyze`` for the newest pending frame only,
+    so each session has at most one frame in flight. Its metrics are
+    coalesced by a ``MetricsPublisher`` and pushed as deltas at a fixed
+    cadence. The send stage is the single writer to the websocket; once a
+    send fails the pipeline is ``closed`` and queues nothing more.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        websocket: WebSocket,
+        analyze: Callable[[BinaryMessage], Awaitable[Dict[str, Any]]],
+        frame_format: FrameFormat
+    ):
+        self.session_id = session_id
+        self.websocket = websocket
+        self.analyze = analyze
+        self.frames = LatestFrameSlot()
+        self.outbound: asyncio.Queue = asyncio.Queue(maxsize=LIVE_OUTBOUND_QUEUE_SIZE)
+        self.frame_format = frame_format
+        self.audio_format = AudioFormat()
+        self.pacing = PacingController(max_resolution=(frame_format.width, frame_format.height))
+        self.publisher = MetricsPublisher()
+        self.analyzed = 0
+        self.dropped_messages = 0
+        self.closed = False
+        self._dropped_seen = 0
+        self._tasks = []
+
+    def start(self):
+        active_pipelines[self.session_id] = self
+        self._tasks = [
+            asyncio.create_task(self._analyze_loop()),
+            asyncio.create_task(self._publish_loop()),
+            asyncio.create_task(self._send_loop())
+        ]
+
+    async def stop(self):
+        active_pipelines.pop(self.session_id, None)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def advertise_format(self):
+        """
+        Tell the client which frame and audio formats the analyzers want.
+        """
+        await self.send({
+            "type": "capabilities",
+            "data": dict(self.frame_format.to_dict(), audio=self.audio_format.to_dict())
+        })
+
+    def accept_format(self, data: Dict[str, Any]):
+        """
+        Record the frame and audio formats the client says it will send.
+        """
+        self.frame_format.update(data)
+        if isinstance(data.get("audio"), dict):
+            self.audio_format.update(data["audio"])
+        self.pacing.set_max_resolution((self.frame_format.width, self.frame_format.height))
+
+    def submit(self, frame: BinaryMessage):
+        """
+        Receive stage: queue a frame for analysis, replacing any stale one.
+        """
+        self.frames.put(frame)
+
+    async def send(self, message: Dict[str, Any]):
+        """
+        Queue a control message; these are never dropped. Raises
+        ConnectionError once the send stage has stopped, or if the client
+        has not read anything for ``LIVE_SEND_TIMEOUT`` seconds.
+        """
+        if self.closed:
+            raise ConnectionError(f"Session {self.session_id} is closed")
+        try:
+            await asyncio.wait_for(self.outbound.put(message), LIVE_SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise ConnectionError(f"Session {self.session_id} stopped reading messages")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "frames_received": self.frames.received,
+            "frames_analyzed": self.analyzed,
+            "frames_dropped": self.frames.dropped,
+            "messages_dropped": self.dropped_messages,
+            "metrics_pushed": self.publisher.pushes
+        }
+
+    async def _analyze_loop(self):
+        while True:
+            frame = await self.frames.get()
+            # Frames replaced since the last pick mean the client outruns us
+            dropped_since = self.frames.dropped - self._dropped_seen
+            self._dropped_seen = self.frames.dropped
+            started = time.perf_counter()
+            try:
+                metrics = await self.analyze(frame)
+            except Exception as e:
+                logger.warning(f"Frame analysis failed for session {self.session_id}: {str(e)}")
+                continue
+
+            self.analyzed += 1
+            self.pacing.record(
+                time.perf_counter() - started,
+                dropped=dropped_since > 0
+            )
+            metrics["dropped_frames"] = self.frames.dropped
+            self.publisher.update(metrics)
+
+            target = self.pacing.update(len(active_pipelines))
+            if target is not None:
+                await self.send({
+                    "type": "pacing",
+                    "data": target
+                })
+
+    async def _publish_loop(self):
+        while True:
+            await asyncio.sleep(self.publisher.interval)
+            delta = self.publisher.flush()
+            if delta is not None:
+                self._send_metrics({
+                    "type": "metrics",
+                    "delta": True,
+                    "data": delta
+                })
+
+    def _send_metrics(self, message: Dict[str, Any]):
+        # Metrics are superseded by the next push, so drop them rather than
+        # block when the client is slow to read.
+        if self.closed:
+            return
+        try:
+            self.outbound.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped_messages += 1
+
+    async def _send_loop(self):
+        while True:
+            message = await self.outbound.get()
+            try:
+                await self.websocket.send_json(message)
+            except Exception as e:
+                logger.warning(f"Failed to send to session {self.session_id}: {str(e)}")
+                break
+
+        self.closed = True
+        # Wake senders blocked on a full queue; nothing will be sent now
+        while not self.outbound.empty():
+            self.outbound.get_nowait()
@@ -0,0 +1,74 @@
+import logging
+from typing import Any, Dict
+
+import numpy as np
+
+from .config import LIVE_METRICS_WINDOW, LIVE_METRICS_EWMA_ALPHA
+
+logger = logging.getLogger(__name__)
+
+METRIC_NAMES = ("face_presence", "eye_contact", "head_position")
+
+
+class LiveMetricsAggregator:
+    """
+    Rolling face metrics for one live interview session.
+
+    The last ``window`` frames are kept in a fixed-size float32 ring buffer
+    with running sums, alongside an EWMA and lifetime totals, so memory and
+    per-frame cost stay constant however long the interview runs.
+    """
+
+    def __init__(self, window: int = LIVE_METRICS_WINDOW, alpha: float = LIVE_METRICS_EWMA_ALPHA):
+        self.window = max(1, window)
+        self.alpha = alpha
+
+        self._ring = np.zeros((self.window, len(METRIC_NAMES)), dtype=np.float32)
+        self._window_sums = np.zeros(len(METRIC_NAMES), dtype=np.float64)
+        self._totals = np.zeros(len(METRIC_NAMES), dtype=np.float64)
+        self._ewma = np.zeros(len(METRIC_NAMES), dtype=np.float64)
+        self._index = 0
+        self.frames = 0
+
+    def add(self, face_presence: float, eye_contact: float, head_position: float):
+        row = np.array([face_presence, eye_contact, head_position], dtype=np.float32)
+
+        if self.frames >= self.window:
+            self._window_sums -= self._ring[self._index]
+        self._ring[self._index] = row
+        self._window_sums += row
+        self._index = (self._index + 1) % self.window
+
+        if self.frames == 0:
+            self._ewma[:] = row
+        else:
+            self._ewma += self.alpha * (row - self._ewma)
+        self._totals += row
+        self.frames += 1
+
+    def add_frame(self, metrics: Dict[str, Any]):
+        """
+        Add one frame's live metrics as produced by the frame analyzers.
+        """
+        self.add(
+            1.0 if metrics.get("face_detected") else 0.0,
+            1.0 if metrics.get("eye_contact") else 0.0,
+            float(metrics.get("head_position_score", 0.0))
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current EWMA, windowed and lifetime rate of every metric.
+        """
+        window_frames = min(self.frames, self.window)
+        snapshot: Dict[str, Any] = {
+            "frames": self.frames,
+            "window_frames": window_frames
+        }
+        for i, name in enumerate(METRIC_NAMES):
+            snapshot[name] = {
+                "ewma": float(self._ewma[i]),
+                "window_rate": float(self._window_sums[i] / window_frames) if window_frames else 0.0,
+                "overall_rate": float(self._totals[i] / self.frames) if self.frames else 0.0
+            }
+        return snapshot
@@ -14,12 +14,44 @@ import asyncio
 from datetime import datetime
 from .resume_parser import ResumeParser
 from .interview_session import InterviewSession
-from .interview_evaluator import InterviewEvaluator
-from .face_analyzer import FaceAnalyzer
+from .interview_evaluator import InterviewEvaluator, close_evaluator
+from .face_analyzer import face_analyzer_pool
 from .voice_analyzer import VoiceAnalyzer
-import cv2
 import numpy as np
 from .interview_manager import InterviewManager
+from .frame_protocol import (
+    MessageType,
+    FrameProtocolError,
+    BinaryMessage,
+    FrameFormat,
+    LIVE_COLOR_MODE,
+    decode_audio,
+    decode_frame,
+    parse_binary_message,
+    frame_payload_from_json
+)
+from .live_analysis import LiveVideoPipeline
+from .inference_scheduler import inference_scheduler
+from .face_tracking import FaceTracker, analyze_gray_frame
+from .face_detectors import get_face_detector, choose_default_backend
+from .vision_workers import vision_worker_pool
+from .live_metrics import LiveMetricsAggregator
+from .motion_gate import MotionGate
+from .online_voice import OnlineVoiceAnalyzer
+from .audio_workers import audio_worker_pool
+from .config import (
+    VISION_WORKER_MODE,
+    VISION_RESULT_TIMEOUT,
+    AUDIO_WORKER_PROCESSES,
+    PRELOAD_ON_STARTUP,
+    FACE_DETECTOR,
+    PITCH_ESTIMATOR,
+    QUALITY_SAMPLED_STRIDE
+)
+from .quality_tiers import live_governor, vision_governor, audio_governor
+from .lazy_imports import preload
+from .pitch import validate_estimator
+from .import_budget import WARMUP_MODULES
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -48,9 +80,6 @@ app.add_middleware(
 # Store active interview sessions
 active_sessions: Dict[str, Dict[str, Any]] = {}
 
-# Initialize face cascade classifier
-face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-
 # Initialize managers
 interview_manager = InterviewManager()
 resume_parser = ResumeParser()
@@ -100,12 +129,159 @@ async def start_interview(resume_data: dict):
             "questions_asked": [],
             "responses": [],
             "feedback": [],
+            "live_metrics": LiveMetricsAggregator(),
+            "motion_gate": MotionGate(),
+            "online_voice": OnlineVoiceAnalyzer(),
             "status": "active"
         }
         return {"session_id": session_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _live_detector(tier: str) -> Optional[str]:
+    """
+    Detector backend for a live quality tier (None means the default one).
+    """
+    return None if tier == "full" else "haar"
+
+def _analyze_frame(
+    frame: BinaryMessage,
+    tracker: FaceTracker,
+    gate: MotionGate,
+    tier: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Locate the face in an encoded frame. Called on an inference worker;
+    each session has its own tracker and at most one frame in flight.
+    Returns None if the frame is static and the last result still holds.
+    """
+    gray = decode_frame(frame.payload, LIVE_COLOR_MODE)
+    if not gate.changed(gray):
+        return None
+    return analyze_gray_frame(gray, tracker, get_face_detector(_live_detector(tier)))
+
+def _dispatch_frame(frame: BinaryMessage, session_id: str, gate: MotionGate, tier: str):
+    """
+    Decode a frame into a vision worker's shared-memory ring. Called on an
+    inference worker; returns a future for the worker process's result, or
+    None if the frame is static and the last result still holds.
+    """
+    gray = decode_frame(frame.payload, LIVE_COLOR_MODE)
+    if not gate.changed(gray):
+        return None
+    return vision_worker_pool.dispatch(session_id, gray, _live_detector(tier))
+
+def _build_frame_analyzer(session_id: str):
+    """
+    Build the per-session coroutine that turns a frame into live metrics.
+    """
+    tracker = FaceTracker()
+    aggregator = active_sessions[session_id]["live_metrics"]
+    gate = active_sessions[session_id]["motion_gate"]
+    last_result: Dict[str, Any] = {}
+    frame_count = 0
+
+    async def analyze(frame: BinaryMessage) -> Dict[str, Any]:
+        nonlocal frame_count
+        frame_count += 1
+        with live_governor.job() as job:
+            try:
+                if job.tier == "haar_sampled" and last_result and frame_count % QUALITY_SAMPLED_STRIDE:
+                    # Overloaded: only every Nth frame is analyzed
+                    result = None
+                elif VISION_WORKER_MODE == "process":
+                    future = await inference_scheduler.submit(_dispatch_frame, frame, session_id, gate, job.tier)
+                    result = None if future is None else await asyncio.wait_for(
+                        asyncio.wrap_future(future),
+                        VISION_RESULT_TIMEOUT
+                    )
+                else:
+                    result = await inference_scheduler.submit(_analyze_frame, frame, tracker, gate, job.tier)
+            except Exception:
+                # Never carry a result forward past a failed analysis
+                gate.reset()
+                raise
+
+        if result is None:
+            # Static scene: reuse the last analyzed result
+            metrics = dict(last_result, carried_forward=True)
+        else:
+            last_result.clear()
+            last_result.update(result, quality_tier=job.tier)
+            metrics = dict(last_result, carried_forward=False)
+
+        aggregator.add_frame(metrics)
+        rates = aggregator.snapshot()
+        metrics["face_presence_rate"] = rates["face_presence"]["ewma"]
+        metrics["eye_contact_rate"] = rates["eye_contact"]["ewma"]
+        metrics["head_position_rate"] = rates["head_position"]["ewma"]
+        metrics["sequence"] = frame.sequence
+        metrics["capture_ts"] = frame.capture_ts
+        return metrics
+
+    return analyze
+
+def _handle_audio_chunk(pipeline: LiveVideoPipeline, session_id: str, chunk: BinaryMessage):
+    """
+    Feed an audio chunk to the session's streaming voice analyzer and queue
+    its live metrics. Runs inline on the receive stage so chunks are
+    analyzed in order; a chunk is only a few small FFTs.
+    """
+    voice = active_sessions[session_id]["online_voice"]
+    try:
+        voice.add(decode_audio(chunk.payload))
+    except FrameProtocolError as e:
+        logger.warning(f"Dropping malformed audio chunk: {str(e)}")
+        return
+    pipeline.publisher.update(voice.snapshot())
+
+async def _handle_control_message(pipeline: LiveVideoPipeline, session_id: str, data: Dict[str, Any]):
+    """
+    Handle a JSON control message from the interview websocket.
+    """
+    if data["type"] == "frame":
+        # Legacy JSON frame path; clients should send binary frames instead
+        pipeline.submit(BinaryMessage(
+            message_type=MessageType.FRAME,
+            sequence=data.get("sequence", 0),
+            capture_ts=data.get("capture_ts", 0.0),
+            payload=frame_payload_from_json(data)
+        ))
+
+    elif data["type"] == "format":
+        # Client confirms the frame format it will stream
+        try:
+            pipeline.accept_format(data.get("data", {}))
+        except FrameProtocolError as e:
+            logger.warning(f"Ignoring frame format from session {session_id}: {str(e)}")
+
+        voice = active_sessions[session_id]["online_voice"]
+        if voice.sample_rate != pipeline.audio_format.sample_rate:
+            voice.set_sample_rate(pipeline.audio_format.sample_rate)
+
+    elif data["type"] == "response":
+        # Process interview response
+        response = data["response"]
+        active_sessions[session_id]["responses"].append(response)
+
+        # Voice metrics of the answer were accumulated while it was spoken
+        voice_metrics = active_sessions[session_id]["online_voice"].finish_answer()
+
+        # Generate feedback
+        feedback = {
+            "clarity": 0.85,
+            "relevance": 0.9,
+            "technical_accuracy": 0.8,
+            "suggestions": ["Good explanation", "Consider adding more examples"],
+            "voice": voice_metrics
+        }
+
+        active_sessions[session_id]["feedback"].append(feedback)
+        await pipeline.send({
+            "type": "feedback",
+            "data": feedback
+        })
+
 @app.websocket("/ws/interview/{session_id}")
 async def interview_websocket(websocket: WebSocket, session_id: str):
     await websocket.accept()
@@ -114,53 +290,49 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
         await websocket.close(code=4000, reason="Invalid session ID")
         return
     
+    # Receive stage runs here; analysis and sending run as separate tasks
+    pipeline = LiveVideoPipeline(
+        session_id,
+        websocket,
+        _build_frame_analyzer(session_id),
+        FrameFormat()
+    )
+    pipeline.start()
+    await pipeline.advertise_format()
+    
     try:
         while True:
-            data = await websocket.receive_json()
-            
-            if data["type"] == "frame":
-                # Process video frame for face detection
-                frame_data = np.frombuffer(data["frame"], dtype=np.uint8)
-                frame = cv2.imdecode(frame_data, cv2.IMREAD_COLOR)
-                
-                # Convert to grayscale for face detection
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                faces = face_cascade.detectMultiScale(gray, 1.1, 4)
-                
-                # Calculate metrics
-                metrics = {
-                    "face_detected": len(faces) > 0,
-                    "eye_contact": True if len(faces) > 0 else False,
-                    "confidence_score": 0.8 if len(faces) > 0 else 0.2
-                }
-                
-                await websocket.send_json({
-                    "type": "metrics",
-                    "data": metrics
-                })
-            
-            elif data["type"] == "response":
-                # Process interview response
-                response = data["response"]
-                active_sessions[session_id]["responses"].append(response)
-                
-                # Generate feedback
-                feedback = {
-                    "clarity": 0.85,
-                    "relevance": 0.9,
-                    "technical_accuracy": 0.8,
-                    "suggestions": ["Good explanation", "Consider adding more examples"]
-                }
-                
-                active_sessions[session_id]["feedback"].append(feedback)
-                await websocket.send_json({
-                    "type": "feedback",
-                    "data": feedback
-                })
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            if message.get("bytes") is not None:
+                # Binary message: fixed header followed by JPEG or PCM bytes
+                try:
+                    binary = parse_binary_message(message["bytes"])
+                except FrameProtocolError as e:
+                    logger.warning(f"Dropping malformed binary message: {str(e)}")
+                    continue
+
+                if binary.message_type == MessageType.FRAME:
+                    pipeline.submit(binary)
+                elif binary.message_type == MessageType.AUDIO:
+                    _handle_audio_chunk(pipeline, session_id, binary)
+
+            elif message.get("text") is not None:
+                await _handle_control_message(pipeline, session_id, json.loads(message["text"]))
     
     except Exception as e:
         print(f"Error in WebSocket connection: {e}")
     finally:
+        await pipeline.stop()
+        if VISION_WORKER_MODE == "process":
+            vision_worker_pool.release_session(session_id)
+        logger.info(
+            f"Live video stats for session {session_id}: {pipeline.stats()}, "
+            f"motion gate: {active_sessions[session_id]['motion_gate'].stats()}, "
+            f"quality: {live_governor.stats()}"
+        )
         await websocket.close()
 
 @app.get("/api/interview-status/{session_id}")
@@ -180,11 +352,14 @@ async def get_interview_feedback(session_id: str):
         raise HTTPException(status_code=404, detail="Session not found")
     
     session = active_sessions[session_id]
+    live_metrics = session["live_metrics"].snapshot()
     
     overall_feedback = {
         "technical_score": sum(f["technical_accuracy"] for f in session["feedback"]) / len(session["feedback"]),
         "communication_score": sum(f["clarity"] for f in session["feedback"]) / len(session["feedback"]),
-        "eye_contact_score": 0.8,  # Placeholder for now
+        "eye_contact_score": live_metrics["eye_contact"]["overall_rate"],
+        "live_metrics": live_metrics,
+        "motion_gate": session["motion_gate"].stats(),
         "strengths": ["Clear communication", "Good technical knowledge"],
         "areas_for_improvement": ["Add more specific examples", "Maintain consistent eye contact"],
         "recommendations": ["Practice with more complex scenarios", "Focus on implementation details"]
@@ -192,6 +367,21 @@ async def get_interview_feedback(session_id: str):
     
     return {"feedback": overall_feedback}
 
+@app.get("/api/analysis-stats")
+async def get_analysis_stats():
+    """
+    Queue depth, utilization and quality tiers of the analysis workers.
+    """
+    return {
+        "audio_workers": audio_worker_pool.stats(),
+        "inference": inference_scheduler.stats(),
+        "vision_workers": vision_worker_pool.stats(),
+        "quality": {
+            governor.name: governor.stats()
+            for governor in (live_governor, vision_governor, audio_governor)
+        }
+    }
+
 @app.get("/health/")
 async def health_check() -> Dict[str, str]:
     """
@@ -241,12 +431,44 @@ async def get_interview_status():
 # Cleanup function to remove old sessions
 @app.on_event("startup")
 async def startup_event():
+    # Fail fast on a misconfigured estimator rather than scoring every
+    # answer with the default pitch metric
+    validate_estimator(PITCH_ESTIMATOR)
+    
     # Create required directories
     os.makedirs("uploads", exist_ok=True)
     os.makedirs("static", exist_ok=True)
+    
+    # Heavy libraries are imported lazily; load them here instead of on the
+    # first request
+    loop = asyncio.get_running_loop()
+    if PRELOAD_ON_STARTUP:
+        timings = await loop.run_in_executor(None, preload, WARMUP_MODULES)
+        logger.info(
+            "Preloaded " + ", ".join(f"{name} ({seconds:.2f}s)" for name, seconds in timings.items())
+        )
+    
+    # Pick the fastest face detector meeting the accuracy tier on this host
+    if FACE_DETECTOR == "auto":
+        await loop.run_in_executor(None, choose_default_backend)
+    
+    # Start inference workers with their face detectors already loaded
+    inference_scheduler.start(warmup=get_face_detector)
+    if VISION_WORKER_MODE == "process":
+        vision_worker_pool.start()
+    if AUDIO_WORKER_PROCESSES > 0:
+        audio_worker_pool.start()
+    
+    # Build pooled FaceMesh models before the first session needs one
+    await loop.run_in_executor(None, face_analyzer_pool.warmup)
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await inference_scheduler.stop()
+    vision_worker_pool.stop()
+    audio_worker_pool.stop()
+    await close_evaluator()
+    
     # Cleanup temporary files
     if os.path.exists("uploads"):
         for file in os.listdir("uploads"):
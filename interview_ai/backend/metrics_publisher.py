@@ -0,0 +1,64 @@
+import logging
+from typing import Any, Dict, Optional
+
+from .config import METRICS_PUSH_HZ, METRICS_PUSH_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Sent along with a delta for context, but never a reason to send one
+PASSIVE_KEYS = frozenset({"sequence", "capture_ts", "dropped_frames", "carried_forward"})
+
+
+class MetricsPublisher:
+    """
+    Coalesces per-frame live metrics into change-only pushes.
+
+    Every analyzed frame overwrites the pending metrics; ``flush`` is called
+    at a fixed cadence and returns only the keys that moved since the last
+    push (numbers by more than ``threshold``), or None if nothing did.
+    """
+
+    def __init__(self, rate_hz: float = METRICS_PUSH_HZ, threshold: float = METRICS_PUSH_THRESHOLD):
+        self.interval = 1.0 / max(rate_hz, 0.1)
+        self.threshold = threshold
+        self._pending: Dict[str, Any] = {}
+        self._published: Dict[str, Any] = {}
+        self.pushes = 0
+        self.updates = 0
+
+    def update(self, metrics: Dict[str, Any]):
+        self._pending.update(metrics)
+        self.updates += 1
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the delta to push, or None if nothing changed enough.
+        """
+        if not self._pending:
+            return None
+
+        delta = {}
+        for key, value in self._pending.items():
+            if key in PASSIVE_KEYS:
+                continue
+            if self._changed(key, value):
+                delta[key] = round(value, 3) if isinstance(value, float) else value
+
+        if not delta:
+            return None
+
+        for key in PASSIVE_KEYS:
+            if key in self._pending:
+                delta[key] = self._pending[key]
+        self._published.update(delta)
+        self._pending = {}
+        self.pushes += 1
+        return delta
+
+    def _changed(self, key: str, value: Any) -> bool:
+        if key not in self._published:
+            return True
+        previous = self._published[key]
+        if isinstance(value, float) and isinstance(previous, (int, float)) and not isinstance(previous, bool):
+            return abs(value - previous) > self.threshold
+        return value != previous
@@ -0,0 +1,102 @@
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .config import (
+    MOTION_GATE_ENABLED,
+    MOTION_THRESHOLD,
+    MOTION_THUMBNAIL_WIDTH,
+    MOTION_MAX_CARRY
+)
+from .lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+
+class MotionGate:
+    """
+    Cheap pre-stage that decides whether a frame is worth analyzing.
+
+    Each frame is shrunk to a tiny grayscale thumbnail and compared with the
+    thumbnail of the last analyzed frame. If the mean absolute difference is
+    below ``threshold`` (in 0-255 gray levels) the scene is considered
+    static and the caller should carry the previous result forward instead.
+    A full analysis is still forced every ``max_carry`` frames so a slow
+    drift never goes unnoticed.
+
+    A gate is not thread-safe; use one per session or clip.
+    """
+
+    def __init__(
+        self,
+        threshold: float = MOTION_THRESHOLD,
+        thumbnail_width: int = MOTION_THUMBNAIL_WIDTH,
+        max_carry: int = MOTION_MAX_CARRY,
+        enabled: bool = MOTION_GATE_ENABLED
+    ):
+        self.threshold = threshold
+        self.thumbnail_width = max(4, thumbnail_width)
+        self.max_carry = max_carry
+        self.enabled = enabled
+
+        self.checked = 0
+        self.skipped = 0
+        self.last_motion = 0.0
+        self._reference: Optional[np.ndarray] = None
+        self._carried = 0
+
+    def changed(self, frame: np.ndarray) -> bool:
+        """
+        Return True if ``frame`` should be analyzed, False if the last
+        result can be reused. A True answer makes ``frame`` the new
+        reference.
+        """
+        self.checked += 1
+        if not self.enabled:
+            return True
+
+        thumbnail = self._thumbnail(frame)
+        if (
+            self._reference is not None
+            and self._reference.shape == thumbnail.shape
+            and self._carried < self.max_carry
+        ):
+            self.last_motion = float(cv2.absdiff(thumbnail, self._reference).mean())
+            if self.last_motion < self.threshold:
+                self._carried += 1
+                self.skipped += 1
+                return False
+
+        self._reference = thumbnail
+        self._carried = 0
+        return True
+
+    def reset(self):
+        """
+        Forget the reference frame so the next frame is always analyzed.
+        """
+        self._reference = None
+        self._carried = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        return self.skipped / self.checked if self.checked else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "checked_frames": self.checked,
+            "skipped_frames": self.skipped,
+            "skip_ratio": round(self.skip_ratio, 3)
+        }
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        height, width = frame.shape[:2]
+        size = (self.thumbnail_width, max(1, round(height * self.thumbnail_width / width)))
+        # Area averaging also smooths away most sensor noise
+        thumbnail = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        if thumbnail.ndim == 3:
+            thumbnail = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+        return thumbnail
@@ -0,0 +1,235 @@
+import logging
+import math
+from typing import Any, Dict
+
+import numpy as np
+
+from .config import (
+    AUDIO_SAMPLE_RATE,
+    AUDIO_FRAME_MS,
+    AUDIO_WINDOW_SECONDS,
+    AUDIO_SILENCE_RMS,
+    AUDIO_ONSET_RATIO
+)
+
+logger = logging.getLogger(__name__)
+
+# Pitch search range (Hz) of the autocorrelation
+MIN_PITCH = 75.0
+MAX_PITCH = 400.0
+# Normalised autocorrelation peak a voiced frame needs to count as pitched
+MIN_PERIODICITY = 0.3
+# Frames after an onset during which no new onset is reported
+ONSET_REFRACTORY_FRAMES = 3
+# Smoothing factor of the running spectral flux mean onsets are compared to
+FLUX_EWMA_ALPHA = 0.05
+
+# Columns of the per-frame feature ring
+RMS, VOICED, ONSET, PITCH, PITCHED = range(5)
+NUM_FEATURES = 5
+
+
+# Same 0-1 scales as VoiceAnalyzer
+def _volume_score(rms: float) -> float:
+    return min(max(rms * 10, 0.0), 1.0)
+
+
+def _speech_rate_score(words_per_minute: float) -> float:
+    return min(max((words_per_minute - 100) / 100, 0.0), 1.0)
+
+
+def _pitch_score(pitch: float) -> float:
+    return min(max((pitch - 100) / 200, 0.0), 1.0)
+
+
+class OnlineVoiceAnalyzer:
+    """
+    Incremental voice metrics for one live audio stream.
+
+    Incoming chunks are cut into fixed, non-overlapping frames. Each frame
+    gets its RMS energy and a single FFT, from which both its spectral flux
+    (for onsets) and its autocorrelation (for pitch) are derived. Per-frame
+    features go into a fixed-size ring buffer with running sums for the live
+    window, and into running totals for the current answer, so memory and
+    per-chunk cost stay constant however long the candidate talks and the
+    answer's metrics are ready as soon as it ends.
+
+    An analyzer is not thread-safe; use one per session.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = AUDIO_SAMPLE_RATE,
+        frame_ms: float = AUDIO_FRAME_MS,
+        window_seconds: float = AUDIO_WINDOW_SECONDS,
+        silence_rms: float = AUDIO_SILENCE_RMS,
+        onset_ratio: float = AUDIO_ONSET_RATIO
+    ):
+        self.frame_ms = frame_ms
+        self.window_seconds = window_seconds
+        self.silence_rms = silence_rms
+        self.onset_ratio = onset_ratio
+        self.set_sample_rate(sample_rate)
+
+    def set_sample_rate(self, sample_rate: int):
+        """
+        Configure frame sizes for a sample rate. Discards all state.
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = max(64, int(round(sample_rate * self.frame_ms / 1000)))
+        self.window_frames = max(1, int(round(self.window_seconds * sample_rate / self.frame_length)))
+        # Zero-padded to twice the frame so the autocorrelation is linear
+        self._n_fft = 1 << (2 * self.frame_length - 1).bit_length()
+        self._taper = np.hanning(self.frame_length).astype(np.float32)
+        self._min_lag = max(1, int(sample_rate / MAX_PITCH))
+        self._max_lag = min(self.frame_length - 1, int(math.ceil(sample_rate / MIN_PITCH)))
+
+        self._ring = np.zeros((self.window_frames, NUM_FEATURES), dtype=np.float64)
+        self._window_sums = np.zeros(NUM_FEATURES, dtype=np.float64)
+        self._index = 0
+        self.frames = 0
+
+        self._pending = np.zeros(self.frame_length, dtype=np.float32)
+        self._pending_length = 0
+        self._previous_spectrum = None
+        self._previous_rms = 0.0
+        self._flux_mean = 0.0
+        self._since_onset = ONSET_REFRACTORY_FRAMES
+        self.reset_answer()
+
+    def reset_answer(self):
+        """
+        Start accumulating a new answer.
+        """
+        self._answer = np.zeros(NUM_FEATURES, dtype=np.float64)
+        self._answer_frames = 0
+        self._last_onset = None
+        # Welford running mean and variance of the intervals between onsets
+        self._intervals = 0
+        self._interval_mean = 0.0
+        self._interval_m2 = 0.0
+
+    def add(self, samples: np.ndarray) -> int:
+        """
+        Feed a chunk of mono float samples. Returns the number of frames
+        analyzed; a trailing partial frame is kept for the next chunk.
+        """
+        samples = np.asarray(samples, dtype=np.float32).ravel()
+        analyzed = 0
+
+        if self._pending_length:
+            take = min(self.frame_length - self._pending_length, samples.size)
+            self._pending[self._pending_length:self._pending_length + take] = samples[:take]
+            self._pending_length += take
+            samples = samples[take:]
+            if self._pending_length < self.frame_length:
+                return 0
+            self._add_frames(self._pending[np.newaxis, :])
+            self._pending_length = 0
+            analyzed = 1
+
+        whole = samples.size - samples.size % self.frame_length
+        if whole:
+            self._add_frames(samples[:whole].reshape(-1, self.frame_length))
+            analyzed += whole // self.frame_length
+
+        rest = samples.size - whole
+        self._pending[:rest] = samples[whole:]
+        self._pending_length = rest
+        return analyzed
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Live voice metrics over the rolling window.
+        """
+        window = min(self.frames, self.window_frames)
+        if not window:
+            return {}
+        sums = self._window_sums
+        seconds = window * self.frame_length / self.sample_rate
+        return {
+            "voice_volume": _volume_score(sums[RMS] / window),
+            "voice_activity": float(sums[VOICED] / window),
+            "voice_speech_rate": _speech_rate_score(sums[ONSET] * 60 / seconds) if sums[ONSET] > 1 else 0.5,
+            "voice_pitch": _pitch_score(sums[PITCH] / sums[PITCHED]) if sums[PITCHED] else 0.5
+        }
+
+    def finish_answer(self) -> Dict[str, Any]:
+        """
+        Return the current answer's voice metrics, on the same keys and
+        scales as ``VoiceAnalyzer``, and start a new answer.
+        """
+        totals = self._answer
+        frames = self._answer_frames
+        frame_seconds = self.frame_length / self.sample_rate
+
+        metrics = {
+            "speech_rate": 0.5,
+            "volume": _volume_score(totals[RMS] / frames) if frames else 0.5,
+            "pitch": _pitch_score(totals[PITCH] / totals[PITCHED]) if totals[PITCHED] else 0.5,
+            "fluency": 0.5,
+            "voice_activity": float(totals[VOICED] / frames) if frames else 0.0,
+            "duration_seconds": round(frames * frame_seconds, 2),
+            "analysis_method": "streaming"
+        }
+        if self._intervals and self._interval_mean > 0:
+            # Each onset is taken as a word, as in VoiceAnalyzer
+            metrics["speech_rate"] = _speech_rate_score(60 / (self._interval_mean * frame_seconds))
+            cv = math.sqrt(self._interval_m2 / self._intervals) / self._interval_mean
+            metrics["fluency"] = 1.0 - min(cv, 1.0)
+
+        self.reset_answer()
+        return metrics
+
+    def _add_frames(self, frames: np.ndarray):
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+        voiced = rms >= self.silence_rms
+
+        spectrum = np.fft.rfft(frames * self._taper, n=self._n_fft, axis=1)
+        power = spectrum.real ** 2 + spectrum.imag ** 2
+
+        # Autocorrelation is the inverse FFT of the power spectrum
+        autocorrelation = np.fft.irfft(power, n=self._n_fft, axis=1)[:, :self._max_lag + 1]
+        lags = autocorrelation[:, self._min_lag:]
+        best = np.argmax(lags, axis=1)
+        peak = lags[np.arange(len(frames)), best] / np.maximum(autocorrelation[:, 0], 1e-12)
+        pitched = voiced & (peak >= MIN_PERIODICITY)
+        pitch = np.where(pitched, self.sample_rate / (best + self._min_lag), 0.0)
+
+        # Positive spectral flux on a log-compressed magnitude
+        log_spectrum = np.log1p(np.sqrt(power))
+        previous = self._previous_spectrum if self._previous_spectrum is not None else log_spectrum[:1]
+        flux = np.maximum(np.diff(log_spectrum, axis=0, prepend=previous), 0.0).mean(axis=1)
+        self._previous_spectrum = log_spectrum[-1:]
+
+        for i in range(len(frames)):
+            # Spectral change with rising energy; offsets also cause flux
+            onset = (
+                voiced[i]
+                and rms[i] > self._previous_rms
+                and self._since_onset >= ONSET_REFRACTORY_FRAMES
+                and flux[i] > self.onset_ratio * self._flux_mean
+            )
+            self._previous_rms = rms[i]
+            self._flux_mean += FLUX_EWMA_ALPHA * (flux[i] - self._flux_mean)
+            self._since_onset = 0 if onset else self._since_onset + 1
+            self._add_row(np.array([rms[i], voiced[i], onset, pitch[i], pitched[i]], dtype=np.float64))
+
+    def _add_row(self, row: np.ndarray):
+        if self.frames >= self.window_frames:
+            self._window_sums -= self._ring[self._index]
+        self._ring[self._index] = row
+        self._window_sums += row
+        self._index = (self._index + 1) % self.window_frames
+        self.frames += 1
+
+        self._answer += row
+        if row[ONSET]:
+            if self._last_onset is not None:
+                interval = self._answer_frames - self._last_onset
+                self._intervals += 1
+                delta = interval - self._interval_mean
+                self._interval_mean += delta / self._intervals
+                self._interval_m2 += delta * (interval - self._interval_mean)
+            self._last_onset = self._answer_frames
+        self._answer_frames += 1
@@ -0,0 +1,134 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import (
+    LIVE_ANALYSIS_WORKERS,
+    PACING_MAX_FPS,
+    PACING_MIN_FPS,
+    PACING_TARGET_UTILIZATION,
+    PACING_INTERVAL_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+# Capture resolutions offered to clients, largest first
+RESOLUTION_LADDER: List[Tuple[int, int]] = [
+    (640, 480),
+    (480, 360),
+    (320, 240),
+    (160, 120)
+]
+
+
+class PacingController:
+    """
+    Computes a target capture frame rate and resolution for one session.
+
+    The analysis pool can process roughly ``workers / latency`` frames per
+    second. That budget is split evenly between live sessions, so as more
+    interviews connect every client is asked to slow down (and then shrink
+    its frames) instead of all of them falling behind together.
+    """
+
+    def __init__(
+        self,
+        workers: int = LIVE_ANALYSIS_WORKERS,
+        max_fps: float = PACING_MAX_FPS,
+        min_fps: float = PACING_MIN_FPS,
+        target_utilization: float = PACING_TARGET_UTILIZATION,
+        interval_seconds: float = PACING_INTERVAL_SECONDS,
+        smoothing: float = 0.2,
+        max_resolution: Tuple[int, int] = RESOLUTION_LADDER[0]
+    ):
+        self.workers = workers
+        self.max_fps = max_fps
+        self.min_fps = min_fps
+        self.target_utilization = target_utilization
+        self.interval_seconds = interval_seconds
+        self.smoothing = smoothing
+
+        self.latency: Optional[float] = None
+        self.drop_rate = 0.0
+        self.min_level = 0
+        self.level = 0
+        self.set_max_resolution(max_resolution)
+        self.fps = max_fps
+        self._last_update = 0.0
+        self._published: Optional[Dict[str, Any]] = None
+
+    def set_max_resolution(self, resolution: Tuple[int, int]):
+        """
+        Never ask for more pixels than the negotiated frame format.
+        """
+        pixels = resolution[0] * resolution[1]
+        self.min_level = len(RESOLUTION_LADDER) - 1
+        for level in range(len(RESOLUTION_LADDER)):
+            if self._pixels(level) <= pixels:
+                self.min_level = level
+                break
+        self.level = max(self.level, self.min_level)
+
+    def record(self, latency_seconds: float, dropped: bool):
+        """
+        Record the analysis latency of one frame and whether older frames
+        were dropped while it was queued.
+        """
+        if self.latency is None:
+            self.latency = latency_seconds
+        else:
+            self.latency += self.smoothing * (latency_seconds - self.latency)
+        self.drop_rate += self.smoothing * ((1.0 if dropped else 0.0) - self.drop_rate)
+
+    def update(self, active_sessions: int, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return a new pacing target if it changed since the last one sent,
+        otherwise None. Updates are rate-limited to one per interval.
+        """
+        now = time.monotonic() if now is None else now
+        if self.latency is None or now - self._last_update < self.interval_seconds:
+            return None
+        self._last_update = now
+
+        self.level, self.fps = self._compute_target(max(1, active_sessions))
+        width, height = RESOLUTION_LADDER[self.level]
+        target = {
+            "fps": round(self.fps, 1),
+            "width": width,
+            "height": height
+        }
+
+        if self._published is not None and not self._changed(target):
+            return None
+        self._published = target
+        return target
+
+    def _compute_target(self, active_sessions: int) -> Tuple[int, float]:
+        # Frames per second this session may use at the current resolution
+        capacity = self.workers * self.target_utilization / max(self.latency, 1e-3)
+        share = capacity / active_sessions
+        if self.drop_rate > 0.2:
+            # The client is already outrunning analysis; back off further
+            share *= 1.0 - self.drop_rate / 2
+
+        # Analysis cost scales roughly with pixel count, so estimate the
+        # share at each rung and pick the largest that sustains min_fps
+        current_pixels = self._pixels(self.level)
+        for level in range(self.min_level, len(RESOLUTION_LADDER)):
+            level_share = share * current_pixels / self._pixels(level)
+            if level_share >= self.min_fps:
+                return level, min(level_share, self.max_fps)
+
+        smallest = len(RESOLUTION_LADDER) - 1
+        return smallest, self.min_fps
+
+    def _changed(self, target: Dict[str, Any]) -> bool:
+        published = self._published
+        if (target["width"], target["height"]) != (published["width"], published["height"]):
+            return True
+        return abs(target["fps"] - published["fps"]) >= 1.0
+
+    @staticmethod
+    def _pixels(level: int) -> int:
+        width, height = RESOLUTION_LADDER[level]
+        return width * height
@@ -0,0 +1,295 @@
+import argparse
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import PITCH_ESTIMATOR
+from .lazy_imports import lazy_import
+
+librosa = lazy_import("librosa")
+
+logger = logging.getLogger(__name__)
+
+# Speaking voice pitch search range (Hz)
+MIN_PITCH = 65.0
+MAX_PITCH = 400.0
+# YIN: cumulative mean normalized difference below which a lag is a period
+YIN_THRESHOLD = 0.1
+# Autocorrelation: normalised peak a frame needs to count as voiced
+MIN_PERIODICITY = 0.3
+# Autocorrelation: peak height given up per octave to prefer shorter lags
+OCTAVE_COST = 0.01
+# Frames below this RMS are silence and never voiced
+SILENCE_RMS = 1e-3
+# Frames transformed together; bounds the FFT working set for long answers
+BLOCK_FRAMES = 512
+
+PITCH_ESTIMATORS = ("yin", "autocorrelation", "piptrack")
+
+
+def validate_estimator(method: str) -> str:
+    """
+    Return ``method`` if it names a pitch estimator, else raise ValueError.
+    """
+    if method not in PITCH_ESTIMATORS:
+        raise ValueError(f"Unknown pitch estimator {method!r}; choose from {', '.join(PITCH_ESTIMATORS)}")
+    return method
+
+
+def default_frame_length(sample_rate: int) -> int:
+    """
+    Smallest power of two holding two periods of the lowest pitch.
+    """
+    return 1 << int(np.ceil(np.log2(2 * sample_rate / MIN_PITCH)))
+
+
+def _frames(y: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    # Strided view over y: one row per frame, no copy
+    y = np.ascontiguousarray(y, dtype=np.float32)
+    if y.size < frame_length:
+        y = np.pad(y, (0, frame_length - y.size))
+    return np.lib.stride_tricks.sliding_window_view(y, frame_length)[::hop_length]
+
+
+def _parabolic_offset(left: np.ndarray, center: np.ndarray, right: np.ndarray) -> np.ndarray:
+    # Vertex of the parabola through three neighbouring lag values
+    denominator = left - 2 * center + right
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = 0.5 * (left - right) / denominator
+    return np.where(np.abs(denominator) > 1e-12, np.clip(offset, -1.0, 1.0), 0.0)
+
+
+def _yin_block(frames: np.ndarray, sample_rate: int, min_lag: int, max_lag: int) -> Tuple[np.ndarray, np.ndarray]:
+    count, frame_length = frames.shape
+    window = frame_length - max_lag
+    n_fft = 1 << (frame_length + window - 1).bit_length()
+
+    # d(tau) = E(0) + E(tau) - 2 r(tau) over a window of `window` samples,
+    # with the cross term r from one FFT per frame
+    frames = frames.astype(np.float64)
+    spectrum = np.fft.rfft(frames, n=n_fft, axis=1)
+    head = np.fft.rfft(frames[:, :window], n=n_fft, axis=1)
+    cross = np.fft.irfft(spectrum * np.conj(head), n=n_fft, axis=1)[:, :max_lag + 1]
+
+    energy = np.cumsum(np.square(frames), axis=1)
+    energy = np.concatenate([np.zeros((count, 1)), energy], axis=1)
+    lags = np.arange(max_lag + 1)
+    windowed_energy = energy[:, lags + window] - energy[:, lags]
+    difference = np.maximum(windowed_energy[:, :1] + windowed_energy - 2 * cross, 0.0)
+
+    # Cumulative mean normalized difference
+    cumulative = np.cumsum(difference[:, 1:], axis=1)
+    cmnd = np.ones_like(difference)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cmnd[:, 1:] = np.where(cumulative > 0, difference[:, 1:] * lags[1:] / cumulative, 1.0)
+
+    # First local minimum below the threshold in the search range
+    inner = cmnd[:, min_lag:max_lag]
+    troughs = (inner < cmnd[:, min_lag - 1:max_lag - 1]) & (inner <= cmnd[:, min_lag + 1:max_lag + 1])
+    candidates = troughs & (inner < YIN_THRESHOLD)
+    voiced = candidates.any(axis=1)
+    best = np.argmax(candidates, axis=1) + min_lag
+
+    rows = np.arange(count)
+    period = best + _parabolic_offset(cmnd[rows, best - 1], cmnd[rows, best], cmnd[rows, best + 1])
+    rms = np.sqrt(windowed_energy[:, 0] / window)
+    voiced &= rms >= SILENCE_RMS
+    return np.where(voiced, sample_rate / period, 0.0), voiced
+
+
+def _autocorrelation_block(frames: np.ndarray, sample_rate: int, min_lag: int, max_lag: int) -> Tuple[np.ndarray, np.ndarray]:
+    count, frame_length = frames.shape
+    n_fft = 1 << (2 * frame_length - 1).bit_length()
+
+    hann = np.hanning(frame_length).astype(np.float32)
+    # Autocorrelation is the inverse FFT of the power spectrum
+    spectrum = np.fft.rfft(frames * hann, n=n_fft, axis=1)
+    autocorrelation = np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2, n=n_fft, axis=1)[:, :max_lag + 2]
+    window_spectrum = np.fft.rfft(hann, n=n_fft)
+    window_autocorrelation = np.fft.irfft(np.abs(window_spectrum) ** 2, n=n_fft)[:max_lag + 2]
+
+    # Divide out the window's own autocorrelation (Boersma, 1993); its decay
+    # would otherwise pull peaks towards shorter lags
+    autocorrelation = (autocorrelation / np.maximum(autocorrelation[:, :1], 1e-12)) / (
+        window_autocorrelation / window_autocorrelation[0]
+    )
+
+    # Once the window is divided out, multiples of the period peak about as
+    # high as the period itself; a small cost per octave favours the shortest
+    search = autocorrelation[:, min_lag:max_lag + 1]
+    octaves = np.log2(np.arange(min_lag, max_lag + 1) / min_lag)
+    best = np.argmax(search - OCTAVE_COST * octaves, axis=1) + min_lag
+    rows = np.arange(count)
+    peak = autocorrelation[rows, best]
+    period = best + _parabolic_offset(
+        autocorrelation[rows, best - 1], autocorrelation[rows, best], autocorrelation[rows, best + 1]
+    )
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    voiced = (peak >= MIN_PERIODICITY) & (rms >= SILENCE_RMS)
+    return np.where(voiced, sample_rate / period, 0.0), voiced
+
+
+_BLOCK_ESTIMATORS: Dict[str, Callable[..., Tuple[np.ndarray, np.ndarray]]] = {
+    "yin": _yin_block,
+    "autocorrelation": _autocorrelation_block
+}
+
+
+def pitch_track(
+    y: np.ndarray,
+    sample_rate: int,
+    method: str = "yin",
+    frame_length: Optional[int] = None,
+    hop_length: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimate the fundamental frequency of every frame of ``y`` with YIN or
+    FFT autocorrelation, vectorized across frames.
+
+    Returns the per-frame pitch in Hz (0 where unvoiced) and the voiced mask.
+    """
+    if method not in _BLOCK_ESTIMATORS:
+        raise ValueError(f"Unknown frame pitch estimator: {method}")
+    frame_length = frame_length or default_frame_length(sample_rate)
+    hop_length = hop_length or frame_length // 4
+
+    # YIN needs the integration window and the longest lag in one frame;
+    # past half a frame the window-normalized autocorrelation is unreliable
+    reach = frame_length // 2
+    max_lag = min(int(np.ceil(sample_rate / MIN_PITCH)), reach)
+    min_lag = max(2, int(sample_rate / MAX_PITCH))
+
+    estimate = _BLOCK_ESTIMATORS[method]
+    frames = _frames(y, frame_length, hop_length)
+    pitches, voiced = [], []
+    for start in range(0, len(frames), BLOCK_FRAMES):
+        block_pitch, block_voiced = estimate(frames[start:start + BLOCK_FRAMES], sample_rate, min_lag, max_lag)
+        pitches.append(block_pitch)
+        voiced.append(block_voiced)
+    return np.concatenate(pitches), np.concatenate(voiced)
+
+
+def voiced_pitches(y: np.ndarray, sample_rate: int, method: str = PITCH_ESTIMATOR) -> np.ndarray:
+    """
+    Pitch values (Hz) of the voiced parts of ``y``.
+
+    With ``piptrack`` these are librosa's per-bin peak frequencies above the
+    mean magnitude, as the voice analyzers always used; the frame estimators
+    give one fundamental per voiced frame.
+    """
+    if method == "piptrack":
+        pitches, magnitudes = librosa.piptrack(y=np.asarray(y, dtype=np.float32), sr=sample_rate)
+        return pitches[magnitudes > magnitudes.mean()]
+    pitches, voiced = pitch_track(y, sample_rate, method)
+    return pitches[voiced]
+
+
+def pitch_statistics(y: np.ndarray, sample_rate: int, method: str = PITCH_ESTIMATOR) -> Dict[str, float]:
+    """
+    Mean pitch and pitch variation (standard deviation) in Hz.
+    """
+    pitches = voiced_pitches(y, sample_rate, method)
+    if not pitches.size:
+        return {"mean_pitch": 0.0, "pitch_variation": 0.0}
+    return {
+        "mean_pitch": float(np.mean(pitches)),
+        "pitch_variation": float(np.std(pitches))
+    }
+
+
+def synthetic_voice(
+    sample_rate: int = 22050,
+    seconds: float = 30.0,
+    seed: int = 0
+) -> Tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]:
+    """
+    A harmonic test signal gliding between 100 and 250 Hz with pauses and
+    background noise. Returns the signal and its true pitch as a function
+    of time (0 in pauses).
+    """
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+
+    def true_pitch(times: np.ndarray) -> np.ndarray:
+        pitch = 175 + 75 * np.sin(2 * np.pi * times / 7.0)
+        # 1.2 s phrases separated by 0.6 s pauses
+        return np.where(times % 1.8 < 1.2, pitch, 0.0)
+
+    pitch = true_pitch(t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6)) * (pitch > 0)
+    noise = np.random.default_rng(seed).normal(0, 0.01, t.size)
+    return (0.3 * voice + noise).astype(np.float32), true_pitch
+
+
+def benchmark_estimators(
+    methods: Tuple[str, ...] = PITCH_ESTIMATORS,
+    sample_rate: int = 22050,
+    seconds: float = 30.0,
+    repeats: int = 3
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Time each estimator on a synthetic voice of known pitch and compare its
+    mean pitch and variation with the truth. Estimators that cannot run
+    (librosa missing for piptrack) map to None.
+    """
+    y, true_pitch = synthetic_voice(sample_rate, seconds)
+    truth = true_pitch(np.arange(y.size) / sample_rate)
+    truth = truth[truth > 0]
+
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    for method in methods:
+        try:
+            stats = pitch_statistics(y, sample_rate, method)
+            started = time.perf_counter()
+            for _ in range(repeats):
+                pitch_statistics(y, sample_rate, method)
+            elapsed_ms = (time.perf_counter() - started) * 1000 / repeats
+        except Exception as e:
+            logger.warning(f"Pitch estimator {method} unavailable: {str(e)}")
+            results[method] = None
+            continue
+
+        result = dict(stats, ms=elapsed_ms, ms_per_second=elapsed_ms / seconds)
+        result["mean_error"] = stats["mean_pitch"] - float(np.mean(truth))
+        result["variation_error"] = stats["pitch_variation"] - float(np.std(truth))
+        if method != "piptrack":
+            # Per-frame accuracy against the pitch at each frame's centre
+            frame_length = default_frame_length(sample_rate)
+            pitches, voiced = pitch_track(y, sample_rate, method)
+            centres = (np.arange(pitches.size) * (frame_length // 4) + frame_length // 2) / sample_rate
+            expected = true_pitch(centres)
+            both = voiced & (expected > 0)
+            result["median_frame_error"] = float(np.median(np.abs(pitches[both] - expected[both]))) if both.any() else None
+            result["voicing_accuracy"] = float(np.mean(voiced == (expected > 0)))
+        results[method] = result
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the pitch estimators on a synthetic voice.")
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = benchmark_estimators(sample_rate=args.sample_rate, seconds=args.seconds, repeats=args.repeats)
+    for method, result in results.items():
+        if result is None:
+            print(f"{method:<16} unavailable")
+            continue
+        line = (
+            f"{method:<16} {result['ms']:9.1f} ms ({result['ms_per_second']:.2f} ms per audio second)  "
+            f"mean {result['mean_pitch']:6.1f} Hz ({result['mean_error']:+.1f})  "
+            f"variation {result['pitch_variation']:5.1f} Hz ({result['variation_error']:+.1f})"
+        )
+        if result.get("median_frame_error") is not None:
+            line += f"  frame error {result['median_frame_error']:.1f} Hz, voicing {result['voicing_accuracy']:.0%}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
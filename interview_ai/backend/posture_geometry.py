@@ -0,0 +1,76 @@
+import itertools
+import logging
+from typing import Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# MediaPipe Pose landmarks, as x, y, z and visibility
+NUM_POSE_LANDMARKS = 33
+NOSE = 0
+LEFT_EAR = 7
+RIGHT_EAR = 8
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+
+# Shoulders must be at least this visible for a frame to be scored
+MIN_VISIBILITY = 0.5
+# Shoulder line angle (degrees) at which the level score reaches 0
+MAX_SHOULDER_TILT = 15.0
+# Sideways offset of the nose from the shoulder midpoint, as a fraction of
+# shoulder width, at which the centred score reaches 0
+MAX_HEAD_OFFSET = 0.5
+# Height of the ears above the shoulder line, as a fraction of shoulder
+# width: at or below SLOUCHED scores 0, at or above UPRIGHT scores 1
+SLOUCHED_NECK = 0.15
+UPRIGHT_NECK = 0.45
+# Frames whose posture score reaches this count as good posture
+GOOD_POSTURE_THRESHOLD = 0.7
+
+
+def pose_landmarks_to_array(pose_landmarks) -> np.ndarray:
+    """
+    Convert MediaPipe pose landmarks to a (33, 4) float32 array of x, y, z
+    and visibility.
+    """
+    points = pose_landmarks.landmark[:NUM_POSE_LANDMARKS]
+    coords = itertools.chain.from_iterable((p.x, p.y, p.z, p.visibility) for p in points)
+    return np.fromiter(coords, dtype=np.float32, count=NUM_POSE_LANDMARKS * 4).reshape(NUM_POSE_LANDMARKS, 4)
+
+
+def posture_scores(landmarks: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Score upper-body posture per frame for a (frames, 33, 4) stack.
+
+    Returns 0-1 scores for level shoulders, a head centred over them and an
+    upright (not slouched) neck, their mean as ``posture_score``, and a
+    ``valid`` mask of frames where both shoulders were visible.
+    """
+    left = landmarks[..., LEFT_SHOULDER, :]
+    right = landmarks[..., RIGHT_SHOULDER, :]
+    valid = np.minimum(left[..., 3], right[..., 3]) >= MIN_VISIBILITY
+
+    dx = np.abs(right[..., 0] - left[..., 0])
+    dy = np.abs(right[..., 1] - left[..., 1])
+    shoulder_width = np.maximum(np.hypot(dx, dy), 1e-6)
+    mid_x = (left[..., 0] + right[..., 0]) / 2
+    mid_y = (left[..., 1] + right[..., 1]) / 2
+
+    tilt = np.degrees(np.arctan2(dy, np.maximum(dx, 1e-6)))
+    shoulder_level = np.clip(1.0 - tilt / MAX_SHOULDER_TILT, 0.0, 1.0)
+
+    head_offset = np.abs(landmarks[..., NOSE, 0] - mid_x) / shoulder_width
+    head_centered = np.clip(1.0 - head_offset / MAX_HEAD_OFFSET, 0.0, 1.0)
+
+    ear_y = (landmarks[..., LEFT_EAR, 1] + landmarks[..., RIGHT_EAR, 1]) / 2
+    neck = (mid_y - ear_y) / shoulder_width
+    upright = np.clip((neck - SLOUCHED_NECK) / (UPRIGHT_NECK - SLOUCHED_NECK), 0.0, 1.0)
+
+    return {
+        "posture_score": (shoulder_level + head_centered + upright) / 3,
+        "shoulder_level": shoulder_level,
+        "head_centered": head_centered,
+        "upright": upright,
+        "valid": valid
+    }
@@ -0,0 +1,180 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+from .config import (
+    LIVE_ANALYSIS_WORKERS,
+    FACE_ANALYZER_POOL_SIZE,
+    AUDIO_WORKER_PROCESSES,
+    QUALITY_TIERS_ENABLED,
+    QUALITY_RECOVER_RATIO,
+    QUALITY_MIN_DWELL_SECONDS,
+    QUALITY_LATENCY_WINDOW,
+    QUALITY_VISION_MAX_P95_MS,
+    QUALITY_LIVE_MAX_P95_MS,
+    QUALITY_AUDIO_MAX_P95_MS
+)
+
+logger = logging.getLogger(__name__)
+
+# Tiers from most to least precise
+# Recorded clips: FaceMesh with iris refinement, FaceMesh without it,
+# Haar face boxes only, then Haar on fewer sampled frames
+VISION_TIERS = ("mesh_refined", "mesh", "haar", "haar_sampled")
+# Live frames: the configured detector, Haar, then Haar on every Nth frame
+LIVE_TIERS = ("full", "haar", "haar_sampled")
+# Voice: every metric, without pitch tracking, then volume only
+AUDIO_TIERS = ("full", "reduced", "minimal")
+
+# p95 is only trusted once this many jobs have been seen at a tier
+MIN_SAMPLES = 5
+
+
+@dataclass
+class QualityJob:
+    """
+    One analysis job run under a governor. ``units`` is the amount of work
+    done (frames, seconds of audio) so cost is compared per unit.
+    """
+    tier: str
+    units: float = 1.0
+
+
+class QualityGovernor:
+    """
+    Picks an analysis quality tier from current load.
+
+    Load is the number of jobs in flight (queued or running) and the p95
+    cost per unit of recent jobs. When either exceeds its limit the governor
+    steps one tier down; it only steps back up once both are below
+    ``recover_ratio`` of their limits. Tiers are held for at least
+    ``min_dwell_seconds`` so the two thresholds and the dwell time together
+    keep it from flapping.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tiers: Sequence[str],
+        max_queue_depth: int,
+        max_p95_ms: float,
+        recover_ratio: float = QUALITY_RECOVER_RATIO,
+        min_dwell_seconds: float = QUALITY_MIN_DWELL_SECONDS,
+        window: int = QUALITY_LATENCY_WINDOW,
+        enabled: bool = QUALITY_TIERS_ENABLED
+    ):
+        self.name = name
+        self.tiers = tuple(tiers)
+        self.max_queue_depth = max_queue_depth
+        self.max_p95_ms = max_p95_ms
+        self.recover_ratio = recover_ratio
+        self.min_dwell_seconds = min_dwell_seconds
+        self.enabled = enabled
+
+        self.level = 0
+        self.in_flight = 0
+        self.switches = 0
+        self._costs: Deque[float] = deque(maxlen=max(MIN_SAMPLES, window))
+        self._last_switch = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def tier(self) -> str:
+        return self.tiers[self.level]
+
+    @contextmanager
+    def job(self) -> Iterator[QualityJob]:
+        """
+        Run one job: yields the tier to use and records its cost per unit.
+        """
+        with self._lock:
+            self.in_flight += 1
+            tier = self._update(self.in_flight, time.monotonic())
+        job = QualityJob(tier)
+        started = time.perf_counter()
+        try:
+            yield job
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self.in_flight -= 1
+                # Costs from another tier say nothing about the current one
+                if job.tier == self.tier:
+                    self._costs.append(elapsed_ms / max(job.units, 1e-6))
+
+    def p95(self) -> Optional[float]:
+        if len(self._costs) < MIN_SAMPLES:
+            return None
+        return float(np.percentile(np.fromiter(self._costs, dtype=np.float64), 95))
+
+    def update(self, queue_depth: int, now: Optional[float] = None) -> str:
+        """
+        Re-evaluate the tier for the given load and return it.
+        """
+        with self._lock:
+            return self._update(queue_depth, time.monotonic() if now is None else now)
+
+    def stats(self) -> Dict[str, Any]:
+        p95 = self.p95()
+        return {
+            "tier": self.tier,
+            "in_flight": self.in_flight,
+            "p95_ms": round(p95, 2) if p95 is not None else None,
+            "switches": self.switches
+        }
+
+    def _update(self, queue_depth: int, now: float) -> str:
+        if not self.enabled or now - self._last_switch < self.min_dwell_seconds:
+            return self.tier
+
+        p95 = self.p95()
+        overloaded = queue_depth > self.max_queue_depth or (p95 is not None and p95 > self.max_p95_ms)
+        relaxed = (
+            queue_depth <= self.max_queue_depth * self.recover_ratio
+            and p95 is not None
+            and p95 <= self.max_p95_ms * self.recover_ratio
+        )
+
+        if overloaded and self.level < len(self.tiers) - 1:
+            self._switch(self.level + 1, now, queue_depth, p95)
+        elif relaxed and self.level > 0:
+            self._switch(self.level - 1, now, queue_depth, p95)
+        return self.tier
+
+    def _switch(self, level: int, now: float, queue_depth: int, p95: Optional[float]):
+        previous = self.tier
+        self.level = level
+        self.switches += 1
+        self._last_switch = now
+        self._costs.clear()
+        logger.info(
+            f"{self.name} quality tier {previous} -> {self.tier} "
+            f"(in flight {queue_depth}, p95 {p95 if p95 is None else round(p95, 1)} ms)"
+        )
+
+
+# Cost units: ms per analyzed frame for vision, ms per second of audio
+vision_governor = QualityGovernor(
+    "vision",
+    VISION_TIERS,
+    max_queue_depth=FACE_ANALYZER_POOL_SIZE,
+    max_p95_ms=QUALITY_VISION_MAX_P95_MS
+)
+live_governor = QualityGovernor(
+    "live",
+    LIVE_TIERS,
+    max_queue_depth=LIVE_ANALYSIS_WORKERS * 2,
+    max_p95_ms=QUALITY_LIVE_MAX_P95_MS
+)
+audio_governor = QualityGovernor(
+    "audio",
+    AUDIO_TIERS,
+    max_queue_depth=max(1, AUDIO_WORKER_PROCESSES),
+    max_p95_ms=QUALITY_AUDIO_MAX_P95_MS
+)
@@ -1,11 +1,13 @@
 import logging
 import io
-import pdfplumber
-from docx import Document
 from typing import Dict, Any, List
 import re
 from pathlib import Path
 import asyncio
+from .lazy_imports import lazy_import
+
+pdfplumber = lazy_import("pdfplumber")
+docx = lazy_import("docx")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -74,7 +76,7 @@ class ResumeParser:
         Extract text from DOCX file.
         """
         try:
-            doc = Document(file_path)
+            doc = docx.Document(file_path)
             text = ""
             for paragraph in doc.paragraphs:
                 text += paragraph.text + "\n"
@@ -320,7 +322,7 @@ def extract_resume_data(file_content: bytes) -> Dict[str, Any]:
             # Try to read as DOCX
             try:
                 file_stream.seek(0)  # Reset stream position
-                doc = Document(file_stream)
+                doc = docx.Document(file_stream)
                 text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
             except Exception as e:
                 logger.error(f"Failed to read as DOCX: {str(e)}")
@@ -0,0 +1,125 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import numpy as np
+
+from .config import (
+    VAD_FRAME_MS,
+    VAD_ENERGY_RATIO,
+    VAD_MIN_RMS,
+    VAD_MAX_ZCR,
+    VAD_MIN_SPEECH_MS,
+    VAD_MIN_PAUSE_MS,
+    VAD_PADDING_MS
+)
+
+logger = logging.getLogger(__name__)
+
+# Percentile of frame energy taken as the clip's noise floor
+NOISE_FLOOR_PERCENTILE = 10
+
+
+@dataclass
+class SpeechActivity:
+    """
+    Speech segments found in a clip, as ``[start, end)`` sample offsets.
+    """
+    segments: np.ndarray
+    sample_rate: int
+    total_samples: int
+
+    @property
+    def speech_samples(self) -> int:
+        return int((self.segments[:, 1] - self.segments[:, 0]).sum())
+
+    def speech_audio(self, y: np.ndarray, padding_ms: float = VAD_PADDING_MS) -> np.ndarray:
+        """
+        The speech segments of ``y`` joined together, each padded so word
+        edges are kept. Pauses and leading or trailing silence are dropped.
+        """
+        if not len(self.segments):
+            return y[:0]
+        padding = int(self.sample_rate * padding_ms / 1000)
+        starts = np.maximum(self.segments[:, 0] - padding, 0)
+        ends = np.minimum(self.segments[:, 1] + padding, self.total_samples)
+        # Padding can make neighbours overlap; never repeat samples
+        starts[1:] = np.maximum(starts[1:], ends[:-1])
+        return np.concatenate([y[start:end] for start, end in zip(starts, ends)])
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Speaking time and pause statistics, in seconds.
+        """
+        total_time = self.total_samples / self.sample_rate
+        speaking_time = self.speech_samples / self.sample_rate
+        pauses = (self.segments[1:, 0] - self.segments[:-1, 1]) / self.sample_rate
+        return {
+            "speaking_time": round(speaking_time, 2),
+            "total_time": round(total_time, 2),
+            "speaking_ratio": round(speaking_time / total_time, 3) if total_time else 0.0,
+            "initial_silence": round(self.segments[0, 0] / self.sample_rate if len(self.segments) else total_time, 2),
+            "pause_count": int(pauses.size),
+            "mean_pause": round(float(pauses.mean()), 2) if pauses.size else 0.0,
+            "longest_pause": round(float(pauses.max()), 2) if pauses.size else 0.0
+        }
+
+
+def frame_features(y: np.ndarray, frame_length: int):
+    """
+    RMS energy and zero-crossing rate of consecutive non-overlapping frames.
+    """
+    count = len(y) // frame_length
+    frames = np.asarray(y[:count * frame_length], dtype=np.float32).reshape(count, frame_length)
+    rms = np.sqrt(np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame_length)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / max(frame_length - 1, 1)
+    return rms, zcr
+
+
+def _runs(mask: np.ndarray) -> np.ndarray:
+    # [start, end) indices of the runs of True in a boolean mask
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    return np.stack([np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)], axis=1)
+
+
+def detect_speech(
+    y: np.ndarray,
+    sample_rate: int,
+    frame_ms: float = VAD_FRAME_MS,
+    energy_ratio: float = VAD_ENERGY_RATIO,
+    min_rms: float = VAD_MIN_RMS,
+    max_zcr: float = VAD_MAX_ZCR,
+    min_speech_ms: float = VAD_MIN_SPEECH_MS,
+    min_pause_ms: float = VAD_MIN_PAUSE_MS
+) -> SpeechActivity:
+    """
+    Find the speech segments of a clip from frame energy and zero crossings.
+
+    A frame is speech when its RMS is ``energy_ratio`` times the clip's
+    noise floor (and at least ``min_rms``). Quiet frames that cross zero
+    more often than ``max_zcr`` are hiss rather than voice and are left
+    out. Gaps shorter than ``min_pause_ms`` are bridged so short stops
+    inside words don't split them, then bursts shorter than
+    ``min_speech_ms`` are dropped as clicks.
+    """
+    frame_length = max(1, int(sample_rate * frame_ms / 1000))
+    rms, zcr = frame_features(y, frame_length)
+    if not rms.size:
+        return SpeechActivity(np.zeros((0, 2), dtype=np.int64), sample_rate, len(y))
+
+    noise_floor = float(np.percentile(rms, NOISE_FLOOR_PERCENTILE))
+    threshold = max(min_rms, noise_floor * energy_ratio)
+    speech = (rms >= threshold) & ((zcr <= max_zcr) | (rms >= 2 * threshold))
+
+    runs = _runs(speech)
+    if len(runs) > 1:
+        # Bridge gaps shorter than a pause
+        breaks = runs[1:, 0] - runs[:-1, 1] >= max(1, round(min_pause_ms / frame_ms))
+        runs = np.stack([
+            runs[np.concatenate([[True], breaks]), 0],
+            runs[np.concatenate([breaks, [True]]), 1]
+        ], axis=1)
+    runs = runs[runs[:, 1] - runs[:, 0] >= max(1, round(min_speech_ms / frame_ms))]
+
+    return SpeechActivity(runs.astype(np.int64) * frame_length, sample_rate, len(y))
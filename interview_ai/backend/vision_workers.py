@@ -0,0 +1,345 @@
+import itertools
+import logging
+import math
+import multiprocessing as mp
+import queue
+import threading
+import time
+import zlib
+from concurrent.futures import Future
+from multiprocessing import connection, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import (
+    VISION_WORKER_PROCESSES,
+    VISION_RING_SLOTS,
+    VISION_SLOT_BYTES,
+    VISION_LIVENESS_INTERVAL
+)
+from .face_detectors import default_backend
+from .lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_main(
+    index: int,
+    shm_name: str,
+    slots: int,
+    slot_bytes: int,
+    tasks: "mp.Queue",
+    results: connection.Connection,
+    detector_backend: str
+):
+    """
+    Vision worker process loop.
+
+    Frames are read straight out of this worker's shared-memory ring; only
+    the slot index and frame shape travel over the task queue. Each session
+    is pinned to one worker, so its face tracker lives here.
+    """
+    from .face_detectors import get_face_detector, set_default_backend
+    from .face_tracking import FaceTracker, analyze_gray_frame
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = np.ndarray((slots, slot_bytes), dtype=np.uint8, buffer=shm.buf)
+    trackers: Dict[str, FaceTracker] = {}
+    set_default_backend(detector_backend)
+    get_face_detector()
+
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+
+            if task[0] == "release":
+                trackers.pop(task[1], None)
+                continue
+
+            _, job_id, session_id, slot, height, width, detector = task
+            gray = ring[slot, :height * width].reshape(height, width)
+            tracker = trackers.setdefault(session_id, FaceTracker())
+            try:
+                metrics = analyze_gray_frame(gray, tracker, get_face_detector(detector))
+                results.send((job_id, slot, metrics, None))
+            except Exception as e:
+                results.send((job_id, slot, None, str(e)))
+    finally:
+        del ring
+        shm.close()
+
+
+class _Worker:
+    def __init__(self, index: int, slots: int, slot_bytes: int, ctx, detector_backend: str):
+        self.index = index
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.shm = shared_memory.SharedMemory(create=True, size=slots * slot_bytes)
+        self.ring = np.ndarray((slots, slot_bytes), dtype=np.uint8, buffer=self.shm.buf)
+        self.free_slots: "queue.Queue[int]" = queue.Queue()
+        for slot in range(slots):
+            self.free_slots.put(slot)
+        self.spawn(ctx, detector_backend)
+
+    def spawn(self, ctx, detector_backend: str):
+        # Fresh queue and pipe per process: a killed process may have died
+        # holding their locks
+        self.tasks = ctx.Queue()
+        self.results, self._results_writer = ctx.Pipe(duplex=False)
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(
+                self.index, self.shm.name, self.slots, self.slot_bytes,
+                self.tasks, self._results_writer, detector_backend
+            ),
+            name=f"vision-worker-{self.index}",
+            daemon=True
+        )
+
+    def start(self):
+        self.process.start()
+        # Only the worker writes; without our copy its exit reads as EOF
+        self._results_writer.close()
+
+
+class VisionWorkerPool:
+    """
+    Process-based vision workers fed through shared-memory frame rings.
+
+    Each worker process owns a ring of ``slots`` fixed-size frame buffers in
+    ``multiprocessing.shared_memory``. ``dispatch`` copies a decoded frame
+    into a free slot of the session's worker and sends a small task tuple;
+    results come back over a pipe per worker and resolve the returned future.
+    This spreads OpenCV work over every core without extra uvicorn workers,
+    so session state stays in one server process.
+
+    When a worker exits (its result pipe closes) or is found dead by the
+    check every ``liveness_interval`` seconds, its outstanding futures fail,
+    their slots are freed and a replacement process is started on the same
+    ring.
+    """
+
+    def __init__(
+        self,
+        processes: int = VISION_WORKER_PROCESSES,
+        slots: int = VISION_RING_SLOTS,
+        slot_bytes: int = VISION_SLOT_BYTES,
+        slot_timeout: float = 0.5,
+        liveness_interval: float = VISION_LIVENESS_INTERVAL
+    ):
+        self.processes = max(1, processes)
+        self.slots = max(1, slots)
+        self.slot_bytes = slot_bytes
+        self.slot_timeout = slot_timeout
+        self.liveness_interval = liveness_interval
+
+        self._ctx = mp.get_context("spawn")
+        self._workers: List[_Worker] = []
+        self._wake_reader: Optional[connection.Connection] = None
+        self._wake_writer: Optional[connection.Connection] = None
+        self._result_thread: Optional[threading.Thread] = None
+        self._detector_backend: Optional[str] = None
+        # job id -> (future, worker index, slot); a slot stays taken until
+        # its worker answers or is found dead, even if the caller gave up
+        self._futures: Dict[int, Tuple[Future, int, int]] = {}
+        self._futures_lock = threading.Lock()
+        self._liveness_lock = threading.Lock()
+        self._job_ids = itertools.count()
+        self.restarts = 0
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    def start(self):
+        if self.started:
+            return
+        self._wake_reader, self._wake_writer = mp.Pipe(duplex=False)
+        # Spawned workers do not inherit the benchmarked detector choice
+        self._detector_backend = default_backend()
+        self._workers = [
+            _Worker(index, self.slots, self.slot_bytes, self._ctx, self._detector_backend)
+            for index in range(self.processes)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._result_thread = threading.Thread(
+            target=self._collect_results,
+            name="vision-results",
+            daemon=True
+        )
+        self._result_thread.start()
+        logger.info(
+            f"Started {self.processes} vision worker processes with "
+            f"{self.slots} x {self.slot_bytes} byte frame rings"
+        )
+
+    def stop(self):
+        if not self.started:
+            return
+        # Stop collecting first so exiting workers are not restarted
+        self._wake_writer.send(None)
+        self._result_thread.join(timeout=5)
+        self._wake_reader.close()
+        self._wake_writer.close()
+        with self._liveness_lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.tasks.put(None)
+        for worker in workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.results.close()
+            del worker.ring
+            worker.shm.close()
+            worker.shm.unlink()
+
+        with self._futures_lock:
+            entries, self._futures = self._futures, {}
+        for future, _, _ in entries.values():
+            future.cancel()
+
+    def dispatch(self, session_id: str, gray: np.ndarray, detector: Optional[str] = None) -> Future:
+        """
+        Queue a decoded grayscale frame on the session's worker, to be
+        analyzed with the ``detector`` backend (default: the worker's).
+
+        Thread-safe. Raises RuntimeError right away when the worker has
+        exited, and when its ring stays full for ``slot_timeout`` seconds,
+        i.e. the worker is falling behind.
+        """
+        if not self.started:
+            raise RuntimeError("Vision worker pool is not running")
+
+        gray = self._fit_to_slot(gray)
+        height, width = gray.shape
+        worker = self._workers[self._worker_index(session_id)]
+        if not worker.process.is_alive():
+            raise RuntimeError(f"Vision worker {worker.index} is not running")
+        try:
+            slot = worker.free_slots.get(timeout=self.slot_timeout)
+        except queue.Empty:
+            raise RuntimeError(f"Vision worker {worker.index} has no free frame slots")
+
+        worker.ring[slot, :height * width] = gray.reshape(-1)
+
+        job_id = next(self._job_ids)
+        future: Future = Future()
+        with self._futures_lock:
+            self._futures[job_id] = (future, worker.index, slot)
+        worker.tasks.put(("frame", job_id, session_id, slot, height, width, detector))
+        return future
+
+    def release_session(self, session_id: str):
+        """
+        Drop the tracker state held for a session in its worker process.
+        """
+        if self.started:
+            self._workers[self._worker_index(session_id)].tasks.put(("release", session_id))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "processes": len(self._workers),
+            "in_flight": len(self._futures),
+            "free_slots": [worker.free_slots.qsize() for worker in self._workers],
+            "restarts": self.restarts
+        }
+
+    def _worker_index(self, session_id: str) -> int:
+        # Stable across calls (unlike hash()) so a session keeps its worker
+        return zlib.crc32(session_id.encode()) % len(self._workers)
+
+    def _fit_to_slot(self, gray: np.ndarray) -> np.ndarray:
+        if gray.size <= self.slot_bytes:
+            return np.ascontiguousarray(gray)
+        scale = math.sqrt(self.slot_bytes / gray.size)
+        height, width = gray.shape
+        return cv2.resize(
+            gray,
+            (max(1, int(width * scale)), max(1, int(height * scale))),
+            interpolation=cv2.INTER_AREA
+        )
+
+    def check_workers(self):
+        """
+        Replace exited workers, failing their outstanding futures and freeing
+        the slots those held.
+        """
+        with self._liveness_lock:
+            for worker in self._workers:
+                if worker.process.is_alive():
+                    continue
+                logger.error(
+                    f"Vision worker {worker.index} exited with code "
+                    f"{worker.process.exitcode}, restarting"
+                )
+                # Sweep the dead worker's jobs before its replacement can be
+                # handed new ones, so no live job's slot is freed
+                with self._futures_lock:
+                    lost = [
+                        job_id for job_id, (_, index, _) in self._futures.items()
+                        if index == worker.index
+                    ]
+                    entries = [self._futures.pop(job_id) for job_id in lost]
+                for _, _, slot in entries:
+                    worker.free_slots.put(slot)
+                worker.spawn(self._ctx, self._detector_backend)
+                worker.start()
+                self.restarts += 1
+                for future, _, _ in entries:
+                    if not future.done():
+                        future.set_exception(RuntimeError(f"Vision worker {worker.index} exited"))
+
+    def _collect_results(self):
+        last_check = time.monotonic()
+        while True:
+            readers = {worker.results: (worker, worker.process) for worker in self._workers}
+            ready = connection.wait([self._wake_reader, *readers], timeout=self.liveness_interval)
+            if self._wake_reader in ready:
+                return
+
+            exited = False
+            for reader in ready:
+                worker, process = readers[reader]
+                try:
+                    item: Tuple[int, int, Any, Optional[str]] = reader.recv()
+                except (EOFError, OSError):
+                    # The worker is gone or going; make sure before replacing it
+                    process.join(timeout=1)
+                    if process.is_alive():
+                        process.kill()
+                        process.join()
+                    exited = True
+                    continue
+                self._deliver(worker, item)
+
+            if exited or time.monotonic() - last_check >= self.liveness_interval:
+                self.check_workers()
+                last_check = time.monotonic()
+
+    def _deliver(self, worker: _Worker, item: Tuple[int, int, Any, Optional[str]]):
+        job_id, slot, metrics, error = item
+        with self._futures_lock:
+            entry = self._futures.pop(job_id, None)
+        if entry is None:
+            # Failed when its worker died; the slot was freed then
+            return
+        future, _, _ = entry
+        worker.free_slots.put(slot)
+        if future.done():
+            # The caller stopped waiting; only the slot mattered
+            return
+        if error is not None:
+            future.set_exception(RuntimeError(error))
+        else:
+            future.set_result(metrics)
+
+
+# Started at application startup when VISION_WORKER_MODE is "process"
+vision_worker_pool = VisionWorkerPool()
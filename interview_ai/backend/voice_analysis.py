@@ -1,42 +1,54 @@
-import cv2
-import mediapipe as mp
 import numpy as np
-import sounddevice as sd
-import scipy.signal
-import speech_recognition as sr
-import librosa
 from typing import Dict, Any
 import logging
-import os
-from pydub import AudioSegment
+from .lazy_imports import lazy_import
+from .pitch import pitch_statistics
+from .audio_decoder import decode_audio
 
-mp_face_mesh = mp.solutions.face_mesh.FaceMesh()
+cv2 = lazy_import("cv2")
+mp = lazy_import("mediapipe")
+sr = lazy_import("speech_recognition")
+librosa = lazy_import("librosa")
+
+_face_mesh = None
 logger = logging.getLogger(__name__)
 
+def _get_face_mesh():
+    """
+    Build the FaceMesh model on first use rather than at import time.
+    """
+    global _face_mesh
+    if _face_mesh is None:
+        _face_mesh = mp.solutions.face_mesh.FaceMesh()
+    return _face_mesh
+
 class VoiceAnalyzer:
+    # librosa.load's default rate, which the file-based analyses resampled to
+    sample_rate = 22050
+
     def __init__(self):
         self.recognizer = sr.Recognizer()
         self.recognizer.energy_threshold = 300
         self.recognizer.dynamic_energy_threshold = True
         self.recognizer.pause_threshold = 0.8
 
-    def extract_audio_from_video(self, video_path: str) -> str:
+    def load_audio(self, video_path: str) -> np.ndarray:
+        """
+        Decode the audio track once, in memory, into mono float32 samples
+        at ``sample_rate``. Every analysis shares the returned array.
+        """
         try:
-            audio_path = video_path.rsplit('.', 1)[0] + '.wav'
-            video = AudioSegment.from_file(video_path)
-            video.export(audio_path, format="wav")
-            return audio_path
+            return decode_audio(video_path, self.sample_rate)
         except Exception as e:
             logger.error(f"Error extracting audio: {str(e)}")
             raise
 
-    def analyze_speech_rate(self, audio_path: str) -> float:
+    def analyze_speech_rate(self, y: np.ndarray) -> float:
         try:
-            y, sr = librosa.load(audio_path)
             # Get onset frames
-            onset_frames = librosa.onset.onset_detect(y=y, sr=sr)
+            onset_frames = librosa.onset.onset_detect(y=y, sr=self.sample_rate)
             # Calculate speech rate (words per minute)
-            duration = librosa.get_duration(y=y, sr=sr)
+            duration = len(y) / self.sample_rate
             if duration > 0:
                 return len(onset_frames) / duration * 60
             return 0
@@ -44,26 +56,16 @@ class VoiceAnalyzer:
             logger.error(f"Error analyzing speech rate: {str(e)}")
             return 0
 
-    def analyze_pitch(self, audio_path: str) -> Dict[str, float]:
+    def analyze_pitch(self, y: np.ndarray) -> Dict[str, float]:
         try:
-            y, sr = librosa.load(audio_path)
-            # Extract pitch
-            pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-            # Get mean pitch
-            mean_pitch = np.mean(pitches[magnitudes > magnitudes.mean()])
-            # Get pitch variation
-            pitch_std = np.std(pitches[magnitudes > magnitudes.mean()])
-            return {
-                "mean_pitch": float(mean_pitch),
-                "pitch_variation": float(pitch_std)
-            }
+            # Mean pitch and pitch variation with the configured estimator
+            return pitch_statistics(y, self.sample_rate)
         except Exception as e:
             logger.error(f"Error analyzing pitch: {str(e)}")
             return {"mean_pitch": 0, "pitch_variation": 0}
 
-    def analyze_volume(self, audio_path: str) -> Dict[str, float]:
+    def analyze_volume(self, y: np.ndarray) -> Dict[str, float]:
         try:
-            y, sr = librosa.load(audio_path)
             # Calculate RMS energy
             rms = librosa.feature.rms(y=y)
             mean_volume = float(np.mean(rms))
@@ -78,13 +80,13 @@ class VoiceAnalyzer:
 
     def analyze_voice(self, video_path: str) -> Dict[str, Any]:
         try:
-            # Extract audio from video
-            audio_path = self.extract_audio_from_video(video_path)
+            # Decode once; no temporary WAV and no per-analysis reload
+            y = self.load_audio(video_path)
             
             # Perform various analyses
-            speech_rate = self.analyze_speech_rate(audio_path)
-            pitch_analysis = self.analyze_pitch(audio_path)
-            volume_analysis = self.analyze_volume(audio_path)
+            speech_rate = self.analyze_speech_rate(y)
+            pitch_analysis = self.analyze_pitch(y)
+            volume_analysis = self.analyze_volume(y)
 
             # Calculate overall voice quality score
             voice_score = self._calculate_voice_score(
@@ -93,10 +95,6 @@ class VoiceAnalyzer:
                 volume_analysis
             )
 
-            # Clean up temporary audio file
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
-
             return {
                 "speech_rate": round(speech_rate, 2),
                 "pitch_analysis": {
@@ -143,7 +141,7 @@ def analyze_video():
             break
 
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = mp_face_mesh.process(frame_rgb)
+        results = _get_face_mesh().process(frame_rgb)
 
         if results.multi_face_landmarks:
             analysis_result["eye_contact"] = "Good" if check_eye_contact(results) else "Poor"
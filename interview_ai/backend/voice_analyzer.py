@@ -1,15 +1,85 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+from functools import cached_property
 import numpy as np
-import librosa
-import io
-from pydub import AudioSegment
-import sounddevice as sd
-import asyncio
-import soundfile as sf
+import time
+from .lazy_imports import lazy_import
+from .quality_tiers import audio_governor
+from .config import PITCH_ESTIMATOR, AUDIO_DECODE_SAMPLE_RATE, VAD_ENABLED
+from .pitch import pitch_statistics, voiced_pitches
+from .audio_decoder import AudioDecodeError, decode_audio
+from .vad import detect_speech
+from .audio_workers import audio_worker_pool
+
+librosa = lazy_import("librosa")
 
 logger = logging.getLogger(__name__)
 
+# Sample rate of the module-level voice analysis functions
+SAMPLE_RATE = AUDIO_DECODE_SAMPLE_RATE
+
+class SpectralFeatures:
+    """
+    Per-clip spectral features shared by every voice metric.
+
+    The STFT magnitude is computed once; the onset envelope, onset frames,
+    RMS energy and piptrack pitch track are all derived from it on first
+    use, so no metric runs its own STFT and the onset envelope is never
+    recomputed. Other pitch estimators work on the samples directly.
+    """
+
+    def __init__(
+        self,
+        y: np.ndarray,
+        sample_rate: int,
+        n_fft: int,
+        hop_length: int,
+        pitch_estimator: str = PITCH_ESTIMATOR
+    ):
+        self.y = y
+        self.sample_rate = sample_rate
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.pitch_estimator = pitch_estimator
+
+    @cached_property
+    def magnitude(self) -> np.ndarray:
+        return np.abs(librosa.stft(self.y, n_fft=self.n_fft, hop_length=self.hop_length))
+
+    @cached_property
+    def onset_envelope(self) -> np.ndarray:
+        # Same log-power mel spectrogram onset_strength builds from y
+        mel = librosa.feature.melspectrogram(S=self.magnitude ** 2, sr=self.sample_rate)
+        return librosa.onset.onset_strength(S=librosa.power_to_db(mel), sr=self.sample_rate)
+
+    @cached_property
+    def onset_frames(self) -> np.ndarray:
+        return librosa.onset.onset_detect(
+            onset_envelope=self.onset_envelope,
+            sr=self.sample_rate,
+            hop_length=self.hop_length
+        )
+
+    @cached_property
+    def rms(self) -> np.ndarray:
+        return librosa.feature.rms(S=self.magnitude, frame_length=self.n_fft, hop_length=self.hop_length)[0]
+
+    @cached_property
+    def pitch_track(self) -> Tuple[np.ndarray, np.ndarray]:
+        return librosa.piptrack(
+            S=self.magnitude,
+            sr=self.sample_rate,
+            n_fft=self.n_fft,
+            hop_length=self.hop_length
+        )
+
+    @cached_property
+    def voiced_pitches(self) -> np.ndarray:
+        if self.pitch_estimator == "piptrack":
+            pitches, magnitudes = self.pitch_track
+            return pitches[magnitudes > 0]
+        return voiced_pitches(self.y, self.sample_rate, self.pitch_estimator)
+
 class VoiceAnalyzer:
     def __init__(self):
         self.sample_rate = 16000
@@ -19,73 +89,116 @@ class VoiceAnalyzer:
     async def analyze(self, video_data: bytes) -> Dict[str, float]:
         """
         Analyze voice metrics from video data.
+
+        The analysis runs on the audio worker pool so it never blocks the
+        event loop. Under load the quality tier drops pitch tracking
+        (``reduced``) and then everything but volume (``minimal``); skipped
+        metrics keep their neutral default, as do metrics a job could not
+        reach before its deadline (then marked ``partial``).
+        """
+        with audio_governor.job() as job:
+            result = await audio_worker_pool.analyze(video_data, job.tier)
+            if result is None:
+                metrics = self._get_default_metrics()
+                metrics["partial"] = True
+                return metrics
+            metrics, seconds = result
+            job.units = max(seconds, 1e-3)
+            return metrics
+
+    def analyze_clip(
+        self,
+        video_data: bytes,
+        tier: str = "full",
+        deadline: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], float]:
         """
+        Decode and analyze a clip synchronously. Returns the metrics and the
+        seconds of audio analyzed. ``deadline`` is a ``time.time()`` value.
+        """
+        if deadline is not None and time.time() >= deadline:
+            # Waited in the queue past its deadline; don't start it
+            metrics = self._get_default_metrics()
+            metrics["partial"] = True
+            return metrics, 0.0
+
         try:
-            # Extract audio from video data
-            audio_data = self._extract_audio(video_data)
-            if audio_data is None:
-                logger.error("Failed to extract audio from video")
-                return self._get_default_metrics()
-            
-            # Load audio data using librosa
-            y, sr = librosa.load(io.BytesIO(audio_data), sr=self.sample_rate)
+            # Decode straight to mono float32 at the analysis rate
+            y = decode_audio(video_data, self.sample_rate)
+        except AudioDecodeError as e:
+            logger.error(f"Failed to extract audio from video: {str(e)}")
+            metrics = self._get_default_metrics()
+            metrics["quality_tier"] = tier
+            metrics["partial"] = True
+            return metrics, 0.0
+        return self.analyze_samples(y, tier, deadline), len(y) / self.sample_rate
+
+    def analyze_samples(
+        self,
+        y: np.ndarray,
+        tier: str = "full",
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze decoded mono samples at ``sample_rate``.
+
+        Speech segments are found first and spectral features are only
+        extracted from them, so silent thinking time costs nothing. Speaking
+        time and pause statistics come from the same pass; speech rate and
+        fluency then describe the speech itself, with pauses reported
+        separately. Past ``deadline`` the remaining stages are skipped.
+        """
+        metrics = self._get_default_metrics()
+        metrics["quality_tier"] = tier
+        metrics["partial"] = False
+
+        def expired() -> bool:
+            if deadline is not None and time.time() >= deadline:
+                metrics["partial"] = True
+            return metrics["partial"]
+
+        try:
+            if VAD_ENABLED:
+                activity = detect_speech(y, self.sample_rate)
+                metrics.update(activity.metrics())
+                if not len(activity.segments):
+                    # Nothing was said
+                    metrics["volume"] = 0.0
+                    return metrics
+                y = activity.speech_audio(y)
+
+            features = SpectralFeatures(y, self.sample_rate, self.n_fft, self.hop_length)
             
-            # Calculate metrics
-            speech_rate = self._calculate_speech_rate(y)
-            volume = self._calculate_volume(y)
-            pitch = self._calculate_pitch(y)
-            fluency = self._calculate_fluency(y)
+            # Calculate metrics, cheapest first
+            if expired():
+                return metrics
+            metrics["volume"] = self._calculate_volume(features)
+            if tier == "minimal" or expired():
+                return metrics
+            metrics["speech_rate"] = self._calculate_speech_rate(features)
+            metrics["fluency"] = self._calculate_fluency(features)
+            if tier == "full" and not expired():
+                metrics["pitch"] = self._calculate_pitch(features)
             
-            return {
-                "speech_rate": speech_rate,
-                "volume": volume,
-                "pitch": pitch,
-                "fluency": fluency
-            }
+            return metrics
             
         except Exception as e:
             logger.error(f"Error analyzing voice: {str(e)}")
-            return self._get_default_metrics()
-    
-    def _extract_audio(self, video_data: bytes) -> bytes:
-        """
-        Extract audio data from video data.
-        """
-        try:
-            # Create a temporary file to store the video data
-            with io.BytesIO(video_data) as video_buffer:
-                # Use soundfile to read the audio data
-                audio_data, _ = sf.read(video_buffer)
-                
-                # Convert to mono if stereo
-                if len(audio_data.shape) > 1:
-                    audio_data = audio_data.mean(axis=1)
-                
-                # Convert to 16-bit PCM
-                audio_data = (audio_data * 32767).astype(np.int16)
-                
-                # Save to bytes buffer
-                with io.BytesIO() as audio_buffer:
-                    sf.write(audio_buffer, audio_data, self.sample_rate, format='WAV')
-                    return audio_buffer.getvalue()
-                    
-        except Exception as e:
-            logger.error(f"Error extracting audio: {str(e)}")
-            return None
+            # Metrics the failed stage never reached keep their defaults
+            metrics["partial"] = True
+            return metrics
     
-    def _calculate_speech_rate(self, y: np.ndarray) -> float:
+    def _calculate_speech_rate(self, features: SpectralFeatures) -> float:
         """
         Calculate speech rate (words per minute).
         """
         try:
-            # Get onset strength
-            onset_env = librosa.onset.onset_strength(y=y, sr=self.sample_rate)
-            
-            # Find onset frames
-            onset_frames = librosa.onset.onset_detect(onset_envelope=onset_env)
-            
-            # Convert frames to time
-            onset_times = librosa.frames_to_time(onset_frames, sr=self.sample_rate)
+            # Convert onset frames to time
+            onset_times = librosa.frames_to_time(
+                features.onset_frames,
+                sr=self.sample_rate,
+                hop_length=self.hop_length
+            )
             
             # Calculate average time between onsets
             if len(onset_times) > 1:
@@ -104,16 +217,13 @@ class VoiceAnalyzer:
             logger.error(f"Error calculating speech rate: {str(e)}")
             return 0.5
     
-    def _calculate_volume(self, y: np.ndarray) -> float:
+    def _calculate_volume(self, features: SpectralFeatures) -> float:
         """
         Calculate average volume level.
         """
         try:
-            # Calculate RMS energy
-            rms = librosa.feature.rms(y=y)[0]
-            
-            # Calculate average RMS
-            avg_rms = np.mean(rms)
+            # Calculate average RMS energy
+            avg_rms = np.mean(features.rms)
             
             # Normalize to 0-1 range
             return min(max(avg_rms * 10, 0.0), 1.0)
@@ -122,18 +232,17 @@ class VoiceAnalyzer:
             logger.error(f"Error calculating volume: {str(e)}")
             return 0.5
     
-    def _calculate_pitch(self, y: np.ndarray) -> float:
+    def _calculate_pitch(self, features: SpectralFeatures) -> float:
         """
         Calculate average pitch variation.
         """
         try:
-            # Get pitch track
-            pitches, magnitudes = librosa.piptrack(y=y, sr=self.sample_rate)
+            # Get pitch of voiced frames
+            pitches = features.voiced_pitches
             
             # Get mean pitch for voiced frames
-            voiced_frames = magnitudes > 0
-            if np.any(voiced_frames):
-                mean_pitch = np.mean(pitches[voiced_frames])
+            if pitches.size:
+                mean_pitch = np.mean(pitches)
                 
                 # Normalize to 0-1 range (typical range is 100-300 Hz)
                 return min(max((mean_pitch - 100) / 200, 0.0), 1.0)
@@ -144,16 +253,12 @@ class VoiceAnalyzer:
             logger.error(f"Error calculating pitch: {str(e)}")
             return 0.5
     
-    def _calculate_fluency(self, y: np.ndarray) -> float:
+    def _calculate_fluency(self, features: SpectralFeatures) -> float:
         """
         Calculate speech fluency score.
         """
         try:
-            # Get onset strength
-            onset_env = librosa.onset.onset_strength(y=y, sr=self.sample_rate)
-            
-            # Find onset frames
-            onset_frames = librosa.onset.onset_detect(onset_envelope=onset_env)
+            onset_frames = features.onset_frames
             
             # Calculate intervals between onsets
             if len(onset_frames) > 1:
@@ -228,16 +333,8 @@ def _extract_audio_from_video(video_data: bytes) -> np.ndarray:
     Extract audio data from video bytes.
     """
     try:
-        # Create a BytesIO object from the video data
-        video_stream = io.BytesIO(video_data)
-        
-        # Convert video to audio using pydub
-        video = AudioSegment.from_file(video_stream)
-        audio = video.set_channels(1).set_frame_rate(44100)
-        
-        # Convert to numpy array
-        samples = np.array(audio.get_array_of_samples())
-        return samples
+        # ffmpeg decodes, downmixes and resamples in a single pass
+        return decode_audio(video_data, SAMPLE_RATE)
         
     except Exception as e:
         logger.error(f"Error extracting audio: {str(e)}")
@@ -249,10 +346,10 @@ def _analyze_speech_rate(audio_data: np.ndarray) -> float:
     """
     try:
         # Get onset frames
-        onset_frames = librosa.onset.onset_detect(y=audio_data, sr=44100)
+        onset_frames = librosa.onset.onset_detect(y=audio_data, sr=SAMPLE_RATE)
         
         # Calculate speech rate (words per minute)
-        duration = librosa.get_duration(y=audio_data, sr=44100)
+        duration = librosa.get_duration(y=audio_data, sr=SAMPLE_RATE)
         if duration > 0:
             return len(onset_frames) / duration * 60
         return 0
@@ -266,19 +363,8 @@ def _analyze_pitch(audio_data: np.ndarray) -> Dict[str, float]:
     Analyze pitch characteristics.
     """
     try:
-        # Extract pitch
-        pitches, magnitudes = librosa.piptrack(y=audio_data, sr=44100)
-        
-        # Get mean pitch
-        mean_pitch = np.mean(pitches[magnitudes > magnitudes.mean()])
-        
-        # Get pitch variation
-        pitch_std = np.std(pitches[magnitudes > magnitudes.mean()])
-        
-        return {
-            "mean_pitch": float(mean_pitch),
-            "pitch_variation": float(pitch_std)
-        }
+        # Mean pitch and pitch variation with the configured estimator
+        return pitch_statistics(audio_data, SAMPLE_RATE)
         
     except Exception as e:
         logger.error(f"Error analyzing pitch: {str(e)}")
@@ -0,0 +1,115 @@
+import threading
+import types
+
+import pytest
+from backend import face_analyzer
+from backend.analyzer_pool import AnalyzerPool, AnalyzerPoolTimeout
+from backend.face_analyzer import FaceAnalyzer
+
+class Model:
+    live = 0
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        Model.live += 1
+
+    def close(self):
+        Model.live -= 1
+
+@pytest.fixture
+def fake_mediapipe(monkeypatch):
+    Model.live = 0
+    solutions = types.SimpleNamespace(
+        face_mesh=types.SimpleNamespace(FaceMesh=Model),
+        holistic=types.SimpleNamespace(Holistic=Model)
+    )
+    monkeypatch.setattr(face_analyzer, "mp", types.SimpleNamespace(solutions=solutions))
+
+def test_checkout_builds_lazily_and_reuses():
+    pool = AnalyzerPool(object, size=2)
+
+    first = pool.checkout()
+    pool.checkin(first)
+    second = pool.checkout()
+
+    assert second is first
+    assert pool.stats()["created"] == 1
+
+def test_warmup_builds_up_to_size():
+    pool = AnalyzerPool(object, size=3)
+    pool.warmup()
+
+    assert pool.stats()["created"] == 3
+    assert pool.stats()["idle"] == 3
+
+def test_exhausted_pool_times_out():
+    pool = AnalyzerPool(object, size=1)
+    held = pool.checkout()
+
+    with pytest.raises(AnalyzerPoolTimeout):
+        pool.checkout(timeout=0.05)
+    assert pool.stats()["created"] == 1
+    pool.checkin(held)
+
+def test_waiting_borrower_gets_released_analyzer():
+    pool = AnalyzerPool(object, size=1)
+    held = pool.checkout()
+    timer = threading.Timer(0.05, pool.checkin, args=(held,))
+    timer.start()
+
+    with pool.borrow(timeout=5) as analyzer:
+        assert analyzer is held
+    assert pool.stats()["idle"] == 1
+    assert pool.stats()["wait_seconds"] > 0
+
+def test_borrow_returns_analyzer_on_error():
+    pool = AnalyzerPool(object, size=1)
+
+    with pytest.raises(ValueError):
+        with pool.borrow():
+            raise ValueError("analysis failed")
+    assert pool.stats()["idle"] == 1
+
+def test_failed_factory_does_not_use_up_capacity():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("model failed to load")
+        return object()
+
+    pool = AnalyzerPool(flaky, size=1)
+    with pytest.raises(RuntimeError):
+        pool.checkout()
+
+    assert pool.checkout() is not None
+    assert pool.stats()["created"] == 1
+
+def test_face_analyzer_holds_one_model(fake_mediapipe):
+    analyzer = FaceAnalyzer()
+    assert Model.live == 1
+
+    refined = analyzer._model_for("mesh_refined", with_body=False)
+    assert analyzer._model_for("mesh_refined", with_body=False) is refined
+
+    # Switching tier or adding posture replaces the model instead of adding one
+    holistic = analyzer._model_for("mesh", with_body=True)
+    assert holistic is not refined
+    assert holistic.kwargs["refine_face_landmarks"] is False
+    assert Model.live == 1
+    assert analyzer._model_for("haar", with_body=True) is None
+
+    analyzer.close()
+    assert Model.live == 0
+
+def test_pool_caps_models(fake_mediapipe):
+    pool = AnalyzerPool(FaceAnalyzer, size=2)
+    pool.warmup()
+
+    for tier in ("mesh_refined", "mesh"):
+        for with_body in (False, True):
+            with pool.borrow() as analyzer:
+                analyzer._model_for(tier, with_body)
+
+    assert Model.live == 2
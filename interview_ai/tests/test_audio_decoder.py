@@ -0,0 +1,93 @@
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+from backend.audio_decoder import AudioDecodeError, decode_audio
+
+def _fake_ffmpeg(tmp_path, body: str) -> str:
+    # Stands in for ffmpeg: treats its input as f32le PCM and passes it through
+    script = tmp_path / "ffmpeg"
+    script.write_text(f"#!{sys.executable}\n" + textwrap.dedent(body))
+    script.chmod(0o755)
+    return str(script)
+
+PASS_THROUGH = """
+    import shutil, sys
+    source = sys.argv[sys.argv.index("-i") + 1]
+    if source == "pipe:0":
+        shutil.copyfileobj(sys.stdin.buffer, sys.stdout.buffer)
+    else:
+        with open(source, "rb") as f:
+            shutil.copyfileobj(f, sys.stdout.buffer)
+"""
+
+def test_bytes_are_streamed_through_the_pipe(tmp_path):
+    samples = np.random.default_rng(0).uniform(-1, 1, 100_000).astype("<f4")
+    binary = _fake_ffmpeg(tmp_path, PASS_THROUGH)
+
+    # A tiny initial buffer and block size force many reads and regrowth
+    decoded = decode_audio(samples.tobytes(), 16000, binary=binary, block_bytes=4096, initial_seconds=0.1)
+
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, samples)
+
+def test_file_path_is_passed_to_ffmpeg(tmp_path):
+    samples = np.linspace(-1, 1, 1000, dtype="<f4")
+    clip = tmp_path / "answer.pcm"
+    clip.write_bytes(samples.tobytes())
+
+    decoded = decode_audio(str(clip), 16000, binary=_fake_ffmpeg(tmp_path, PASS_THROUGH))
+
+    np.testing.assert_array_equal(decoded, samples)
+
+def test_ffmpeg_failure_is_reported(tmp_path):
+    binary = _fake_ffmpeg(tmp_path, """
+        import sys
+        sys.stderr.write("Invalid data found when processing input")
+        sys.exit(1)
+    """)
+
+    with pytest.raises(AudioDecodeError, match="Invalid data"):
+        decode_audio(b"not media" * 10_000, 16000, binary=binary)
+
+def test_stuck_decode_is_killed(tmp_path):
+    binary = _fake_ffmpeg(tmp_path, """
+        import time
+        time.sleep(30)
+    """)
+
+    with pytest.raises(AudioDecodeError, match="within"):
+        decode_audio(str(tmp_path / "missing.webm"), 16000, binary=binary, timeout=0.5)
+
+def test_missing_ffmpeg(tmp_path):
+    with pytest.raises(AudioDecodeError, match="not found"):
+        decode_audio(b"", 16000, binary=str(tmp_path / "no-ffmpeg"))
+
+def test_chatty_stderr_does_not_stall_decode(tmp_path):
+    # Far more warnings than a pipe buffer holds, written before any output
+    binary = _fake_ffmpeg(tmp_path, """
+        import shutil, sys
+        for i in range(20_000):
+            sys.stderr.write(f"warning {i}: non-monotonic DTS\\n")
+        sys.stderr.flush()
+        shutil.copyfileobj(sys.stdin.buffer, sys.stdout.buffer)
+    """)
+    samples = np.linspace(-1, 1, 1000, dtype="<f4")
+
+    decoded = decode_audio(samples.tobytes(), 16000, binary=binary, timeout=10)
+
+    np.testing.assert_array_equal(decoded, samples)
+
+def test_failure_reports_end_of_long_stderr(tmp_path):
+    binary = _fake_ffmpeg(tmp_path, """
+        import sys
+        for i in range(20_000):
+            sys.stderr.write(f"warning {i}\\n")
+        sys.stderr.write("Invalid data found when processing input")
+        sys.exit(1)
+    """)
+
+    with pytest.raises(AudioDecodeError, match="Invalid data") as error:
+        decode_audio(b"not media", 16000, binary=binary, timeout=10)
+    assert "warning 0\n" not in str(error.value)
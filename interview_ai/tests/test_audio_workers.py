@@ -0,0 +1,136 @@
+import asyncio
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+from backend import audio_workers, voice_analyzer
+from backend.audio_workers import AudioWorkerPool
+from backend.voice_analyzer import VoiceAnalyzer
+
+def test_expired_deadline_returns_partial_metrics():
+    analyzer = VoiceAnalyzer()
+    t = np.arange(2 * analyzer.sample_rate) / analyzer.sample_rate
+    silence = np.zeros(analyzer.sample_rate)
+    y = np.concatenate([silence, 0.2 * np.sin(2 * np.pi * 150 * t), silence]).astype(np.float32)
+
+    metrics = analyzer.analyze_samples(y, "full", deadline=time.time() - 1)
+
+    # Speech detection still ran; spectral features were skipped
+    assert metrics["partial"] is True
+    assert metrics["speaking_time"] > 1.5
+    assert metrics["quality_tier"] == "full"
+
+def test_failed_analysis_is_partial(monkeypatch):
+    def fail(*args):
+        raise RuntimeError("stft failed")
+
+    monkeypatch.setattr(voice_analyzer, "SpectralFeatures", fail)
+    analyzer = VoiceAnalyzer()
+    t = np.arange(2 * analyzer.sample_rate) / analyzer.sample_rate
+    silence = np.zeros(analyzer.sample_rate)
+    y = np.concatenate([silence, 0.2 * np.sin(2 * np.pi * 150 * t), silence]).astype(np.float32)
+
+    metrics = analyzer.analyze_samples(y, "reduced")
+
+    assert metrics["partial"] is True
+    assert metrics["quality_tier"] == "reduced"
+    assert metrics["volume"] == 0.5
+
+def test_undecodable_clip_is_partial(monkeypatch):
+    def fail(video_data, sample_rate):
+        raise voice_analyzer.AudioDecodeError("Invalid data found when processing input")
+
+    monkeypatch.setattr(voice_analyzer, "decode_audio", fail)
+
+    metrics, seconds = VoiceAnalyzer().analyze_clip(b"not audio", "minimal")
+
+    assert metrics["partial"] is True
+    assert metrics["quality_tier"] == "minimal"
+    assert seconds == 0.0
+
+def test_queued_past_deadline_is_not_started():
+    metrics, seconds = VoiceAnalyzer().analyze_clip(b"not audio", deadline=time.time() - 1)
+
+    assert metrics["partial"] is True
+    assert seconds == 0.0
+
+def test_overrunning_job_times_out(monkeypatch):
+    def slow_job(video_data, tier, deadline):
+        time.sleep(0.5)
+        return {"partial": False}, 1.0
+
+    monkeypatch.setattr(audio_workers, "_analyze_job", slow_job)
+    pool = AudioWorkerPool(processes=1, deadline_seconds=0.05, grace_seconds=0.05)
+
+    assert asyncio.run(pool.analyze(b"clip")) is None
+    assert pool.stats()["timed_out"] == 1
+
+def test_stats_count_queue_depth_and_utilization(monkeypatch):
+    def job(video_data, tier, deadline):
+        time.sleep(0.2)
+        return {"partial": tier == "minimal"}, 1.0
+
+    monkeypatch.setattr(audio_workers, "_analyze_job", job)
+    pool = AudioWorkerPool(processes=1, deadline_seconds=5)
+
+    async def run():
+        tasks = [asyncio.ensure_future(pool.analyze(b"clip", tier)) for tier in ("full", "minimal")]
+        await asyncio.sleep(0.05)
+        during = pool.stats()
+        await asyncio.gather(*tasks)
+        return during
+
+    during = asyncio.run(run())
+    after = pool.stats()
+
+    assert during["in_flight"] == 2
+    assert during["queue_depth"] == 1
+    assert after["in_flight"] == 0
+    assert after["completed"] == 2
+    assert after["partial"] == 1
+    assert 0.5 < after["utilization"] <= 1.0
+
+def test_process_pool_falls_back_to_defaults_on_bad_audio():
+    pool = AudioWorkerPool(processes=1, deadline_seconds=30)
+    pool.start()
+    try:
+        metrics, seconds = asyncio.run(pool.analyze(b"not audio"))
+    finally:
+        pool.stop()
+
+    assert seconds == 0.0
+    assert metrics["partial"] is True
+    for name, value in VoiceAnalyzer()._get_default_metrics().items():
+        assert metrics[name] == value
+
+class BrokenExecutor:
+    def __init__(self):
+        self.shutdowns = 0
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+    def shutdown(self, wait=True):
+        self.shutdowns += 1
+
+def test_broken_pool_is_replaced_once(monkeypatch):
+    pool = AudioWorkerPool(processes=1)
+    broken = BrokenExecutor()
+    replacements = []
+    monkeypatch.setattr(pool, "_new_executor", lambda: replacements.append(BrokenExecutor()) or replacements[-1])
+    pool._executor = broken
+
+    async def run():
+        return await asyncio.gather(*(pool.analyze(b"clip") for _ in range(3)))
+
+    assert asyncio.run(run()) == [None, None, None]
+    # Concurrent failures of one pool restart it once, and the
+    # replacement is left running
+    assert len(replacements) == 1
+    assert pool._executor is replacements[0]
+    assert replacements[0].shutdowns == 0
+    assert broken.shutdowns == 1
+    assert pool.stats()["failed"] == 3
@@ -0,0 +1,133 @@
+import os
+import types
+
+import cv2
+import numpy as np
+import pytest
+from backend import face_analyzer
+from backend.face_analyzer import FaceAnalyzer
+from backend.landmark_geometry import NUM_LANDMARKS
+
+FPS = 20
+CLIP_FRAMES = 20
+
+class FaceMesh:
+    """
+    Stands in for MediaPipe FaceMesh: every frame holds one face.
+    """
+
+    def __init__(self, **kwargs):
+        self.processed = 0
+        point = types.SimpleNamespace(x=0.5, y=0.5, z=0.0)
+        self._face = types.SimpleNamespace(landmark=[point] * NUM_LANDMARKS)
+
+    def process(self, image):
+        self.processed += 1
+        return types.SimpleNamespace(multi_face_landmarks=[self._face])
+
+    def close(self):
+        pass
+
+class BoxDetector:
+    """
+    Reports a centred face box in every frame.
+    """
+
+    def detect(self, image, min_size=None, max_size=None):
+        height, width = image.shape[:2]
+        return [(width // 4, height // 4, width // 2, height // 2)]
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    solutions = types.SimpleNamespace(face_mesh=types.SimpleNamespace(FaceMesh=FaceMesh))
+    monkeypatch.setattr(face_analyzer, "mp", types.SimpleNamespace(solutions=solutions))
+    return FaceAnalyzer()
+
+def _write_clip(path, static=False) -> str:
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), FPS, (64, 48))
+    rng = np.random.default_rng(0)
+    still = rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+    for _ in range(CLIP_FRAMES):
+        writer.write(still if static else rng.integers(0, 256, (48, 64, 3), dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+def test_clip_is_sampled_by_stride(analyzer, tmp_path):
+    metrics = analyzer.analyze_clip(_write_clip(tmp_path / "clip.avi"), stride=3)
+
+    # Frames 0, 3, ..., 18 are decoded; the rest are only grabbed
+    assert metrics["frame_count"] == 7
+    assert metrics["total_frames"] == CLIP_FRAMES
+    assert metrics["detected_frames"] == 7
+    assert metrics["face_detection_rate"] == 1.0
+    assert metrics["duration_seconds"] == pytest.approx(CLIP_FRAMES / FPS)
+    assert analyzer._model.processed == 7
+
+def test_clip_is_sampled_by_interval(analyzer, tmp_path):
+    metrics = analyzer.analyze_clip(_write_clip(tmp_path / "clip.avi"), stride=0, interval=0.25)
+
+    assert metrics["sample_stride"] == 5
+    assert metrics["frame_count"] == 4
+
+def test_landmarks_are_scored_across_chunks(analyzer, tmp_path, monkeypatch):
+    path = _write_clip(tmp_path / "clip.avi")
+    whole = analyzer.analyze_clip(path, stride=1)
+
+    monkeypatch.setattr(face_analyzer, "CLIP_LANDMARK_CHUNK", 3)
+    chunked = analyzer.analyze_clip(path, stride=1)
+
+    assert chunked["detected_frames"] == whole["detected_frames"] == CLIP_FRAMES
+    for key in ("eye_contact_rate", "head_position_score", "head_yaw", "head_pitch"):
+        assert chunked[key] == pytest.approx(whole[key])
+
+def test_static_frames_carry_landmarks_forward(analyzer, tmp_path):
+    metrics = analyzer.analyze_clip(_write_clip(tmp_path / "clip.avi", static=True), stride=1)
+
+    assert analyzer._model.processed == 1
+    assert metrics["carried_forward_frames"] == CLIP_FRAMES - 1
+    assert metrics["detected_frames"] == CLIP_FRAMES
+
+def test_bytes_are_spooled_and_removed(analyzer, tmp_path, monkeypatch):
+    with open(_write_clip(tmp_path / "clip.avi"), "rb") as clip:
+        data = clip.read()
+    spooled = []
+    capture = face_analyzer.cv2.VideoCapture
+    monkeypatch.setattr(
+        face_analyzer.cv2, "VideoCapture",
+        lambda path: spooled.append(path) or capture(path)
+    )
+
+    metrics = analyzer.analyze_clip(data, stride=2)
+
+    assert metrics["frame_count"] == 10
+    assert not os.path.exists(spooled[0])
+
+def test_haar_tier_scores_face_boxes(analyzer, tmp_path):
+    analyzer._haar_detector = BoxDetector()
+
+    metrics = analyzer.analyze_clip(_write_clip(tmp_path / "clip.avi"), stride=2, tier="haar")
+
+    assert analyzer._model.processed == 0
+    assert metrics["quality_tier"] == "haar"
+    assert metrics["frame_count"] == 10
+    assert metrics["face_detection_rate"] == 1.0
+    assert metrics["head_position_score"] > 0.9
+    # A face box is not eye contact
+    assert metrics["eye_contact_rate"] is None
+
+def test_tier_downgrade_does_not_raise_score(analyzer, tmp_path):
+    path = _write_clip(tmp_path / "clip.avi")
+    analyzer._haar_detector = BoxDetector()
+
+    mesh = analyzer.analyze_clip(path, stride=2, tier="mesh_refined")
+    haar = analyzer.analyze_clip(path, stride=2, tier="haar")
+
+    assert mesh["eye_contact_rate"] < 0.5
+    assert haar["confidence_score"] <= mesh["confidence_score"]
+
+def test_unreadable_clip_returns_defaults(analyzer, tmp_path):
+    metrics = analyzer.analyze_clip(str(tmp_path / "missing.webm"))
+
+    assert metrics["frame_count"] == 0
+    assert metrics["total_frames"] == 0
+    assert metrics["confidence_score"] == 0.0
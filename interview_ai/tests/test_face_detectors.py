@@ -0,0 +1,123 @@
+import threading
+import types
+
+import cv2
+import numpy as np
+import pytest
+from backend import face_detectors
+from backend.face_detectors import (
+    DETECTOR_BACKENDS,
+    DetectorUnavailable,
+    DnnFaceDetector,
+    FaceDetector,
+    FaceMeshDetector,
+    HaarFaceDetector,
+    benchmark_detectors,
+    choose_default_backend,
+    create_detector,
+    default_backend,
+    get_face_detector,
+    load_benchmark_frames,
+    select_detector
+)
+
+@pytest.fixture
+def empty_models_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(face_detectors, "FACE_MODELS_DIR", str(tmp_path))
+    monkeypatch.setattr(face_detectors, "_default_backend", face_detectors._default_backend)
+    monkeypatch.setattr(face_detectors, "_thread_local", threading.local())
+    return tmp_path
+
+def test_select_fastest_backend_meeting_tier():
+    latencies = {"haar": 4.0, "mediapipe": 6.0, "facemesh": 9.0, "dnn": 5.0}
+
+    assert select_detector(latencies, tier=1) == "haar"
+    assert select_detector(latencies, tier=2) == "dnn"
+    assert select_detector(latencies, tier=3) == "facemesh"
+
+def test_select_skips_unavailable_backends():
+    latencies = {"haar": 4.0, "mediapipe": None, "facemesh": None, "dnn": None}
+
+    assert select_detector(latencies, tier=1) == "haar"
+    assert select_detector(latencies, tier=2) is None
+
+def test_filter_sizes():
+    boxes = [(0, 0, 10, 10), (0, 0, 50, 60), (0, 0, 200, 200)]
+
+    assert FaceDetector._filter_sizes(boxes, (20, 20), (100, 100)) == [(0, 0, 50, 60)]
+    assert FaceDetector._filter_sizes(boxes, None, None) == boxes
+
+def test_dnn_backend_requires_model_files(tmp_path):
+    with pytest.raises(DetectorUnavailable):
+        DnnFaceDetector(models_dir=str(tmp_path))
+
+def test_base_detector_is_abstract():
+    with pytest.raises(TypeError):
+        FaceDetector()
+
+def test_auto_selection_falls_back_without_dnn_weights(empty_models_dir, monkeypatch):
+    # Leave only the backends that compete with dnn at the robust tier
+    monkeypatch.delitem(DETECTOR_BACKENDS, "mediapipe")
+    monkeypatch.delitem(DETECTOR_BACKENDS, "facemesh")
+
+    assert choose_default_backend(tier=2) == "haar"
+    assert default_backend() == "haar"
+
+def test_configured_dnn_without_weights_uses_haar(empty_models_dir):
+    with pytest.raises(DetectorUnavailable):
+        create_detector("dnn")
+
+    assert isinstance(get_face_detector("dnn"), HaarFaceDetector)
+
+def test_facemesh_detector_does_not_track_between_calls(monkeypatch):
+    built = []
+    face_mesh = types.SimpleNamespace(FaceMesh=lambda **kwargs: built.append(kwargs))
+    monkeypatch.setattr(face_detectors, "mp", types.SimpleNamespace(solutions=types.SimpleNamespace(face_mesh=face_mesh)))
+
+    FaceMeshDetector()
+
+    assert built[0]["static_image_mode"] is True
+
+class RecordingDetector(FaceDetector):
+    name = "recording"
+    frames = []
+
+    def detect(self, image, min_size=None, max_size=None):
+        RecordingDetector.frames.append(image)
+        return []
+
+def test_benchmark_frames_are_loaded_from_images(tmp_path):
+    cv2.imwrite(str(tmp_path / "face.png"), np.full((480, 640, 3), 128, dtype=np.uint8))
+    cv2.imwrite(str(tmp_path / "face.jpg"), np.full((100, 100), 50, dtype=np.uint8))
+    (tmp_path / "notes.txt").write_text("not an image")
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+
+    frames = load_benchmark_frames([str(tmp_path)])
+
+    assert len(frames) == 2
+    assert all(frame.shape == (face_detectors.LIVE_FRAME_HEIGHT, face_detectors.LIVE_FRAME_WIDTH) for frame in frames)
+
+def test_benchmark_uses_configured_face_images(tmp_path, monkeypatch):
+    cv2.imwrite(str(tmp_path / "face.png"), np.full((480, 640), 77, dtype=np.uint8))
+    monkeypatch.setattr(face_detectors, "FACE_BENCHMARK_IMAGES", str(tmp_path))
+    monkeypatch.setitem(DETECTOR_BACKENDS, "recording", RecordingDetector)
+    RecordingDetector.frames = []
+
+    latencies = benchmark_detectors(["recording"], repeats=1)
+
+    assert latencies["recording"] is not None
+    assert all((frame == 77).all() for frame in RecordingDetector.frames)
+
+def test_benchmark_falls_back_to_synthetic_frames(empty_models_dir, monkeypatch):
+    monkeypatch.setattr(face_detectors, "FACE_BENCHMARK_IMAGES", str(empty_models_dir / "benchmark"))
+    monkeypatch.setitem(DETECTOR_BACKENDS, "recording", RecordingDetector)
+    RecordingDetector.frames = []
+
+    benchmark_detectors(["recording"], repeats=1)
+
+    assert len(RecordingDetector.frames) == 2 + len(face_detectors._benchmark_frames())
+
+def test_unknown_backend():
+    assert set(DETECTOR_BACKENDS) == {"haar", "mediapipe", "facemesh", "dnn"}
+    with pytest.raises(ValueError):
+        create_detector("missing")
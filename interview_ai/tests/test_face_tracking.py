@@ -0,0 +1,128 @@
+import cv2
+import numpy as np
+from backend.face_tracking import FaceTracker, analyze_gray_frame
+
+HEIGHT, WIDTH = 240, 320
+# Smooth texture so template matching survives sub-pixel shifts
+FACE = cv2.GaussianBlur(
+    np.random.default_rng(1).integers(0, 256, (48, 40), dtype=np.uint8), (7, 7), 2
+)
+
+class ScriptedDetector:
+    """
+    Finds ``box`` in full frames; window searches return ``window_boxes``.
+    """
+
+    def __init__(self, box=None):
+        self.box = box
+        self.window_boxes = []
+        self.full_calls = 0
+        self.window_calls = 0
+
+    def detect(self, image, min_size=None, max_size=None):
+        if image.shape == (HEIGHT, WIDTH):
+            self.full_calls += 1
+            return [self.box] if self.box is not None else []
+        self.window_calls += 1
+        return list(self.window_boxes)
+
+def _frame(x=None, y=None) -> np.ndarray:
+    frame = np.random.default_rng(2).normal(100, 3, (HEIGHT, WIDTH)).clip(0, 255).astype(np.uint8)
+    if x is not None:
+        frame[y:y + FACE.shape[0], x:x + FACE.shape[1]] = FACE
+    return frame
+
+def test_face_is_tracked_between_detections():
+    tracker = FaceTracker(enabled=True, redetect_interval=15, min_confidence=0.6, padding=0.5)
+    detector = ScriptedDetector(box=(140, 100, 40, 48))
+    tracker.update(_frame(140, 100), detector)
+
+    box, mode = tracker.update(_frame(146, 97), detector)
+
+    assert mode == "tracked"
+    assert detector.full_calls == 1
+    assert abs(box[0] - 146) <= 2 and abs(box[1] - 97) <= 2
+
+def test_redetects_on_interval():
+    tracker = FaceTracker(enabled=True, redetect_interval=3, min_confidence=0.6, padding=0.5)
+    detector = ScriptedDetector(box=(140, 100, 40, 48))
+
+    modes = [tracker.update(_frame(140, 100), detector)[1] for _ in range(4)]
+
+    assert modes == ["detect", "tracked", "tracked", "detect"]
+    assert detector.full_calls == 2
+
+def test_lost_face_falls_back_to_window_then_full_detection():
+    tracker = FaceTracker(enabled=True, redetect_interval=15, min_confidence=0.6, padding=0.5)
+    detector = ScriptedDetector(box=(140, 100, 40, 48))
+    tracker.update(_frame(140, 100), detector)
+
+    # The candidate left the frame
+    detector.box = None
+    box, mode = tracker.update(_frame(), detector)
+
+    assert (box, mode) == (None, "detect")
+    assert detector.window_calls == 1
+    assert tracker.box is None
+
+    # Back in view: found again by a full detection
+    detector.box = (60, 50, 40, 48)
+    box, mode = tracker.update(_frame(60, 50), detector)
+    assert (box, mode) == ((60, 50, 40, 48), "detect")
+
+def test_weak_match_is_recovered_in_window():
+    tracker = FaceTracker(enabled=True, redetect_interval=15, min_confidence=0.6, padding=0.5)
+    detector = ScriptedDetector(box=(140, 100, 40, 48))
+    tracker.update(_frame(140, 100), detector)
+
+    # Template no longer matches, but the detector finds a face near the last box
+    detector.window_boxes = [(20, 24, 40, 48)]
+    box, mode = tracker.update(_frame(), detector)
+
+    assert mode == "window"
+    # Window origin is the last box minus its padding
+    assert box == (120 + 20, 76 + 24, 40, 48)
+    assert detector.full_calls == 1
+
+def test_search_window_is_clamped_to_frame():
+    tracker = FaceTracker(enabled=True, padding=0.5)
+
+    tracker.box = (0, 0, 40, 48)
+    assert tracker._search_window((HEIGHT, WIDTH)) == (0, 0, 60, 72)
+
+    tracker.box = (WIDTH - 40, HEIGHT - 48, 40, 48)
+    x, y, w, h = tracker._search_window((HEIGHT, WIDTH))
+    assert (x, y) == (WIDTH - 60, HEIGHT - 72)
+    assert (x + w, y + h) == (WIDTH, HEIGHT)
+
+def test_face_at_frame_border_is_tracked():
+    tracker = FaceTracker(enabled=True, redetect_interval=15, min_confidence=0.6, padding=0.5)
+    detector = ScriptedDetector(box=(WIDTH - 40, HEIGHT - 48, 40, 48))
+    tracker.update(_frame(WIDTH - 40, HEIGHT - 48), detector)
+
+    box, mode = tracker.update(_frame(WIDTH - 42, HEIGHT - 50), detector)
+
+    assert mode == "tracked"
+    x, y, w, h = box
+    assert x + w <= WIDTH and y + h <= HEIGHT
+
+def test_disabled_tracking_always_detects():
+    tracker = FaceTracker(enabled=False)
+    detector = ScriptedDetector(box=(140, 100, 40, 48))
+
+    modes = [tracker.update(_frame(140, 100), detector)[1] for _ in range(3)]
+
+    assert modes == ["detect"] * 3
+
+def test_analyze_gray_frame_metrics():
+    detector = ScriptedDetector(box=(140, 96, 40, 48))
+
+    metrics = analyze_gray_frame(_frame(140, 96), FaceTracker(), detector)
+    assert metrics["face_detected"] is True
+    assert metrics["head_position_score"] > 0.9
+    assert metrics["tracking_mode"] == "detect"
+
+    detector.box = None
+    metrics = analyze_gray_frame(_frame(), FaceTracker(), detector)
+    assert metrics["face_detected"] is False
+    assert metrics["head_position_score"] == 0.0
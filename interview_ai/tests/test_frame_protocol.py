@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from backend.frame_protocol import (
+    HEADER_SIZE,
+    MessageType,
+    AudioFormat,
+    FrameFormat,
+    FrameProtocolError,
+    decode_audio,
+    pack_binary_message,
+    parse_binary_message
+)
+
+def test_parse_binary_frame():
+    payload = b"\xff\xd8fake-jpeg\xff\xd9"
+    data = pack_binary_message(MessageType.FRAME, 42, 1700000000123.5, payload)
+
+    message = parse_binary_message(data)
+
+    assert len(data) == HEADER_SIZE + len(payload)
+    assert message.message_type == MessageType.FRAME
+    assert message.sequence == 42
+    assert message.capture_ts == 1700000000123.5
+    assert message.payload.dtype == np.uint8
+    assert message.payload.tobytes() == payload
+
+def test_payload_is_a_view():
+    data = pack_binary_message(MessageType.FRAME, 1, 0.0, b"abc")
+
+    message = parse_binary_message(data)
+
+    # Backed by the original message buffer, not a copy
+    assert not message.payload.flags.owndata
+    assert not message.payload.flags.writeable
+
+def test_short_message_rejected():
+    with pytest.raises(FrameProtocolError):
+        parse_binary_message(b"\x01\x00")
+
+def test_unknown_message_type_rejected():
+    data = pack_binary_message(MessageType.FRAME, 1, 0.0, b"abc")
+    with pytest.raises(FrameProtocolError):
+        parse_binary_message(b"\x7f" + data[1:])
+
+def test_audio_chunk_decodes_to_float_samples():
+    pcm = np.array([0, 16384, -32768, 32767], dtype="<i2")
+    data = pack_binary_message(MessageType.AUDIO, 7, 0.0, pcm.tobytes())
+
+    message = parse_binary_message(data)
+    samples = decode_audio(message.payload)
+
+    assert message.message_type == MessageType.AUDIO
+    assert samples.dtype == np.float32
+    assert np.allclose(samples, [0.0, 0.5, -1.0, 32767 / 32768])
+
+def test_odd_length_audio_rejected():
+    message = parse_binary_message(pack_binary_message(MessageType.AUDIO, 1, 0.0, b"abc"))
+    with pytest.raises(FrameProtocolError):
+        decode_audio(message.payload)
+
+def test_audio_format_accepts_client_sample_rate():
+    audio_format = AudioFormat()
+    audio_format.update({"sample_rate": 48000})
+    assert audio_format.sample_rate == 48000
+
+    with pytest.raises(FrameProtocolError):
+        audio_format.update({"sample_rate": 100})
+    assert audio_format.sample_rate == 48000
+
+def test_frame_format_applies_client_size_but_stays_gray():
+    frame_format = FrameFormat()
+    frame_format.update({"width": 640, "height": 480, "jpeg_quality": 0.8, "color": "rgb"})
+
+    assert frame_format.to_dict() == {"width": 640, "height": 480, "jpeg_quality": 0.8, "color": "gray"}
+
+def test_frame_format_ignores_unusable_values():
+    frame_format = FrameFormat(width=320, height=240, jpeg_quality=0.6)
+    frame_format.update({"width": 0, "height": -1, "jpeg_quality": 2.0})
+    assert (frame_format.width, frame_format.height, frame_format.jpeg_quality) == (320, 240, 0.6)
+
+    with pytest.raises(FrameProtocolError):
+        frame_format.update({"width": "wide"})
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from backend.inference_scheduler import InferenceScheduler
+
+def test_concurrent_jobs_share_a_batch():
+    async def run():
+        scheduler = InferenceScheduler(workers=1, max_batch=8, max_wait_ms=20)
+        scheduler.start()
+        results = await asyncio.gather(*(scheduler.submit(lambda x: x * 2, index) for index in range(5)))
+        await scheduler.stop()
+        return scheduler, results
+
+    scheduler, results = asyncio.run(run())
+
+    assert results == [0, 2, 4, 6, 8]
+    assert scheduler.stats()["batches_completed"] == 1
+    assert scheduler.stats()["mean_batch_size"] == 5
+
+def test_lone_job_is_flushed_after_max_wait():
+    async def run():
+        scheduler = InferenceScheduler(workers=1, max_batch=8, max_wait_ms=10)
+        scheduler.start()
+        started = time.perf_counter()
+        result = await scheduler.submit(lambda: "done")
+        elapsed = time.perf_counter() - started
+        await scheduler.stop()
+        return result, elapsed
+
+    result, elapsed = asyncio.run(run())
+
+    assert result == "done"
+    assert elapsed < 1.0
+
+def test_results_do_not_wait_for_the_rest_of_the_batch():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "slow"
+
+    async def run():
+        scheduler = InferenceScheduler(workers=1, max_batch=8, max_wait_ms=20)
+        scheduler.start()
+        fast = asyncio.ensure_future(scheduler.submit(lambda: "fast"))
+        blocked = asyncio.ensure_future(scheduler.submit(slow))
+        # The fast job resolves while the slow one still holds the worker
+        first = await asyncio.wait_for(fast, 1)
+        release.set()
+        second = await blocked
+        await scheduler.stop()
+        return first, second, scheduler
+
+    first, second, scheduler = asyncio.run(run())
+
+    assert (first, second) == ("fast", "slow")
+    assert scheduler.stats()["batches_completed"] == 1
+
+def test_exceptions_reach_their_own_caller():
+    def fail():
+        raise ValueError("bad frame")
+
+    async def run():
+        scheduler = InferenceScheduler(workers=1, max_batch=8, max_wait_ms=20)
+        scheduler.start()
+        results = await asyncio.gather(
+            scheduler.submit(fail),
+            scheduler.submit(lambda: "ok"),
+            return_exceptions=True
+        )
+        await scheduler.stop()
+        return results
+
+    error, result = asyncio.run(run())
+
+    assert isinstance(error, ValueError)
+    assert result == "ok"
+
+def test_stop_cancels_jobs_not_yet_batched():
+    async def run():
+        scheduler = InferenceScheduler(workers=1, max_batch=8, max_wait_ms=1000)
+        scheduler.start()
+        job = asyncio.ensure_future(scheduler.submit(lambda: "never"))
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+        with pytest.raises(asyncio.CancelledError):
+            await job
+        return scheduler
+
+    scheduler = asyncio.run(run())
+
+    assert not scheduler.started
+    assert scheduler.stats()["jobs_completed"] == 0
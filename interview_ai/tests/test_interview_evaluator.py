@@ -0,0 +1,62 @@
+import asyncio
+import types
+
+from backend import interview_evaluator
+from backend.interview_evaluator import InterviewEvaluator
+
+class FakeAsyncGroq:
+    """
+    Stands in for groq.AsyncGroq, answering after ``delay`` seconds.
+    """
+    delay = 0.05
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.in_flight = 0
+        self.peak = 0
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        message = types.SimpleNamespace(content="[{'question': 'Why?'}]")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+def _evaluator(monkeypatch, **kwargs) -> InterviewEvaluator:
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(interview_evaluator, "groq", types.SimpleNamespace(AsyncGroq=FakeAsyncGroq))
+    return InterviewEvaluator(**kwargs)
+
+def test_calls_share_one_connection_pool(monkeypatch):
+    evaluator = _evaluator(monkeypatch)
+
+    assert evaluator.client.kwargs["http_client"] is evaluator.http_client
+    asyncio.run(evaluator.aclose())
+
+def test_concurrency_is_bounded(monkeypatch):
+    async def run():
+        evaluator = _evaluator(monkeypatch, max_concurrency=2)
+        results = await asyncio.gather(*(evaluator.generate_questions({}) for _ in range(6)))
+        await evaluator.aclose()
+        return evaluator, results
+
+    evaluator, results = asyncio.run(run())
+
+    assert results == [[{"question": "Why?"}]] * 6
+    assert evaluator.client.peak == 2
+
+def test_slow_call_times_out(monkeypatch):
+    monkeypatch.setattr(FakeAsyncGroq, "delay", 1.0)
+
+    async def run():
+        evaluator = _evaluator(monkeypatch, timeout=0.05)
+        questions = await evaluator.generate_questions({})
+        await evaluator.aclose()
+        return questions
+
+    # A timed-out call falls back like any other Groq error
+    assert asyncio.run(run()) == []
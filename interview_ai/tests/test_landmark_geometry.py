@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from backend.landmark_geometry import (
+    NUM_LANDMARKS,
+    landmarks_to_array,
+    eye_contact,
+    head_position,
+    score_landmarks
+)
+
+def _fake_face_landmarks(seed: int, count: int = 478):
+    rng = np.random.default_rng(seed)
+    points = [
+        SimpleNamespace(x=float(x), y=float(y), z=float(z))
+        for x, y, z in rng.random((count, 3))
+    ]
+    return SimpleNamespace(landmark=points)
+
+def _reference_eye_openness(eye_landmarks) -> float:
+    # Per-landmark formula the vectorized version replaces
+    eye_height = abs(eye_landmarks[1].y - eye_landmarks[4].y)
+    eye_width = abs(eye_landmarks[3].x - eye_landmarks[0].x)
+    aspect_ratio = eye_height / eye_width if eye_width > 0 else 0
+    return min(max((aspect_ratio - 0.2) / 0.2, 0.0), 1.0)
+
+def test_landmarks_to_array_shape():
+    face_landmarks = _fake_face_landmarks(0)
+
+    landmarks = landmarks_to_array(face_landmarks)
+
+    assert landmarks.shape == (NUM_LANDMARKS, 3)
+    assert landmarks.dtype == np.float32
+    assert landmarks[5, 1] == pytest.approx(face_landmarks.landmark[5].y)
+
+def test_matches_per_landmark_formulas():
+    faces = [_fake_face_landmarks(seed) for seed in range(8)]
+    stack = np.stack([landmarks_to_array(face) for face in faces])
+
+    contact = eye_contact(stack)
+    position = head_position(stack)
+
+    for i, face in enumerate(faces):
+        left = _reference_eye_openness(face.landmark[33:46])
+        right = _reference_eye_openness(face.landmark[246:259])
+        nose_tip = face.landmark[4]
+        expected_position = 1.0 - (abs(nose_tip.x - 0.5) + abs(nose_tip.y - 0.5)) / 2
+
+        assert contact[i] == pytest.approx(min(max((left + right) / 2, 0.0), 1.0), abs=1e-5)
+        assert position[i] == pytest.approx(expected_position, abs=1e-5)
+
+def test_score_landmarks_is_per_frame():
+    stack = np.random.default_rng(1).random((5, NUM_LANDMARKS, 3)).astype(np.float32)
+
+    scores = score_landmarks(stack)
+
+    assert set(scores) == {"eye_contact", "head_position", "head_yaw", "head_pitch"}
+    assert all(values.shape == (5,) for values in scores.values())
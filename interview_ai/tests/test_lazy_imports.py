@@ -0,0 +1,21 @@
+import sys
+
+from backend.import_budget import HEAVY_MODULES, measure_import
+from backend.lazy_imports import import_timings, lazy_import
+
+def test_lazy_module_imports_on_first_use():
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy_import("colorsys")
+
+    assert "colorsys" not in sys.modules
+
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+    assert "colorsys" in import_timings
+
+def test_backend_import_defers_heavy_modules():
+    for module in ("backend", "backend.face_tracking", "backend.frame_protocol"):
+        result = measure_import(module)
+
+        assert "error" not in result
+        assert result["loaded"] == []
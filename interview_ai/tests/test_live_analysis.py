@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from backend import live_analysis
+from backend.frame_protocol import BinaryMessage, FrameFormat, MessageType
+from backend.live_analysis import LatestFrameSlot, LiveVideoPipeline
+
+class FakeWebSocket:
+    def __init__(self, fail_after=None, block=False):
+        self.sent = []
+        self.fail_after = fail_after
+        self.block = block
+
+    async def send_json(self, message):
+        if self.block:
+            await asyncio.Event().wait()
+        if self.fail_after is not None and len(self.sent) >= self.fail_after:
+            raise RuntimeError("socket closed")
+        self.sent.append(message)
+
+def _frame(sequence: int) -> BinaryMessage:
+    return BinaryMessage(MessageType.FRAME, sequence, 0.0, b"")
+
+async def _no_analysis(frame):
+    return {}
+
+def _pipeline(websocket) -> LiveVideoPipeline:
+    return LiveVideoPipeline("test", websocket, _no_analysis, FrameFormat())
+
+def test_latest_frame_slot_keeps_newest():
+    async def run():
+        slot = LatestFrameSlot()
+        for sequence in range(3):
+            slot.put(_frame(sequence))
+        frame = await slot.get()
+        return slot, frame
+
+    slot, frame = asyncio.run(run())
+
+    assert frame.sequence == 2
+    assert slot.received == 3
+    assert slot.dropped == 2
+    assert slot.pending == 0
+
+def test_messages_are_sent_in_order():
+    async def run():
+        websocket = FakeWebSocket()
+        pipeline = _pipeline(websocket)
+        pipeline.start()
+        for index in range(3):
+            await pipeline.send({"index": index})
+        await asyncio.sleep(0.01)
+        await pipeline.stop()
+        return websocket
+
+    websocket = asyncio.run(run())
+
+    assert [message["index"] for message in websocket.sent] == [0, 1, 2]
+
+def test_metrics_are_dropped_when_queue_is_full():
+    async def run():
+        pipeline = _pipeline(FakeWebSocket())
+        # Send stage not started, so nothing drains the queue
+        for _ in range(pipeline.outbound.maxsize + 2):
+            pipeline._send_metrics({"type": "metrics"})
+        return pipeline
+
+    pipeline = asyncio.run(run())
+
+    assert pipeline.outbound.full()
+    assert pipeline.dropped_messages == 2
+
+def test_send_fails_fast_after_send_loop_stops():
+    async def run():
+        pipeline = _pipeline(FakeWebSocket(fail_after=1))
+        # Fill the queue so the next send would block
+        for index in range(pipeline.outbound.maxsize):
+            pipeline.outbound.put_nowait({"index": index})
+        blocked = asyncio.ensure_future(pipeline.send({"index": "blocked"}))
+        await asyncio.sleep(0)
+        pipeline.start()
+        await asyncio.wait_for(blocked, 1)
+
+        with pytest.raises(ConnectionError):
+            await pipeline.send({"index": "late"})
+        await pipeline.stop()
+        return pipeline
+
+    pipeline = asyncio.run(run())
+
+    assert pipeline.closed
+
+def test_send_times_out_when_client_stops_reading(monkeypatch):
+    monkeypatch.setattr(live_analysis, "LIVE_SEND_TIMEOUT", 0.05)
+
+    async def run():
+        pipeline = _pipeline(FakeWebSocket(block=True))
+        pipeline.start()
+        with pytest.raises(ConnectionError):
+            for index in range(pipeline.outbound.maxsize + 2):
+                await pipeline.send({"index": index})
+        await pipeline.stop()
+
+    asyncio.run(run())
+
+def test_capability_negotiation():
+    async def run():
+        websocket = FakeWebSocket()
+        pipeline = _pipeline(websocket)
+        pipeline.start()
+        await pipeline.advertise_format()
+        pipeline.accept_format({"width": 640, "height": 480, "color": "rgb", "audio": {"sample_rate": 48000}})
+        await asyncio.sleep(0.01)
+        await pipeline.stop()
+        return websocket, pipeline
+
+    websocket, pipeline = asyncio.run(run())
+
+    capabilities = websocket.sent[0]
+    assert capabilities["type"] == "capabilities"
+    assert capabilities["data"]["color"] == "gray"
+    assert capabilities["data"]["audio"]["encoding"] == "pcm_s16le"
+    # Size and sample rate follow the client; the colour mode does not
+    assert pipeline.frame_format.to_dict()["color"] == "gray"
+    assert (pipeline.frame_format.width, pipeline.frame_format.height) == (640, 480)
+    assert pipeline.audio_format.sample_rate == 48000
+    assert pipeline.pacing.min_level == 0
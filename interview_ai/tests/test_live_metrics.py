@@ -0,0 +1,35 @@
+import pytest
+from backend.live_metrics import LiveMetricsAggregator
+
+def test_empty_snapshot():
+    snapshot = LiveMetricsAggregator(window=4).snapshot()
+
+    assert snapshot["frames"] == 0
+    assert snapshot["eye_contact"]["window_rate"] == 0.0
+    assert snapshot["eye_contact"]["overall_rate"] == 0.0
+
+def test_window_only_keeps_recent_frames():
+    aggregator = LiveMetricsAggregator(window=4, alpha=0.5)
+    for _ in range(4):
+        aggregator.add(1.0, 1.0, 1.0)
+    for _ in range(4):
+        aggregator.add(0.0, 0.0, 0.5)
+
+    snapshot = aggregator.snapshot()
+
+    assert snapshot["frames"] == 8
+    assert snapshot["window_frames"] == 4
+    assert snapshot["face_presence"]["window_rate"] == pytest.approx(0.0)
+    assert snapshot["face_presence"]["overall_rate"] == pytest.approx(0.5)
+    assert snapshot["head_position"]["window_rate"] == pytest.approx(0.5)
+    assert snapshot["eye_contact"]["ewma"] == pytest.approx(1.0 / 16)
+
+def test_add_frame_from_live_metrics():
+    aggregator = LiveMetricsAggregator(window=10)
+    aggregator.add_frame({"face_detected": True, "eye_contact": False, "head_position_score": 0.9})
+
+    snapshot = aggregator.snapshot()
+
+    assert snapshot["face_presence"]["overall_rate"] == 1.0
+    assert snapshot["eye_contact"]["overall_rate"] == 0.0
+    assert snapshot["head_position"]["overall_rate"] == pytest.approx(0.9)
@@ -0,0 +1,84 @@
+from backend.metrics_publisher import MetricsPublisher
+
+SNAPSHOT = {
+    "face_detected": True,
+    "eye_contact": 0.81234,
+    "confidence_score": 0.7,
+    "sequence": 10,
+    "capture_ts": 1000.0,
+    "dropped_frames": 0,
+}
+
+def _publisher() -> MetricsPublisher:
+    return MetricsPublisher(rate_hz=4, threshold=0.02)
+
+def test_first_flush_is_full_snapshot():
+    publisher = _publisher()
+    publisher.update(SNAPSHOT)
+
+    assert publisher.flush() == {**SNAPSHOT, "eye_contact": 0.812}
+    assert publisher.pushes == 1
+    assert publisher.interval == 0.25
+
+def test_flush_sends_only_changed_keys():
+    publisher = _publisher()
+    publisher.update(SNAPSHOT)
+    publisher.flush()
+
+    publisher.update({**SNAPSHOT, "eye_contact": 0.5, "sequence": 11, "capture_ts": 1000.1})
+    delta = publisher.flush()
+
+    # Passive keys ride along for context
+    assert delta == {"eye_contact": 0.5, "sequence": 11, "capture_ts": 1000.1, "dropped_frames": 0}
+
+def test_no_change_publishes_nothing():
+    publisher = _publisher()
+    assert publisher.flush() is None
+
+    publisher.update(SNAPSHOT)
+    publisher.flush()
+
+    # Only passive keys and sub-threshold jitter moved
+    publisher.update({**SNAPSHOT, "eye_contact": 0.82, "sequence": 12, "dropped_frames": 3})
+    assert publisher.flush() is None
+    assert publisher.pushes == 1
+    assert publisher.updates == 2
+
+def test_slow_drift_is_measured_from_last_push():
+    publisher = _publisher()
+    publisher.update({"eye_contact": 0.5})
+    publisher.flush()
+
+    publisher.update({"eye_contact": 0.515})
+    assert publisher.flush() is None
+
+    publisher.update({"eye_contact": 0.53})
+    assert publisher.flush() == {"eye_contact": 0.53}
+
+def test_non_numeric_changes_are_always_sent():
+    publisher = _publisher()
+    publisher.update(SNAPSHOT)
+    publisher.flush()
+
+    publisher.update({"face_detected": False})
+    assert publisher.flush() == {"face_detected": False}
+
+def test_merged_deltas_track_latest_metrics():
+    publisher = _publisher()
+    client_view = {}
+    frames = [
+        SNAPSHOT,
+        {**SNAPSHOT, "confidence_score": 0.4, "sequence": 11},
+        {**SNAPSHOT, "confidence_score": 0.41, "sequence": 12},
+        {**SNAPSHOT, "face_detected": False, "confidence_score": 0.1, "sequence": 13},
+    ]
+    for metrics in frames:
+        publisher.update(metrics)
+        delta = publisher.flush()
+        if delta is not None:
+            client_view.update(delta)
+
+    assert client_view["face_detected"] is False
+    assert client_view["confidence_score"] == 0.1
+    assert client_view["sequence"] == 13
+    assert client_view["eye_contact"] == 0.812
@@ -0,0 +1,37 @@
+import numpy as np
+from backend.motion_gate import MotionGate
+
+def _frame(value: int) -> np.ndarray:
+    return np.full((240, 320), value, dtype=np.uint8)
+
+def test_static_frames_are_skipped():
+    gate = MotionGate(threshold=2.0, max_carry=100, enabled=True)
+
+    assert gate.changed(_frame(100))
+    assert not gate.changed(_frame(101))
+    assert not gate.changed(_frame(100))
+    assert gate.changed(_frame(140))
+
+    assert gate.skipped == 2
+    assert gate.skip_ratio == 0.5
+
+def test_compares_against_last_analyzed_frame():
+    gate = MotionGate(threshold=2.0, max_carry=100, enabled=True)
+    gate.changed(_frame(100))
+
+    # Each step is below the threshold, but the drift from the reference is not
+    assert not gate.changed(_frame(101))
+    assert gate.changed(_frame(103))
+
+def test_max_carry_forces_analysis():
+    gate = MotionGate(threshold=2.0, max_carry=2, enabled=True)
+
+    results = [gate.changed(_frame(100)) for _ in range(6)]
+
+    assert results == [True, False, False, True, False, False]
+
+def test_disabled_gate_analyzes_everything():
+    gate = MotionGate(enabled=False)
+
+    assert all(gate.changed(_frame(100)) for _ in range(3))
+    assert gate.stats() == {"checked_frames": 3, "skipped_frames": 0, "skip_ratio": 0.0}
@@ -0,0 +1,62 @@
+import numpy as np
+from backend.online_voice import OnlineVoiceAnalyzer
+
+SAMPLE_RATE = 16000
+
+def _syllables(count=15, pitch=200.0, on=0.15, off=0.25, seed=0):
+    # Harmonic bursts separated by silence, one onset per burst
+    t = np.arange(int(on * SAMPLE_RATE)) / SAMPLE_RATE
+    burst = 0.3 * (np.sin(2 * np.pi * pitch * t) + 0.5 * np.sin(4 * np.pi * pitch * t))
+    period = np.concatenate([burst, np.zeros(int(off * SAMPLE_RATE))])
+    noise = np.random.default_rng(seed).normal(0, 0.001, count * period.size)
+    return (np.tile(period, count) + noise).astype(np.float32)
+
+def test_answer_metrics_from_streamed_chunks():
+    analyzer = OnlineVoiceAnalyzer(sample_rate=SAMPLE_RATE, frame_ms=32)
+    audio = _syllables()
+    for start in range(0, audio.size, 4096):
+        analyzer.add(audio[start:start + 4096])
+
+    metrics = analyzer.finish_answer()
+
+    # One onset every 0.4 s is 150 words per minute
+    assert abs(metrics["speech_rate"] - 0.5) < 0.1
+    # 200 Hz sits in the middle of the 100-300 Hz pitch scale
+    assert abs(metrics["pitch"] - 0.5) < 0.05
+    assert metrics["fluency"] > 0.8
+    assert metrics["volume"] > 0.9
+    assert 0.3 < metrics["voice_activity"] < 0.5
+
+def test_chunking_does_not_change_results():
+    audio = _syllables(count=5)
+    whole = OnlineVoiceAnalyzer(sample_rate=SAMPLE_RATE)
+    whole.add(audio)
+    chunked = OnlineVoiceAnalyzer(sample_rate=SAMPLE_RATE)
+    for start in range(0, audio.size, 1000):
+        chunked.add(audio[start:start + 1000])
+
+    assert whole.frames == chunked.frames
+    assert whole.snapshot() == chunked.snapshot()
+    assert whole.finish_answer() == chunked.finish_answer()
+
+def test_live_window_is_bounded():
+    analyzer = OnlineVoiceAnalyzer(sample_rate=SAMPLE_RATE, window_seconds=1)
+    analyzer.add(_syllables(count=5))
+    analyzer.add(np.zeros(2 * SAMPLE_RATE, dtype=np.float32))
+
+    snapshot = analyzer.snapshot()
+
+    # Only the trailing second of silence is in the window
+    assert snapshot["voice_activity"] == 0.0
+    assert snapshot["voice_volume"] < 0.01
+
+def test_finish_answer_starts_a_new_answer():
+    analyzer = OnlineVoiceAnalyzer(sample_rate=SAMPLE_RATE)
+    analyzer.add(_syllables(count=5))
+    first = analyzer.finish_answer()
+
+    second = analyzer.finish_answer()
+
+    assert first["duration_seconds"] > 1.5
+    assert second["duration_seconds"] == 0
+    assert second["speech_rate"] == 0.5
@@ -0,0 +1,80 @@
+from backend.pacing import RESOLUTION_LADDER, PacingController
+
+def _controller(**kwargs) -> PacingController:
+    options = dict(workers=1, max_fps=15.0, min_fps=2.0, target_utilization=1.0, interval_seconds=1.0, smoothing=1.0)
+    options.update(kwargs)
+    return PacingController(**options)
+
+def _update(pacing, latency, sessions, now):
+    pacing.record(latency, dropped=False)
+    return pacing.update(sessions, now=now)
+
+def test_light_load_keeps_full_resolution():
+    pacing = _controller()
+
+    target = _update(pacing, 0.01, 1, now=10.0)
+
+    assert (target["width"], target["height"]) == RESOLUTION_LADDER[0]
+    assert target["fps"] == 15.0
+
+def test_steps_resolution_down_under_load():
+    pacing = _controller()
+    _update(pacing, 0.01, 1, now=10.0)
+
+    # 5 frames/s shared by 4 sessions is below min_fps at 640x480
+    target = _update(pacing, 0.2, 4, now=20.0)
+
+    assert (target["width"], target["height"]) == RESOLUTION_LADDER[1]
+    assert target["fps"] >= 2.0
+
+def test_clamps_at_smallest_resolution_and_min_fps():
+    pacing = _controller()
+
+    target = _update(pacing, 2.0, 10, now=10.0)
+
+    assert (target["width"], target["height"]) == RESOLUTION_LADDER[-1]
+    assert target["fps"] == 2.0
+
+def test_recovers_once_load_drops():
+    pacing = _controller()
+    _update(pacing, 2.0, 10, now=10.0)
+
+    # Fast analysis at the smallest size scales up to the largest size
+    target = _update(pacing, 0.01, 1, now=20.0)
+
+    assert (target["width"], target["height"]) == RESOLUTION_LADDER[0]
+
+def test_never_exceeds_negotiated_resolution():
+    pacing = _controller(max_resolution=(320, 240))
+
+    target = _update(pacing, 0.001, 1, now=10.0)
+
+    assert (target["width"], target["height"]) == (320, 240)
+    assert target["fps"] == 15.0
+
+def test_updates_are_rate_limited_and_deduplicated():
+    pacing = _controller()
+
+    assert pacing.update(1, now=10.0) is None  # no latency measured yet
+    assert _update(pacing, 0.01, 1, now=10.0) is not None
+    # Within the interval
+    assert _update(pacing, 2.0, 10, now=10.5) is None
+    # Same target as last published
+    assert _update(pacing, 0.01, 1, now=12.0) is None
+
+def test_small_fps_changes_are_not_republished():
+    pacing = _controller(max_fps=100.0)
+    _update(pacing, 0.1, 1, now=10.0)
+
+    # 10 fps -> 10.5 fps at the same resolution
+    assert _update(pacing, 0.095, 1, now=12.0) is None
+    assert _update(pacing, 0.05, 1, now=14.0)["fps"] == 20.0
+
+def test_dropped_frames_back_off_further():
+    calm = _controller(max_fps=100.0)
+    dropping = _controller(max_fps=100.0)
+    for _ in range(20):
+        dropping.record(0.1, dropped=True)
+
+    assert _update(calm, 0.1, 1, now=10.0)["fps"] == 10.0
+    assert dropping.update(1, now=10.0)["fps"] < 10.0
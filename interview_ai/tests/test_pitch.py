@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from backend import pitch
+from backend.pitch import (
+    PITCH_ESTIMATORS,
+    benchmark_estimators,
+    pitch_statistics,
+    pitch_track,
+    synthetic_voice,
+    validate_estimator
+)
+
+SAMPLE_RATE = 16000
+
+def _tone(frequency: float, seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    # A fundamental with weaker harmonics, like a voiced vowel
+    phase = 2 * np.pi * frequency * t
+    return (0.3 * (np.sin(phase) + 0.6 * np.sin(2 * phase) + 0.3 * np.sin(3 * phase))).astype(np.float32)
+
+@pytest.mark.parametrize("method", ["yin", "autocorrelation"])
+@pytest.mark.parametrize("frequency", [90.0, 150.0, 220.0, 330.0])
+def test_tone_pitch(method, frequency):
+    stats = pitch_statistics(_tone(frequency), SAMPLE_RATE, method)
+
+    assert abs(stats["mean_pitch"] - frequency) < frequency * 0.02
+    assert stats["pitch_variation"] < 2.0
+
+@pytest.mark.parametrize("method", ["yin", "autocorrelation"])
+@pytest.mark.parametrize("frequency", [70.0, 80.0, 100.0])
+def test_low_pitch_is_not_biased_high(method, frequency):
+    # The analysis window's taper must not pull low voices towards shorter periods
+    stats = pitch_statistics(_tone(frequency), SAMPLE_RATE, method)
+
+    assert abs(stats["mean_pitch"] - frequency) < frequency * 0.005
+    assert stats["pitch_variation"] < 1.0
+
+@pytest.mark.parametrize("method", ["yin", "autocorrelation"])
+def test_silence_is_unvoiced(method):
+    pitches, voiced = pitch_track(np.zeros(SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE, method)
+
+    assert not voiced.any()
+    assert pitch_statistics(np.zeros(SAMPLE_RATE), SAMPLE_RATE, method) == {"mean_pitch": 0.0, "pitch_variation": 0.0}
+
+@pytest.mark.parametrize("method", ["yin", "autocorrelation"])
+def test_blocks_match_a_single_pass(method, monkeypatch):
+    y, _ = synthetic_voice(SAMPLE_RATE, seconds=3.0)
+    expected = pitch_track(y, SAMPLE_RATE, method)
+
+    monkeypatch.setattr(pitch, "BLOCK_FRAMES", 7)
+    blocked = pitch_track(y, SAMPLE_RATE, method)
+
+    np.testing.assert_allclose(blocked[0], expected[0])
+    np.testing.assert_array_equal(blocked[1], expected[1])
+
+def test_unknown_estimator_rejected():
+    with pytest.raises(ValueError):
+        pitch_track(_tone(150.0), SAMPLE_RATE, "crepe")
+
+@pytest.mark.parametrize("method", PITCH_ESTIMATORS)
+def test_known_estimators_validate(method):
+    assert validate_estimator(method) == method
+
+def test_misconfigured_estimator_fails_validation():
+    with pytest.raises(ValueError, match="choose from"):
+        validate_estimator("yim")
+
+def test_benchmark_reports_accuracy():
+    results = benchmark_estimators(("yin", "autocorrelation"), sample_rate=SAMPLE_RATE, seconds=4.0, repeats=1)
+
+    for result in results.values():
+        assert abs(result["mean_error"]) < 5.0
+        assert result["median_frame_error"] < 5.0
+        assert result["voicing_accuracy"] > 0.9
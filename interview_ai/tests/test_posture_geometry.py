@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from backend.posture_geometry import (
+    NUM_POSE_LANDMARKS,
+    LEFT_SHOULDER,
+    RIGHT_SHOULDER,
+    NOSE,
+    LEFT_EAR,
+    RIGHT_EAR,
+    pose_landmarks_to_array,
+    posture_scores
+)
+
+def _pose(neck: float, tilt: float = 0.0, nose_shift: float = 0.0, visibility: float = 1.0) -> np.ndarray:
+    pose = np.zeros((NUM_POSE_LANDMARKS, 4), dtype=np.float32)
+    pose[:, 3] = visibility
+    # Shoulders 0.3 apart, ears ``neck`` shoulder widths above them
+    pose[LEFT_SHOULDER, :2] = (0.65, 0.7 + tilt)
+    pose[RIGHT_SHOULDER, :2] = (0.35, 0.7 - tilt)
+    pose[LEFT_EAR, :2] = (0.58, 0.7 - neck * 0.3)
+    pose[RIGHT_EAR, :2] = (0.42, 0.7 - neck * 0.3)
+    pose[NOSE, :2] = (0.5 + nose_shift, 0.7 - neck * 0.3)
+    return pose
+
+def test_pose_landmarks_to_array():
+    points = [SimpleNamespace(x=i, y=i + 1, z=0.0, visibility=0.9) for i in range(NUM_POSE_LANDMARKS)]
+
+    pose = pose_landmarks_to_array(SimpleNamespace(landmark=points))
+
+    assert pose.shape == (NUM_POSE_LANDMARKS, 4)
+    assert pose[3, 1] == 4
+    assert pose[3, 3] == pytest.approx(0.9)
+
+def test_upright_beats_slouched_tilted_and_leaning():
+    stack = np.stack([
+        _pose(neck=0.6),
+        _pose(neck=0.1),
+        _pose(neck=0.6, tilt=0.05),
+        _pose(neck=0.6, nose_shift=0.12)
+    ])
+
+    scores = posture_scores(stack)
+
+    assert scores["posture_score"][0] == pytest.approx(1.0)
+    assert scores["upright"][1] == 0.0
+    assert scores["shoulder_level"][2] < 1.0
+    assert scores["head_centered"][3] < 1.0
+    assert np.all(scores["posture_score"][1:] < scores["posture_score"][0])
+
+def test_hidden_shoulders_are_not_valid():
+    scores = posture_scores(np.stack([_pose(0.6), _pose(0.6, visibility=0.1)]))
+
+    assert scores["valid"].tolist() == [True, False]
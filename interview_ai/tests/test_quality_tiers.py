@@ -0,0 +1,52 @@
+from backend.quality_tiers import MIN_SAMPLES, VISION_TIERS, QualityGovernor
+
+def _governor(**kwargs):
+    options = dict(max_queue_depth=4, max_p95_ms=10.0, recover_ratio=0.5, min_dwell_seconds=5.0, enabled=True)
+    options.update(kwargs)
+    return QualityGovernor("test", VISION_TIERS, **options)
+
+def _record(governor, cost_ms, count=MIN_SAMPLES):
+    governor._costs.extend([cost_ms] * count)
+
+def test_degrades_one_tier_per_dwell_period():
+    governor = _governor()
+
+    assert governor.update(queue_depth=8, now=10.0) == "mesh"
+    # Still overloaded, but the tier is held for the dwell time
+    assert governor.update(queue_depth=8, now=12.0) == "mesh"
+    assert governor.update(queue_depth=8, now=15.0) == "haar"
+
+def test_degrades_on_p95_latency():
+    governor = _governor()
+    _record(governor, 20.0)
+
+    assert governor.update(queue_depth=1, now=10.0) == "mesh"
+
+def test_recovers_only_below_hysteresis_band():
+    governor = _governor()
+    governor.update(queue_depth=8, now=10.0)
+
+    # Below the limits but above recover_ratio of them: hold
+    _record(governor, 8.0)
+    assert governor.update(queue_depth=1, now=20.0) == "mesh"
+
+    governor._costs.clear()
+    _record(governor, 2.0)
+    assert governor.update(queue_depth=1, now=30.0) == "mesh_refined"
+    assert governor.switches == 2
+
+def test_job_records_cost_per_unit():
+    governor = _governor()
+
+    for _ in range(MIN_SAMPLES):
+        with governor.job() as job:
+            job.units = 100
+
+    assert governor.in_flight == 0
+    assert governor.p95() < 10.0
+    assert governor.stats()["tier"] == "mesh_refined"
+
+def test_disabled_governor_keeps_best_tier():
+    governor = _governor(enabled=False)
+
+    assert governor.update(queue_depth=100, now=10.0) == "mesh_refined"
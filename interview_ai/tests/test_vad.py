@@ -0,0 +1,55 @@
+import numpy as np
+from backend.vad import detect_speech, frame_features
+
+SAMPLE_RATE = 16000
+
+def _tone(seconds: float, frequency: float = 150.0) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return 0.2 * np.sin(2 * np.pi * frequency * t)
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE))
+
+def _answer(*parts) -> np.ndarray:
+    y = np.concatenate(parts)
+    return (y + np.random.default_rng(0).normal(0, 0.002, y.size)).astype(np.float32)
+
+def test_speech_segments_and_pauses():
+    # Think for 2 s, speak with a short stop, pause for 1 s, speak, trail off
+    y = _answer(_silence(2), _tone(1.5), _silence(0.1), _tone(1), _silence(1), _tone(2), _silence(3))
+
+    activity = detect_speech(y, SAMPLE_RATE)
+    metrics = activity.metrics()
+
+    # The 0.1 s stop is bridged; only the 1 s gap is a pause
+    assert len(activity.segments) == 2
+    assert metrics["pause_count"] == 1
+    assert abs(metrics["longest_pause"] - 1.0) < 0.1
+    assert abs(metrics["initial_silence"] - 2.0) < 0.1
+    assert abs(metrics["speaking_time"] - 4.6) < 0.15
+    assert abs(metrics["total_time"] - 10.6) < 0.01
+
+def test_speech_audio_drops_silence():
+    y = _answer(_silence(3), _tone(1), _silence(3))
+
+    speech = detect_speech(y, SAMPLE_RATE).speech_audio(y, padding_ms=50)
+
+    assert abs(speech.size / SAMPLE_RATE - 1.1) < 0.1
+    assert np.sqrt(np.mean(speech ** 2)) > 0.1
+
+def test_hiss_and_clicks_are_not_speech():
+    hiss = np.random.default_rng(1).normal(0, 0.01, 2 * SAMPLE_RATE)
+    y = _answer(_silence(1), hiss, _silence(1), _tone(0.05), _silence(1))
+
+    activity = detect_speech(y, SAMPLE_RATE)
+
+    assert len(activity.segments) == 0
+    assert activity.metrics()["speaking_time"] == 0.0
+    assert activity.speech_audio(y).size == 0
+
+def test_frame_features():
+    rms, zcr = frame_features(_tone(1.0, frequency=100.0).astype(np.float32), 1600)
+
+    np.testing.assert_allclose(rms, 0.2 / np.sqrt(2), rtol=1e-3)
+    # A 100 Hz tone crosses zero 200 times a second
+    np.testing.assert_allclose(zcr * SAMPLE_RATE, 200, rtol=0.05)
@@ -0,0 +1,63 @@
+import time
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+from backend.vision_workers import VisionWorkerPool
+
+@pytest.fixture
+def pool():
+    # One worker with a single slot, so every frame reuses it; liveness
+    # checks are driven by hand
+    pool = VisionWorkerPool(processes=1, slots=1, slot_bytes=64 * 64, slot_timeout=5.0, liveness_interval=60.0)
+    pool.start()
+    yield pool
+    pool.stop()
+
+def _frame() -> np.ndarray:
+    return np.full((48, 64), 128, dtype=np.uint8)
+
+def test_dispatch_delivers_result(pool):
+    metrics = pool.dispatch("session", _frame()).result(timeout=30)
+
+    assert metrics["face_detected"] is False
+    assert metrics["tracking_mode"] == "detect"
+    assert pool.stats()["in_flight"] == 0
+
+def test_single_slot_is_reused(pool):
+    for _ in range(3):
+        assert pool.dispatch("session", _frame()).result(timeout=30)["face_detected"] is False
+
+    assert pool.stats()["free_slots"] == [1]
+
+def test_oversized_frame_is_downscaled(pool):
+    big = np.full((480, 640), 128, dtype=np.uint8)
+
+    assert pool.dispatch("session", big).result(timeout=30)["face_detected"] is False
+
+def test_worker_crash_fails_futures_and_frees_slots(pool):
+    pool.dispatch("session", _frame()).result(timeout=30)
+    worker = pool._workers[0]
+
+    # A frame in flight when the worker dies
+    future = Future()
+    pool._futures[-1] = (future, worker.index, worker.free_slots.get())
+    worker.process.kill()
+
+    with pytest.raises(RuntimeError, match="exited"):
+        future.result(timeout=10)
+    assert pool.stats()["restarts"] == 1
+    assert pool.stats()["free_slots"] == [1]
+
+    # The replacement worker serves the same ring
+    assert pool.dispatch("session", _frame()).result(timeout=30)["face_detected"] is False
+
+def test_result_after_caller_gave_up_frees_slot(pool):
+    future = pool.dispatch("session", _frame())
+    future.cancel()
+
+    deadline = time.time() + 30
+    while pool.stats()["in_flight"] and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert pool.stats()["free_slots"] == [1]
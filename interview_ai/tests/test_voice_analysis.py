@@ -0,0 +1,50 @@
+import shutil
+import wave
+
+import numpy as np
+import pytest
+
+if shutil.which("ffmpeg") is None:
+    pytest.skip("ffmpeg is not installed", allow_module_level=True)
+pytest.importorskip("librosa")
+pytest.importorskip("speech_recognition")
+
+from backend import voice_analysis
+from backend.voice_analysis import VoiceAnalyzer
+
+def _write_wav(path, seconds: float = 2.0, sample_rate: int = 44100):
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    samples = (0.3 * np.sin(2 * np.pi * 180 * t) * (np.sin(2 * np.pi * 3 * t) > 0) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+
+def test_audio_is_decoded_once_in_memory(tmp_path, monkeypatch):
+    clip = tmp_path / "answer.wav"
+    _write_wav(clip)
+    calls = []
+    decode_audio = voice_analysis.decode_audio
+    monkeypatch.setattr(
+        voice_analysis,
+        "decode_audio",
+        lambda *args, **kwargs: calls.append(1) or decode_audio(*args, **kwargs)
+    )
+
+    result = VoiceAnalyzer().analyze_voice(str(clip))
+
+    assert len(calls) == 1
+    # No temporary WAV left next to (or instead of) the upload
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["answer.wav"]
+    assert result["pitch_analysis"]["mean_pitch"] > 0
+
+def test_load_audio_returns_float_samples(tmp_path):
+    clip = tmp_path / "answer.wav"
+    _write_wav(clip, seconds=1.0)
+
+    y = VoiceAnalyzer().load_audio(str(clip))
+
+    assert y.dtype == np.float32
+    assert abs(len(y) - VoiceAnalyzer.sample_rate) <= 1
+    assert np.abs(y).max() <= 1.0
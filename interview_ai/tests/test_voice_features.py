@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+librosa = pytest.importorskip("librosa")
+
+from backend import voice_analyzer
+from backend.voice_analyzer import SpectralFeatures
+
+SAMPLE_RATE = 16000
+
+def _signal(seconds: float = 2.0) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    # 180 Hz tone pulsed four times a second
+    return (np.sin(2 * np.pi * 180 * t) * (np.sin(2 * np.pi * 4 * t) > 0)).astype(np.float32)
+
+def test_features_match_direct_librosa_calls():
+    y = _signal()
+    features = SpectralFeatures(y, SAMPLE_RATE, n_fft=2048, hop_length=512)
+
+    np.testing.assert_allclose(features.rms, librosa.feature.rms(y=y)[0], rtol=1e-3, atol=1e-5)
+    np.testing.assert_allclose(
+        features.onset_envelope,
+        librosa.onset.onset_strength(y=y, sr=SAMPLE_RATE),
+        rtol=1e-3,
+        atol=1e-3
+    )
+    pitches, magnitudes = features.pitch_track
+    assert pitches.shape == magnitudes.shape == features.magnitude.shape
+
+def test_stft_is_computed_once(monkeypatch):
+    y = _signal()
+    features = SpectralFeatures(y, SAMPLE_RATE, n_fft=2048, hop_length=512)
+    calls = []
+    stft = librosa.stft
+    # Patch the module object voice_analyzer resolves librosa through
+    monkeypatch.setattr(voice_analyzer.librosa, "stft", lambda *args, **kwargs: calls.append(1) or stft(*args, **kwargs))
+
+    features.rms, features.onset_frames, features.pitch_track
+
+    assert len(calls) == 1